@@ -44,6 +44,14 @@ for file in files:
     except Exception as e:
         print(f"[comfyui-neuralsins] Failed to load {file}: {e}")
 
+# Pre-connect to the API hosts and import heavy modules in the background
+try:
+    from .py import _warmup
+
+    _warmup.start()
+except Exception as e:
+    print(f"[comfyui-neuralsins] Warm-up not started: {e}")
+
 WEB_DIRECTORY = "./web"
 
 __all__ = ["NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS", "WEB_DIRECTORY"]
@@ -0,0 +1,260 @@
+# ABOUTME: Offline load test of the WaveSpeed node hot path (submit, poll, download, decode, tensor assembly).
+# ABOUTME: Runs real node execute() calls against bench/mock_wavespeed.py and reports throughput, latency and RSS.
+
+"""
+WaveSpeed client benchmark
+
+    python bench/bench_wavespeed.py --requests 40 --concurrency 8 --latency 2
+    python bench/bench_wavespeed.py --scenario sync-base64 --image-size 2048x2048 --json out.json
+
+Starts the mock server in a child process (or uses --url), points the
+extension at it through a temporary config.ini, and calls the nodes'
+execute() methods from --concurrency threads, the way several queued
+workflows would. Every call gets a unique prompt, so the result cache and
+task journal never short-circuit a request.
+
+Reported per scenario: calls/s and images/s, p50/p99 latency, client
+overhead (latency minus the mock's generation time), peak RSS of this
+process (the server runs separately) and where the time went, from the
+extension's own telemetry log.
+
+--set SECTION.key=value overrides a config.ini setting for the run, e.g.
+--set RateLimit.wavespeed_rps=50 or --set Images.prefetch=false.
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import resource
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+PACKAGE = "neuralsins_bench"
+
+sys.path.insert(0, BENCH_DIR)
+import mock_wavespeed  # noqa: E402
+
+# name -> (module under py/, node class, execute() inputs besides client and prompt)
+SCENARIOS = {
+    "async": ("wavespeed_models", "NSWaveSpeedNanoBananaProTextToImageMulti", {
+        "aspect_ratio": "3:2", "num_images": 2, "output_format": "png",
+        "enable_sync_mode": False, "output_mode": "url",
+    }),
+    "sync": ("wavespeed_models", "NSWaveSpeedNanoBananaProTextToImageMulti", {
+        "aspect_ratio": "3:2", "num_images": 2, "output_format": "png",
+        "enable_sync_mode": True, "output_mode": "url",
+    }),
+    "sync-base64": ("wavespeed_models", "NSWaveSpeedNanoBananaProTextToImageMulti", {
+        "aspect_ratio": "3:2", "num_images": 2, "output_format": "png",
+        "enable_sync_mode": True, "output_mode": "base64",
+    }),
+    "batch": ("wavespeed_nano_banana_pro_text_to_image", "NSWaveSpeedNanoBananaProTextToImage", {
+        "aspect_ratio": "1:1", "resolution": "1k", "output_format": "png",
+        "enable_sync_mode": False, "batch_count": 4, "max_in_flight": 4, "output_mode": "url",
+    }),
+}
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else None
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def start_mock(args):
+    """Start the mock server in a child process and return (process, base URL)."""
+    command = [sys.executable, os.path.join(BENCH_DIR, "mock_wavespeed.py"), "--port", "0"]
+    for name in ("latency", "jitter", "submit_delay", "status_delay", "download_delay",
+                 "fail_rate", "task_fail_rate", "image_size", "image_format"):
+        command += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("MOCK_URL "):
+        process.kill()
+        raise SystemExit(f"Mock server did not start: {line!r}")
+    return process, line.split()[1]
+
+
+def stop_mock(process):
+    process.send_signal(signal.SIGINT)
+    try:
+        output, _ = process.communicate(timeout=5)
+        for line in output.splitlines():
+            print(line)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def load_extension(base_url, work_dir, overrides):
+    """
+    Import the extension's py/ package against a temporary config.ini.
+
+    The repository root is mounted as a bare package, so the ComfyUI entry
+    point (which loads every node and starts the warm-up) is not run.
+    """
+    config = {
+        "WaveSpeed": {"base_url": base_url, "journal": os.path.join(work_dir, "tasks.jsonl")},
+        "Cache": {"enabled": "false", "dir": os.path.join(work_dir, "cache")},
+        "Upload": {"index": os.path.join(work_dir, "uploads.json")},
+        "Video": {"cache_dir": os.path.join(work_dir, "videos")},
+        "Telemetry": {"log": os.path.join(work_dir, "telemetry.jsonl")},
+    }
+    for override in overrides:
+        key, _, value = override.partition("=")
+        section, _, option = key.partition(".")
+        if not option:
+            raise SystemExit(f"--set expects SECTION.key=value, got {override}")
+        config.setdefault(section, {})[option] = value
+    config_path = os.path.join(work_dir, "config.ini")
+    with open(config_path, "w", encoding="utf-8") as f:
+        for section, values in config.items():
+            f.write(f"[{section}]\n")
+            f.writelines(f"{option} = {value}\n" for option, value in values.items())
+
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ROOT]
+    sys.modules[PACKAGE] = package
+    _config = importlib.import_module(f"{PACKAGE}.py._config")
+    _config.CONFIG_PATH = config_path
+    _config._config = None
+    return importlib.import_module(f"{PACKAGE}.py._telemetry")
+
+
+def run_scenario(name, args, telemetry):
+    module_name, class_name, inputs = SCENARIOS[name]
+    module = importlib.import_module(f"{PACKAGE}.py.{module_name}")
+    node = module.NODE_CLASS_MAPPINGS[class_name]()
+    polling = importlib.import_module(f"{PACKAGE}.py._polling")
+    endpoint = getattr(module, "ENDPOINT", None) or node.SPEC["endpoint"]
+    if not args.keep_priors:
+        # Measure the client, not a polling prior that doesn't match the mock's latency
+        polling.register_prior(endpoint, args.latency)
+
+    client = {"api_key": "bench"}
+    run_id = uuid.uuid4().hex[:8]
+    latencies, images, errors = [], [0], []
+    lock = threading.Lock()
+
+    def call(i):
+        start = time.perf_counter()
+        try:
+            (output, *_) = node.execute(client, prompt=f"bench {run_id} {i}", **inputs)
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                images[0] += int(output.shape[0])
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+
+    log_path = telemetry.log_path()
+    if os.path.exists(log_path):
+        os.remove(log_path)
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull) if not args.verbose else contextlib.nullcontext():
+        for i in range(args.warmup):
+            call(f"warmup-{i}")
+    latencies.clear()
+    images[0] = 0
+    if os.path.exists(log_path):
+        os.remove(log_path)
+
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull) if not args.verbose else contextlib.nullcontext():
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(call, range(args.requests)))
+        wall = time.perf_counter() - start
+
+    provider = args.latency + (args.submit_delay if inputs.get("enable_sync_mode") else 0)
+    p50, p99 = percentile(latencies, 0.5), percentile(latencies, 0.99)
+    return {
+        "scenario": name,
+        "node": class_name,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "wall_seconds": round(wall, 3),
+        "calls_per_second": round(len(latencies) / wall, 3) if wall else None,
+        "images_per_second": round(images[0] / wall, 3) if wall else None,
+        "p50_seconds": round(p50, 3) if p50 is not None else None,
+        "p99_seconds": round(p99, 3) if p99 is not None else None,
+        "p50_overhead_seconds": round(p50 - provider, 3) if p50 is not None else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "breakdown": telemetry.summarize(0),
+    }
+
+
+def print_result(result):
+    print(f"\n== {result['scenario']} ({result['node']}): {result['requests']} calls, "
+          f"concurrency {result['concurrency']}")
+    print(f"   throughput  {result['calls_per_second']} calls/s, {result['images_per_second']} images/s")
+    print(f"   latency     p50 {result['p50_seconds']}s  p99 {result['p99_seconds']}s  "
+          f"(client overhead p50 {result['p50_overhead_seconds']}s)")
+    print(f"   peak RSS    {result['peak_rss_mb']} MB")
+    if result["errors"]:
+        print(f"   errors      {result['errors']} (first: {result['first_error']})")
+    for row in result["breakdown"]:
+        print(f"   {row['provider']:>9} {row['operation']:<15} n={row['count']:<4} "
+              f"total={row['total_seconds']:.2f}s p50={row['p50_seconds']}s "
+              f"polls={row['mean_polls']} retries={row['retries']} bytes={row['bytes']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the WaveSpeed nodes against a local mock server")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--requests", type=int, default=20, help="Node executions per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="Node executions running at once")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured executions before each scenario")
+    parser.add_argument("--url", help="Use an already running mock server instead of starting one")
+    parser.add_argument("--keep-priors", action="store_true",
+                        help="Poll with the models' built-in duration priors instead of --latency")
+    parser.add_argument("--set", action="append", default=[], metavar="SECTION.key=value",
+                        help="Override a config.ini setting for the run")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show the nodes' own log output")
+    mock_wavespeed.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    process = None
+    base_url = args.url
+    if not base_url:
+        process, base_url = start_mock(args)
+    try:
+        with tempfile.TemporaryDirectory(prefix="ns-bench-") as work_dir:
+            telemetry = load_extension(base_url, work_dir, args.set)
+            results = []
+            for name in args.scenario or list(SCENARIOS):
+                result = run_scenario(name, args, telemetry)
+                print_result(result)
+                results.append(result)
+    finally:
+        if process is not None:
+            stop_mock(process)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
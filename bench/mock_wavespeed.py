@@ -0,0 +1,232 @@
+# ABOUTME: Local stand-in for the WaveSpeed API: submit, task status, output files and media upload endpoints.
+# ABOUTME: Generation time, per-call delays, failure rates and image size are configurable for offline benchmarks.
+
+"""
+Mock WaveSpeed server
+
+    python bench/mock_wavespeed.py --port 8900 --latency 2 --image-size 1024x1024
+
+Any POST under /api/v3/ submits a task, except the task status endpoint
+(/api/v3/wavespeed-ai/task/<id>) and the media upload endpoint. A task
+finishes --latency seconds (+- --jitter) after submit with one output per
+num_images / max_images in the payload (default 1). Sync mode requests are
+held until the task finishes; enable_base64_output returns the images
+inline as data URIs. Output files are served from /outputs/.
+
+Point the extension at it with [WaveSpeed] base_url = http://127.0.0.1:8900
+in config.ini. The first line printed is "MOCK_URL <base url>", which the
+benchmark harness reads when it starts the server itself (--port 0 picks a
+free port).
+"""
+
+import argparse
+import base64
+import io
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from PIL import Image
+
+TASK_PREFIX = "/api/v3/wavespeed-ai/task/"
+UPLOAD_PATH = "/api/v3/media/upload/binary"
+
+
+def encode_test_image(width, height, image_format):
+    """Noise image, so encoded sizes (and decode times) are close to real renders."""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    # Smooth the noise a little: pure noise compresses far worse than any real image
+    pixels = ((pixels.astype(np.uint16) + np.roll(pixels, 1, axis=1) + np.roll(pixels, 1, axis=0)) // 3)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels.astype(np.uint8)).save(buffer, format="PNG" if image_format == "png" else "JPEG",
+                                                  **({} if image_format == "png" else {"quality": 90}))
+    return buffer.getvalue()
+
+
+class MockState:
+    """Tasks and settings shared by all request handler threads."""
+
+    def __init__(self, args):
+        self.args = args
+        self.image = encode_test_image(args.width, args.height, args.image_format)
+        self.content_type = "image/png" if args.image_format == "png" else "image/jpeg"
+        self.tasks = {}
+        self.uploads = {}
+        self.lock = threading.Lock()
+        self.calls = {"submit": 0, "status": 0, "download": 0, "upload": 0, "injected_errors": 0}
+
+    def count(self, name):
+        with self.lock:
+            self.calls[name] += 1
+
+    def inject_error(self):
+        """True if this API call should fail with a 503, per --fail-rate."""
+        if random.random() < self.args.fail_rate:
+            self.count("injected_errors")
+            return True
+        return False
+
+    def create_task(self, payload):
+        count = payload.get("num_images") or payload.get("max_images") or 1
+        latency = max(0.0, self.args.latency + random.uniform(-self.args.jitter, self.args.jitter))
+        task = {
+            "id": uuid.uuid4().hex,
+            "submitted_at": time.time(),
+            "latency": latency,
+            "outputs": int(count),
+            "failed": random.random() < self.args.task_fail_rate,
+            "base64": bool(payload.get("enable_base64_output")),
+        }
+        with self.lock:
+            self.tasks[task["id"]] = task
+        return task
+
+    def task_data(self, task, base_url):
+        done = time.time() - task["submitted_at"] >= task["latency"]
+        data = {"id": task["id"], "status": "processing", "outputs": [], "error": ""}
+        if not done:
+            return data
+        if task["failed"]:
+            data.update(status="failed", error="mock task failure")
+            return data
+        if task["base64"]:
+            encoded = base64.b64encode(self.image).decode("ascii")
+            outputs = [f"data:{self.content_type};base64,{encoded}"] * task["outputs"]
+        else:
+            extension = "png" if self.args.image_format == "png" else "jpg"
+            outputs = [f"{base_url}/outputs/{task['id']}/{i}.{extension}" for i in range(task["outputs"])]
+        data.update(status="completed", outputs=outputs,
+                    timings={"inference": int(task["latency"] * 1000)})
+        return data
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API behind its load balancer
+    state: MockState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    @property
+    def base_url(self):
+        return f"http://{self.headers.get('Host')}"
+
+    def do_HEAD(self):
+        self._send(200, b"", "text/plain")
+
+    def do_GET(self):
+        state = self.state
+        if self.path.startswith("/outputs/") or self.path.startswith("/uploads/"):
+            state.count("download")
+            time.sleep(state.args.download_delay)
+            if self.path.startswith("/uploads/"):
+                with state.lock:
+                    body = state.uploads.get(self.path)
+                if body is None:
+                    return self._send(404, {"code": 404, "message": "not found"})
+                return self._send(200, body, "application/octet-stream")
+            return self._send(200, state.image, state.content_type)
+        self._send(404, {"code": 404, "message": "not found"})
+
+    def do_POST(self):
+        state = self.state
+        body = self._read_body()
+        if not self.path.startswith("/api/v3/"):
+            return self._send(404, {"code": 404, "message": "not found"})
+
+        if self.path == UPLOAD_PATH:
+            state.count("upload")
+            if state.inject_error():
+                return self._send(503, {"code": 503, "message": "injected failure"})
+            path = f"/uploads/{uuid.uuid4().hex}"
+            with state.lock:
+                state.uploads[path] = body
+            return self._send(200, {"code": 200, "data": {"download_url": f"{self.base_url}{path}"}})
+
+        if self.path.startswith(TASK_PREFIX):
+            state.count("status")
+            time.sleep(state.args.status_delay)
+            if state.inject_error():
+                return self._send(503, {"code": 503, "message": "injected failure"})
+            with state.lock:
+                task = state.tasks.get(self.path[len(TASK_PREFIX):])
+            if task is None:
+                return self._send(404, {"code": 404, "message": "task not found"})
+            return self._send(200, {"code": 200, "data": state.task_data(task, self.base_url)})
+
+        state.count("submit")
+        time.sleep(state.args.submit_delay)
+        if state.inject_error():
+            return self._send(503, {"code": 503, "message": "injected failure"})
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return self._send(400, {"code": 400, "message": "invalid JSON"})
+        task = state.create_task(payload)
+        if payload.get("enable_sync_mode"):
+            time.sleep(task["latency"])
+        return self._send(200, {"code": 200, "data": state.task_data(task, self.base_url)})
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Mock WaveSpeed API server")
+    add_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900, help="0 picks a free port")
+    return parser.parse_args(argv)
+
+
+def add_arguments(parser):
+    """Mock behaviour options, shared with the benchmark harness."""
+    parser.add_argument("--latency", type=float, default=2.0, help="Generation time per task in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +- spread of --latency in seconds")
+    parser.add_argument("--submit-delay", type=float, default=0.05, help="Server time per submit request")
+    parser.add_argument("--status-delay", type=float, default=0.02, help="Server time per status request")
+    parser.add_argument("--download-delay", type=float, default=0.0, help="Server time per output download")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="Fraction of API calls answered with a (retryable) 503")
+    parser.add_argument("--task-fail-rate", type=float, default=0.0, help="Fraction of tasks that fail")
+    parser.add_argument("--image-size", default="1024x1024", help="Output image size, WIDTHxHEIGHT")
+    parser.add_argument("--image-format", choices=["png", "jpeg"], default="png")
+
+
+def serve(args):
+    match = re.fullmatch(r"(\d+)[x*](\d+)", args.image_size)
+    if not match:
+        raise SystemExit(f"--image-size must look like 1024x1024, got {args.image_size}")
+    args.width, args.height = int(match.group(1)), int(match.group(2))
+
+    MockHandler.state = MockState(args)
+    server = ThreadingHTTPServer((args.host, args.port), MockHandler)
+    server.daemon_threads = True
+    print(f"MOCK_URL http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"[MockWaveSpeed] Calls: {MockHandler.state.calls}", flush=True)
+
+
+if __name__ == "__main__":
+    serve(parse_args())
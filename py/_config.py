@@ -0,0 +1,54 @@
+# ABOUTME: Shared config.ini reader for all nodes.
+# ABOUTME: Loads the extension's config.ini once and exposes typed getters with fallbacks.
+
+import configparser
+import os
+import threading
+
+CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.ini"
+)
+
+_config = None
+_lock = threading.Lock()
+
+
+def _load():
+    """Parse config.ini on first use. A missing file yields an empty config."""
+    global _config
+    with _lock:
+        if _config is None:
+            config = configparser.ConfigParser()
+            if os.path.exists(CONFIG_PATH):
+                config.read(CONFIG_PATH)
+            _config = config
+    return _config
+
+
+def get(section, key, fallback=None):
+    """Return a string value from config.ini, or fallback if unset."""
+    return _load().get(section, key, fallback=fallback)
+
+
+def get_int(section, key, fallback):
+    """Return an int value from config.ini, or fallback if unset or invalid."""
+    try:
+        return _load().getint(section, key, fallback=fallback)
+    except ValueError:
+        return fallback
+
+
+def get_float(section, key, fallback):
+    """Return a float value from config.ini, or fallback if unset or invalid."""
+    try:
+        return _load().getfloat(section, key, fallback=fallback)
+    except ValueError:
+        return fallback
+
+
+def get_bool(section, key, fallback):
+    """Return a boolean value from config.ini, or fallback if unset or invalid."""
+    try:
+        return _load().getboolean(section, key, fallback=fallback)
+    except ValueError:
+        return fallback
@@ -0,0 +1,103 @@
+# ABOUTME: Shared pooled HTTP sessions for the remote API clients.
+# ABOUTME: One keep-alive requests.Session per (base_url, api_key), reused by every node.
+
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import NewConnectionError
+
+from . import _config
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_KEEPALIVE = 60  # seconds idle before TCP keep-alive probes start
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def _keepalive_socket_options(idle):
+    """Socket options enabling TCP keep-alive so idle pooled connections stay open."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle // 4)))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use TCP keep-alive."""
+
+    def __init__(self, keepalive, **kwargs):
+        self._socket_options = _keepalive_socket_options(keepalive)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def never_sent(error):
+    """
+    True if a requests exception happened before the request reached the
+    server (connect timeout, connection refused, DNS failure), so even a
+    non-idempotent request can safely be sent again.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _new_session(api_key, pool_size, keepalive):
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        keepalive,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if api_key:
+        session.headers["Authorization"] = f"Bearer {api_key}"
+    return session
+
+
+def get_session(base_url, api_key=None):
+    """
+    Return the process-wide session for a provider, creating it on first use.
+
+    Sessions are keyed by base_url and API key so every client for the same
+    account shares one connection pool, and TCP/TLS handshakes are paid once
+    instead of on every submit and poll. Pool size and keep-alive idle time
+    come from the [HTTP] section of config.ini.
+
+    Args:
+        base_url: Provider base URL (e.g. https://api.wavespeed.ai), or None for
+            the anonymous session used to download output files
+        api_key: Bearer token set on the session, or None for anonymous use
+
+    Returns:
+        requests.Session shared by all callers with the same key
+    """
+    key = (base_url, api_key)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            pool_size = _config.get_int("HTTP", "pool_size", DEFAULT_POOL_SIZE)
+            keepalive = _config.get_int("HTTP", "keepalive", DEFAULT_KEEPALIVE)
+            session = _new_session(api_key, max(1, pool_size), max(1, keepalive))
+            _sessions[key] = session
+    return session
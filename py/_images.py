@@ -0,0 +1,230 @@
+# ABOUTME: Shared image loader for remote API outputs.
+# ABOUTME: Downloads (or base64-decodes) and decodes outputs concurrently straight into one preallocated batch tensor.
+
+import base64
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from PIL import Image
+
+from . import _config, _result_cache, _telemetry
+from ._http import get_session
+
+DEFAULT_WORKERS = 8
+DOWNLOAD_TIMEOUT = 30
+
+# How a batch handles output images of different sizes
+BATCH_STRATEGIES = ["resize", "pad", "error"]
+
+BATCH_STRATEGY_INPUT = (BATCH_STRATEGIES, {
+    "default": "resize",
+    "tooltip": "If the output images come back in different sizes: resize them to the first image's size, "
+               "pad them (centered on black) to the largest size, or fail"
+})
+
+# Output URLs that prefetch() downloads ahead of load_images; others (e.g. videos) are left alone
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif")
+# Prefetched downloads kept for load_images before the oldest are dropped
+MAX_PREFETCHED = 64
+
+_pool = None
+_pool_lock = threading.Lock()
+_prefetched = OrderedDict()  # URL -> Future of its downloaded bytes
+_prefetch_lock = threading.Lock()
+
+
+def _get_pool():
+    """Return the process-wide download/decode pool, starting it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = max(1, _config.get_int("Images", "workers", DEFAULT_WORKERS))
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ns-images")
+    return _pool
+
+
+def _download(url):
+    """Fetch an image's bytes, from the result cache when it belongs to a cached result."""
+    content = _result_cache.get_blob(url)
+    if content is None:
+        # Output URLs are pre-signed CDN links: use the shared anonymous session
+        with _telemetry.span("cdn", "image_download", endpoint=urlparse(url).netloc) as span:
+            response = get_session(None).get(url, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            content = response.content
+            span.set(bytes=len(content))
+        _result_cache.put_blob(url, content)
+    return content
+
+
+def _is_url(source):
+    return source.startswith(("http://", "https://"))
+
+
+def _label(source):
+    """Name an output in error messages without dumping a whole base64 payload."""
+    return source if _is_url(source) else f"inline image ({source[:32]}...)"
+
+
+def prefetch(url):
+    """
+    Start downloading an output image in the background.
+
+    Called by the task poller as soon as an output URL shows up, so the
+    download overlaps the rest of the task (or of a batch) and
+    load_images finds the bytes ready. Only URLs that look like images are
+    fetched; a prefetch that fails is simply retried by load_images.
+
+    Args:
+        url: Output URL
+    """
+    if not _is_url(url) or not _config.get_bool("Images", "prefetch", True):
+        return
+    if os.path.splitext(urlparse(url).path)[1].lower() not in IMAGE_EXTENSIONS:
+        return
+    with _prefetch_lock:
+        if url in _prefetched:
+            return
+        _prefetched[url] = _get_pool().submit(_download, url)
+        while len(_prefetched) > MAX_PREFETCHED:
+            _prefetched.popitem(last=False)
+
+
+def _take_prefetched(url):
+    """Return the bytes prefetched for a URL, or None if there are none (or the prefetch failed)."""
+    with _prefetch_lock:
+        future = _prefetched.pop(url, None)
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
+def _read(source):
+    """Return an output's encoded bytes: inline base64 (data URI or bare) or downloaded from its URL."""
+    if source.startswith("data:"):
+        return base64.b64decode(source.partition(",")[2])
+    if not _is_url(source):
+        return base64.b64decode(source)
+    content = _take_prefetched(source)
+    return content if content is not None else _download(source)
+
+
+def _open(source):
+    """Fetch an image and read its header; pixels are decoded later."""
+    try:
+        image = Image.open(io.BytesIO(_read(source)))
+        return image, image.size
+    except Exception as e:
+        raise Exception(f"Failed to load image from {_label(source)}: {str(e)}")
+
+
+def _decode_into(source, image, out):
+    """
+    Decode an opened image into its slot of the batch tensor.
+
+    The decoded uint8 pixels are widened straight into the float32 slot and
+    scaled there in place, so the only transient buffer is the uint8 image
+    itself (a quarter of the slot's size) instead of float copies of it.
+    """
+    try:
+        rgb = image.convert("RGB") if image.mode != "RGB" else image
+        np.copyto(out.numpy(), np.asarray(rgb), casting="unsafe")
+        out.div_(255.0)
+    except Exception as e:
+        raise Exception(f"Failed to load image from {_label(source)}: {str(e)}")
+    finally:
+        # Free the decoded pixels and the downloaded bytes as soon as the slot is filled
+        image.close()
+
+
+def _resize_into(batch, decoded, indices):
+    """Resize decoded images to the batch size, one interpolate call per distinct source size."""
+    groups = {}
+    for i in indices:
+        groups.setdefault(tuple(decoded[i].shape[:2]), []).append(i)
+    for group in groups.values():
+        stacked = torch.stack([decoded[i] for i in group]).permute(0, 3, 1, 2)
+        resized = F.interpolate(stacked, size=tuple(batch.shape[1:3]), mode="bilinear",
+                                align_corners=False, antialias=True)
+        batch[group] = resized.permute(0, 2, 3, 1).clamp_(0.0, 1.0)
+
+
+def load_images(image_urls, strategy="resize"):
+    """
+    Load image URL(s) into a ComfyUI IMAGE batch
+
+    Each entry is either a URL or an inline base64 image (a data URI or bare
+    base64, as returned with enable_base64_output); inline images skip the
+    download entirely. Downloads run concurrently on a bounded pool over a
+    shared keep-alive session, unless prefetch() already fetched them. Once every header is known the batch tensor
+    is allocated once, and each image is decoded in parallel directly into
+    its slot, so there are no per-image tensors and no final stack copy.
+
+    Multi-output models sometimes return images of different sizes. With
+    "resize" they are scaled to the first image's size (bilinear, batched
+    per source size); with "pad" the batch takes the largest width and
+    height and each image is decoded centered into its slot on black;
+    "error" raises instead.
+
+    Args:
+        image_urls: Single URL / base64 string or list of them
+        strategy: "resize", "pad" or "error" for images of different sizes
+
+    Returns:
+        torch.Tensor in ComfyUI format [batch, height, width, channels]
+    """
+    if isinstance(image_urls, str):
+        image_urls = [image_urls]
+    if not image_urls:
+        raise Exception("No image URLs to load")
+    if strategy not in BATCH_STRATEGIES:
+        raise ValueError(f"Unknown batch strategy: {strategy}")
+
+    pool = _get_pool()
+    opened = list(pool.map(_open, image_urls))
+    images = [image for image, _ in opened]
+    sizes = [size for _, size in opened]
+
+    width, height = sizes[0]
+    if strategy == "pad":
+        width = max(w for w, _ in sizes)
+        height = max(h for _, h in sizes)
+    elif strategy == "error":
+        for url, size in zip(image_urls, sizes):
+            if size != (width, height):
+                raise Exception(
+                    f"Failed to load image from {_label(url)}: size {size[0]}x{size[1]} "
+                    f"doesn't match the batch size {width}x{height}"
+                )
+
+    mismatched = [i for i, size in enumerate(sizes) if size != (width, height)]
+    alloc = torch.zeros if strategy == "pad" and mismatched else torch.empty
+    batch = alloc((len(image_urls), height, width, 3), dtype=torch.float32)
+
+    targets = list(batch.unbind(0))
+    for i in mismatched:
+        w, h = sizes[i]
+        if strategy == "pad":
+            top, left = (height - h) // 2, (width - w) // 2
+            targets[i] = targets[i][top:top + h, left:left + w]
+        else:
+            targets[i] = torch.empty((h, w, 3), dtype=torch.float32)
+
+    list(pool.map(_decode_into, image_urls, images, targets))
+    if mismatched:
+        if strategy == "resize":
+            _resize_into(batch, targets, mismatched)
+        print(f"[NSImages] {len(mismatched)} of {len(image_urls)} image(s) had a different size; "
+              f"{'resized' if strategy == 'resize' else 'padded'} to {width}x{height}")
+    return batch
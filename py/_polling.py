@@ -0,0 +1,128 @@
+# ABOUTME: Adaptive polling schedule shared by the WaveSpeed and Grok task pollers.
+# ABOUTME: Jittered backoff around a per-model expected duration learned from past completions.
+
+import random
+import threading
+
+# Expected generation time in seconds, matched by substring against the submit
+# endpoint (first match wins, so more specific keys come first).
+DEFAULT_PRIORS = [
+    ("infinitetalk", 300.0),
+    ("veo3.1-fast", 60.0),
+    ("veo3.1", 120.0),
+    ("sora-2", 180.0),
+    ("wan-2.5/image-to-video", 120.0),
+    ("wan-2.5/text-to-video", 120.0),
+    ("wan-2.2", 120.0),
+    ("grok-imagine-video", 60.0),
+    ("upscale", 30.0),
+    ("seedream", 10.0),
+    ("nano-banana", 15.0),
+    ("qwen-image", 15.0),
+    ("flux", 10.0),
+]
+FALLBACK_PRIOR = 20.0
+
+# Weight of the newest observation in the running average
+LEARNING_RATE = 0.3
+
+_learned = {}
+_registered = []
+_lock = threading.Lock()
+
+
+def register_prior(pattern, seconds):
+    """Declare the expected duration for a model key, taking precedence over DEFAULT_PRIORS."""
+    with _lock:
+        _registered[:] = [(p, s) for p, s in _registered if p != pattern]
+        _registered.append((pattern, float(seconds)))
+
+
+def expected_duration(model):
+    """Return the expected task duration in seconds for a model key."""
+    if model:
+        with _lock:
+            if model in _learned:
+                return _learned[model]
+            registered = list(_registered)
+        for pattern, seconds in registered + DEFAULT_PRIORS:
+            if pattern in model:
+                return seconds
+    return FALLBACK_PRIOR
+
+
+def record_completion(model, duration):
+    """Fold an observed task duration into the model's expected duration."""
+    if not model or duration <= 0:
+        return
+    prior = expected_duration(model)
+    with _lock:
+        _learned[model] = (1 - LEARNING_RATE) * prior + LEARNING_RATE * duration
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header given in seconds. HTTP-date values are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class PollingStrategy:
+    """
+    Decides how long to wait between status polls of one remote task.
+
+    Before the expected finish time the wait halves the remaining gap, so a
+    30-minute video job is polled a handful of times early on and densely as
+    it nears completion. Once overdue, waits grow exponentially from
+    base_interval. All waits are jittered so concurrent jobs don't poll in
+    lockstep, and a server Retry-After hint is never undercut.
+    """
+
+    def __init__(self, model=None, base_interval=1.0, max_interval=30.0,
+                 backoff=1.5, jitter=0.2):
+        """
+        Args:
+            model: Model key (usually the submit endpoint) used for the duration prior
+            base_interval: Shortest wait, used near and just after the expected finish
+            max_interval: Longest wait between two polls
+            backoff: Growth factor for waits once the task is overdue
+            jitter: Fractional random spread applied to every wait
+        """
+        self.model = model
+        self.base_interval = max(0.1, float(base_interval))
+        self.max_interval = max(self.base_interval, float(max_interval))
+        self.backoff = backoff
+        self.jitter = jitter
+        self.expected = expected_duration(model)
+        self.polls = 0
+        self._overdue_polls = 0
+
+    def next_delay(self, elapsed, retry_after=None):
+        """
+        Return seconds to sleep before the next poll.
+
+        Args:
+            elapsed: Seconds since the task was submitted
+            retry_after: Optional server hint in seconds
+        """
+        self.polls += 1
+        remaining = self.expected - elapsed
+        if remaining > self.base_interval:
+            delay = remaining / 2
+        else:
+            delay = self.base_interval * (self.backoff ** self._overdue_polls)
+            self._overdue_polls += 1
+
+        delay = min(max(delay, self.base_interval), self.max_interval)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def completed(self, elapsed):
+        """Record a successful completion so later tasks of this model poll better."""
+        record_completion(self.model, elapsed)
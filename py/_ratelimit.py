@@ -0,0 +1,255 @@
+# ABOUTME: Client-side rate limiting for the remote API clients, keyed by provider and API key.
+# ABOUTME: Token bucket for request rate plus a max-in-flight limit, optionally shared across processes via lock files.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from . import _config
+
+try:
+    import fcntl
+except ImportError:  # Windows: limits stay per-process
+    fcntl = None
+
+# Per-provider defaults: requests per second, burst size, concurrent requests
+DEFAULT_LIMITS = {
+    "wavespeed": (10.0, 20, 16),
+    "grok": (5.0, 10, 8),
+}
+DEFAULT_LOCK_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "ratelimit"
+)
+
+# How often a process waiting for a shared in-flight slot checks again
+SLOT_POLL_INTERVAL = 0.05
+
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at rate tokens per second up to burst.
+
+    pause() empties the bucket until a given time, used when the provider
+    answers 429 so every caller backs off together instead of each one
+    discovering the limit on its own.
+    """
+
+    def __init__(self, rate, burst):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Requests that may be sent back to back after an idle period
+        """
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self._tokens = self.burst
+        self._updated = time.time()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _take(self, state, now):
+        """Refill state and take a token; return seconds to wait (0 if taken)."""
+        if now < state["blocked_until"]:
+            return state["blocked_until"] - now
+        state["tokens"] = min(self.burst, state["tokens"] + (now - state["updated"]) * self.rate)
+        state["updated"] = now
+        if state["tokens"] >= 1:
+            state["tokens"] -= 1
+            return 0.0
+        return (1 - state["tokens"]) / self.rate
+
+    def _update(self, fn):
+        with self._lock:
+            state = {"tokens": self._tokens, "updated": self._updated, "blocked_until": self._blocked_until}
+            result = fn(state)
+            self._tokens, self._updated, self._blocked_until = (
+                state["tokens"], state["updated"], state["blocked_until"]
+            )
+            return result
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            wait = self._update(lambda state: self._take(state, time.time()))
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Send nothing for the next seconds and start again from an empty bucket."""
+        def apply(state):
+            until = time.time() + seconds
+            if until > state["blocked_until"]:
+                state["blocked_until"] = until
+                state["tokens"] = 0.0
+                state["updated"] = until
+        self._update(apply)
+
+
+class SharedTokenBucket(TokenBucket):
+    """TokenBucket whose state lives in a file, so all processes on the host share one budget."""
+
+    def __init__(self, rate, burst, path):
+        super().__init__(rate, burst)
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _update(self, fn):
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except ValueError:
+                    state = {}
+                state.setdefault("tokens", self.burst)
+                state.setdefault("updated", time.time())
+                state.setdefault("blocked_until", 0.0)
+                result = fn(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class SharedSlots:
+    """Max-in-flight limit across processes: one lock file per slot, held while a request runs."""
+
+    def __init__(self, count, prefix):
+        self.paths = [f"{prefix}.slot{i}" for i in range(count)]
+        os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        self._local = threading.BoundedSemaphore(count)
+
+    @contextmanager
+    def hold(self):
+        with self._local:
+            while True:
+                for path in self.paths:
+                    f = open(path, "a")
+                    try:
+                        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        f.close()
+                        continue
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+                        f.close()
+                    return
+                time.sleep(SLOT_POLL_INTERVAL)
+
+
+class RateLimiter:
+    """
+    Request rate and concurrency limits for one provider API key.
+
+    Status polls have their own in-flight slots, so submits that stay open
+    for a whole generation (sync mode) can't leave the polls of already
+    running tasks waiting for a slot.
+    """
+
+    def __init__(self, rate, burst, max_in_flight, shared_prefix=None, max_polls_in_flight=None):
+        """
+        Args:
+            rate: Requests per second (0 or less for no rate limit)
+            burst: Token bucket size
+            max_in_flight: Concurrent requests other than polls (0 or less for no limit)
+            shared_prefix: Lock file path prefix to share limits across processes, or None
+            max_polls_in_flight: Concurrent status polls (0 or less for no limit; None for max_in_flight)
+        """
+        self.bucket = None
+        if rate > 0:
+            self.bucket = (SharedTokenBucket(rate, burst, f"{shared_prefix}.bucket")
+                           if shared_prefix else TokenBucket(rate, burst))
+        if max_polls_in_flight is None:
+            max_polls_in_flight = max_in_flight
+        self.slots = self._slots(max_in_flight, shared_prefix)
+        self.poll_slots = self._slots(max_polls_in_flight, shared_prefix and f"{shared_prefix}.poll")
+
+    @staticmethod
+    def _slots(count, shared_prefix):
+        if count <= 0:
+            return None
+        return SharedSlots(count, shared_prefix) if shared_prefix else threading.BoundedSemaphore(count)
+
+    @contextmanager
+    def request(self, poll=False):
+        """Hold an in-flight slot (from the poll pool for status polls) and a rate token for one request."""
+        slots = self.poll_slots if poll else self.slots
+        if slots is None:
+            held = _nothing()
+        elif isinstance(slots, SharedSlots):
+            held = slots.hold()
+        else:
+            held = slots
+        with held:
+            if self.bucket is not None:
+                self.bucket.acquire()
+            yield
+
+    def throttled(self, retry_after=None):
+        """Back off every caller after the provider answered 429."""
+        if self.bucket is not None:
+            self.bucket.pause(retry_after if retry_after is not None else 1.0 / self.bucket.rate)
+
+
+@contextmanager
+def _nothing():
+    yield
+
+
+_limiters = {}
+_lock = threading.Lock()
+
+
+def get_limiter(provider, api_key):
+    """
+    Return the process-wide RateLimiter for a provider API key.
+
+    Limits come from the [RateLimit] section of config.ini:
+    <provider>_rps, <provider>_burst, <provider>_max_in_flight and
+    <provider>_max_polls_in_flight. With
+    shared = true (and fcntl available) they are enforced across every
+    process on the host through lock files in lock_dir.
+
+    Args:
+        provider: Provider name, a key of DEFAULT_LIMITS
+        api_key: API key the limits apply to
+
+    Returns:
+        RateLimiter shared by all clients using the key
+    """
+    key = (provider, api_key)
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        return limiter
+
+    with _lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            rate, burst, in_flight = DEFAULT_LIMITS.get(provider, (0.0, 1, 0))
+            rate = _config.get_float("RateLimit", f"{provider}_rps", rate)
+            burst = _config.get_int("RateLimit", f"{provider}_burst", burst)
+            in_flight = _config.get_int("RateLimit", f"{provider}_max_in_flight", in_flight)
+            polls_in_flight = _config.get_int("RateLimit", f"{provider}_max_polls_in_flight", in_flight)
+
+            shared_prefix = None
+            if _config.get_bool("RateLimit", "shared", False):
+                if fcntl is None:
+                    print("[NSRateLimit] Cross-process limits need fcntl; using per-process limits")
+                else:
+                    lock_dir = _config.get("RateLimit", "lock_dir", "") or DEFAULT_LOCK_DIR
+                    digest = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+                    shared_prefix = os.path.join(lock_dir, f"{provider}-{digest}")
+
+            limiter = RateLimiter(rate, burst, in_flight, shared_prefix, polls_in_flight)
+            _limiters[key] = limiter
+    return limiter
@@ -0,0 +1,231 @@
+# ABOUTME: On-disk, content-addressed cache of deterministic generation results.
+# ABOUTME: Keyed by endpoint + canonical payload; stores output URLs and downloaded bytes with LRU/TTL eviction.
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from . import _config
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache"
+)
+DEFAULT_MAX_SIZE_MB = 2048
+DEFAULT_TTL_HOURS = 168
+# Results whose outputs exist only as provider URLs are reused no longer than the URLs live
+DEFAULT_URL_TTL_HOURS = 24
+
+# Payload seed values that ask the provider for a random seed
+RANDOM_SEEDS = (-1,)
+# Payload keys that change how a result is delivered, not what is generated
+TRANSPORT_KEYS = ("enable_sync_mode",)
+
+_lock = threading.Lock()
+# Output URLs of cached results whose downloaded bytes should be kept too
+_blob_urls = set()
+
+
+def _settings():
+    return {
+        "enabled": _config.get_bool("Cache", "enabled", True),
+        "dir": _config.get("Cache", "dir", "") or DEFAULT_CACHE_DIR,
+        "max_bytes": max(0, _config.get_int("Cache", "max_size_mb", DEFAULT_MAX_SIZE_MB)) * 1024 * 1024,
+        "ttl": max(0.0, _config.get_float("Cache", "ttl_hours", DEFAULT_TTL_HOURS)) * 3600,
+        "url_ttl": max(0.0, _config.get_float("Cache", "url_ttl_hours", DEFAULT_URL_TTL_HOURS)) * 3600,
+    }
+
+
+def _path(kind, name):
+    return os.path.join(_settings()["dir"], kind, name)
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _read(path, ttl):
+    """
+    Read a cache file, treating files older than ttl as missing.
+
+    A file's mtime is when it was written (for the TTL) and its atime when it
+    was last used (for LRU eviction); both are set explicitly so the result
+    doesn't depend on the filesystem's atime mount options.
+    """
+    try:
+        written = os.path.getmtime(path)
+        if ttl and time.time() - written > ttl:
+            os.remove(path)
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path, (time.time(), written))
+        return data
+    except OSError:
+        return None
+
+
+def cache_key(endpoint, payload):
+    """
+    Return the cache key for a request, or None if it isn't cacheable.
+
+    Only requests with an explicit seed are cacheable: without one the
+    provider picks a random seed and the same payload yields a new result.
+
+    Args:
+        endpoint: Provider base URL plus endpoint path
+        payload: Request payload dict
+
+    Returns:
+        Hex digest of endpoint + canonical JSON payload, or None
+    """
+    if not _settings()["enabled"] or not isinstance(payload, dict):
+        return None
+    if payload.get("seed") is None or payload["seed"] in RANDOM_SEEDS:
+        return None
+    return payload_hash(endpoint, payload)
+
+
+def payload_hash(endpoint, payload):
+    """
+    Hash a request by endpoint and canonical JSON payload.
+
+    Args:
+        endpoint: Provider base URL plus endpoint path
+        payload: Request payload dict
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {k: v for k, v in payload.items() if k not in TRANSPORT_KEYS}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _hash(f"{endpoint}\n{canonical}")
+
+
+def get_result(key):
+    """
+    Return the cached response for a key, or None on a miss.
+
+    A result with an output that was never downloaded into the cache (e.g.
+    a video) only has the provider's URL for it, so it expires after
+    [Cache] url_ttl_hours instead of ttl_hours.
+    """
+    if not key:
+        return None
+    settings = _settings()
+    path = _path("results", f"{key}.json")
+    data = _read(path, settings["ttl"])
+    if data is None:
+        return None
+    try:
+        result = json.loads(data.decode("utf-8"))
+    except ValueError:
+        return None
+    urls = _output_urls(result)
+    if settings["url_ttl"] and not all(os.path.exists(_path("blobs", _hash(url))) for url in urls):
+        try:
+            expired = time.time() - os.path.getmtime(path) > settings["url_ttl"]
+        except OSError:
+            return None
+        if expired:
+            _remove(path)
+            return None
+    with _lock:
+        _blob_urls.update(urls)
+    return result
+
+
+def put_result(key, result):
+    """Store a completed response under a key and keep the bytes of its outputs when downloaded."""
+    if not key or not isinstance(result, dict):
+        return
+    data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+    with _lock:
+        try:
+            _write_atomic(_path("results", f"{key}.json"), data)
+        except OSError as e:
+            print(f"[NSResultCache] Could not write cache entry: {e}")
+            return
+        _blob_urls.update(_output_urls(result))
+    evict()
+
+
+def _output_urls(result):
+    """Remote output URLs of a result, whose downloaded bytes may be kept as blobs."""
+    # WaveSpeed results list URLs under "outputs", OpenAI-style ones under "data"
+    urls = [url for url in result.get("outputs") or [] if isinstance(url, str)]
+    data = result.get("data")
+    if isinstance(data, list):
+        urls.extend(item["url"] for item in data if isinstance(item, dict) and item.get("url"))
+    # Inline base64 outputs are already stored in the result itself
+    return [url for url in urls if url.startswith(("http://", "https://"))]
+
+
+def get_blob(url):
+    """Return the cached downloaded bytes of an output URL, or None."""
+    with _lock:
+        if url not in _blob_urls:
+            return None
+    return _read(_path("blobs", _hash(url)), _settings()["ttl"])
+
+
+def put_blob(url, data):
+    """Keep the downloaded bytes of an output URL if it belongs to a cached result."""
+    with _lock:
+        if url not in _blob_urls:
+            return
+        try:
+            _write_atomic(_path("blobs", _hash(url)), data)
+        except OSError as e:
+            print(f"[NSResultCache] Could not write cached download: {e}")
+            return
+    evict()
+
+
+def evict():
+    """Drop entries older than the TTL, then least recently used ones until under the size cap."""
+    settings = _settings()
+    now = time.time()
+    entries = []
+    with _lock:
+        for kind in ("results", "blobs"):
+            folder = os.path.join(settings["dir"], kind)
+            try:
+                names = os.listdir(folder)
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(folder, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if settings["ttl"] and now - stat.st_mtime > settings["ttl"]:
+                    _remove(path)
+                else:
+                    entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= settings["max_bytes"]:
+                break
+            _remove(path)
+            total -= size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
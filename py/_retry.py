@@ -0,0 +1,204 @@
+# ABOUTME: Error classification, bounded retries and per-endpoint circuit breakers for the API clients.
+# ABOUTME: Transient failures (429, 5xx, dropped connections) are retried with backoff; everything else fails fast.
+
+import random
+import threading
+import time
+
+from . import _config, _telemetry
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 1.0  # seconds before the first retry, doubled each attempt
+MAX_BACKOFF = 30.0
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_RESET = 30.0
+
+# HTTP statuses worth retrying: rate limiting and server-side trouble
+RETRYABLE_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+
+class RetryableError(Exception):
+    """A transient failure: the same request may succeed if sent again later."""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class FatalError(Exception):
+    """A failure that won't go away on retry (bad request, auth, failed task)."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class UnconfirmedError(FatalError):
+    """
+    A non-idempotent request failed after it may have reached the provider.
+
+    Not resent, so a task is never created twice, but counted against the
+    circuit breaker like a transient failure.
+    """
+
+
+class CircuitOpenError(FatalError):
+    """Raised without contacting the provider while its circuit breaker is open."""
+
+
+def http_error(status, message, retry_after=None):
+    """
+    Build the exception for an HTTP error response.
+
+    Args:
+        status: HTTP status code
+        message: Error message
+        retry_after: Retry-After seconds from the response, if any
+
+    Returns:
+        RetryableError for rate limits and server errors, FatalError otherwise
+    """
+    if status in RETRYABLE_STATUSES or status >= 500:
+        return RetryableError(message, status=status, retry_after=retry_after)
+    return FatalError(message, status=status)
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to an endpoint that keeps failing.
+
+    After failure_threshold consecutive transient failures the circuit opens
+    and calls fail immediately with CircuitOpenError. Once reset_timeout has
+    passed a single trial request is let through: success closes the
+    circuit, failure opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=DEFAULT_BREAKER_THRESHOLD, reset_timeout=DEFAULT_BREAKER_RESET):
+        """
+        Args:
+            name: Endpoint the breaker guards, used in error messages
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError if the endpoint should not be called right now."""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            waited = time.time() - self.opened_at
+            if waited < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError(
+                    f"{self.name} is failing ({self.failures} errors in a row); "
+                    f"not sending requests for another {max(0, int(self.reset_timeout - waited))}s"
+                )
+            self._trial_in_flight = True
+
+    def record_success(self):
+        """The provider answered: close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """A transient failure: open the circuit once the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """The call ended without a verdict on the provider: let the next call be the trial."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """Return the process-wide circuit breaker for an endpoint, creating it on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=_config.get_int("Retry", "breaker_threshold", DEFAULT_BREAKER_THRESHOLD),
+                reset_timeout=_config.get_float("Retry", "breaker_reset", DEFAULT_BREAKER_RESET),
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+def call_with_retry(fn, breaker=None, label="Request"):
+    """
+    Call fn, retrying transient failures with jittered exponential backoff.
+
+    RetryableError is retried up to [Retry] max_retries times, waiting at
+    least the server's Retry-After. FatalError and anything else propagate at
+    once (UnconfirmedError still counts as a breaker failure). With a breaker, every attempt is checked against and recorded in it,
+    so a provider that is down fails fast for all callers. 429s are retried
+    but not counted against the breaker.
+
+    Args:
+        fn: Zero-argument callable performing one attempt
+        breaker: Optional CircuitBreaker for the endpoint
+        label: Description used in log messages
+
+    Returns:
+        fn's return value
+    """
+    retries = max(0, _config.get_int("Retry", "max_retries", DEFAULT_MAX_RETRIES))
+    backoff = max(0.0, _config.get_float("Retry", "backoff", DEFAULT_BACKOFF))
+    attempt = 0
+    while True:
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = fn()
+        except RetryableError as e:
+            if breaker is not None:
+                if e.status == 429:
+                    # Throttling is the rate limiter's job, not a sign the provider is down
+                    breaker.release_trial()
+                else:
+                    breaker.record_failure()
+            if attempt >= retries:
+                raise
+            delay = min(MAX_BACKOFF, backoff * (2 ** attempt)) * random.uniform(0.8, 1.2)
+            if e.retry_after is not None:
+                delay = max(delay, e.retry_after)
+            attempt += 1
+            _telemetry.count("retries")
+            print(f"[NSRetry] {label} failed ({e}); retry {attempt}/{retries} in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+        except UnconfirmedError:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except FatalError:
+            # The provider answered, it just refused this request
+            if breaker is not None:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # A bug or an interrupt says nothing about the provider, but must
+            # not leave a half-open circuit waiting for a trial that never ends
+            if breaker is not None:
+                breaker.release_trial()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
@@ -0,0 +1,236 @@
+# ABOUTME: Structured latency / cost telemetry for the remote API clients and downloads.
+# ABOUTME: One JSON line per request, task or transfer, plus per-endpoint summaries for the telemetry node.
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from . import _config
+
+DEFAULT_LOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "telemetry.jsonl"
+)
+DEFAULT_MAX_LOG_MB = 50
+
+_lock = threading.Lock()
+_local = threading.local()  # stack of open spans on this thread
+_prices = {}  # endpoint -> (unit, price or {value: price}, payload key the price depends on)
+
+
+def _enabled():
+    return _config.get_bool("Telemetry", "enabled", True)
+
+
+def log_path():
+    """Path of the telemetry JSONL log."""
+    return _config.get("Telemetry", "log", "") or DEFAULT_LOG_PATH
+
+
+def record(provider, operation, **fields):
+    """
+    Append one telemetry record to the log.
+
+    Fields set to None are left out. Common ones: endpoint, seconds, ok,
+    error, retries, polls, queue_seconds, processing_seconds, bytes,
+    tokens_in, tokens_out, cost, unpriced, cached.
+
+    Args:
+        provider: Service name (wavespeed, grok, anthropic, elevenlabs, ...)
+        operation: What was done (submit, task, chat, download, ...)
+        **fields: Measurements
+    """
+    if not _enabled():
+        return
+    entry = {"ts": round(time.time(), 3), "provider": provider, "operation": operation}
+    entry.update({key: value for key, value in fields.items() if value is not None})
+    line = json.dumps(entry, ensure_ascii=False) + "\n"
+    path = log_path()
+    with _lock:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            max_bytes = max(1, _config.get_int("Telemetry", "max_log_mb", DEFAULT_MAX_LOG_MB)) * 1024 * 1024
+            if os.path.exists(path) and os.path.getsize(path) > max_bytes:
+                os.replace(path, f"{path}.1")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            print(f"[NSTelemetry] Could not write telemetry log: {e}")
+
+
+class Span:
+    """Measurements of one timed operation, recorded when its span() block exits."""
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def set(self, **fields):
+        """Set measurements (later values win)."""
+        self.fields.update(fields)
+
+    def count(self, name, n=1):
+        """Add n to a counter such as retries or polls."""
+        self.fields[name] = self.fields.get(name, 0) + n
+
+
+@contextmanager
+def span(provider, operation, **fields):
+    """
+    Time a block and record it, with ok=False and the error if it raises.
+
+    Retries made by _retry.call_with_retry inside the block are counted on
+    the innermost open span of the thread.
+
+    Args:
+        provider: Service name
+        operation: What is being done
+        **fields: Initial measurements (e.g. endpoint)
+
+    Yields:
+        Span to add measurements to
+    """
+    current = Span(dict(fields))
+    stack = getattr(_local, "spans", None)
+    if stack is None:
+        stack = _local.spans = []
+    stack.append(current)
+    start = time.time()
+    try:
+        yield current
+    except BaseException as e:
+        current.set(ok=False, error=str(e)[:300])
+        raise
+    finally:
+        stack.pop()
+        current.fields.setdefault("ok", True)
+        current.fields["seconds"] = round(time.time() - start, 3)
+        record(provider, operation, **current.fields)
+
+
+def count(name, n=1):
+    """Add n to a counter of the innermost open span on this thread, if any."""
+    stack = getattr(_local, "spans", None)
+    if stack:
+        stack[-1].count(name, n)
+
+
+def register_price(endpoint, unit, price, by=None):
+    """
+    Register a model's price for cost estimates.
+
+    Args:
+        endpoint: API endpoint path
+        unit: "image" (per output), "second" (per payload duration) or "request"
+        price: USD per unit, or {payload value: USD per unit}
+        by: Payload key selecting the price when price is a dict (e.g. "resolution")
+    """
+    _prices[endpoint] = (unit, price, by)
+
+
+def estimate_cost(endpoint, payload, outputs=None):
+    """
+    Estimate the cost of a request from its registered price.
+
+    Args:
+        endpoint: API endpoint path
+        payload: Request payload dict
+        outputs: Output list of the finished request, for per-image prices
+
+    Returns:
+        Estimated USD, or None if the model has no (applicable) price
+    """
+    entry = _prices.get(endpoint)
+    if entry is None or not isinstance(payload, dict):
+        return None
+    unit, price, by = entry
+    if isinstance(price, dict):
+        price = price.get(payload.get(by))
+        if price is None:
+            return None
+    if unit == "image":
+        return round(price * len(outputs or []), 4)
+    if unit == "second":
+        duration = payload.get("duration")
+        return round(price * float(duration), 4) if duration else None
+    return price
+
+
+def cost_fields(endpoint, payload, outputs=None):
+    """
+    Telemetry fields for the cost of a finished request.
+
+    Returns:
+        {"cost": USD} when the model has a listed price, else {"unpriced": True},
+        so the summary can tell unpriced requests apart from free ones
+    """
+    cost = estimate_cost(endpoint, payload, outputs)
+    return {"cost": cost} if cost is not None else {"unpriced": True}
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(window_hours=24.0):
+    """
+    Aggregate the log per provider, operation and endpoint.
+
+    Args:
+        window_hours: Only records this recent (0 for the whole log)
+
+    Returns:
+        List of summary dicts, slowest total time first
+    """
+    since = time.time() - window_hours * 3600 if window_hours else 0
+    groups = {}
+    for path in (f"{log_path()}.1", log_path()):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get("ts", 0) < since:
+                        continue
+                    key = (entry.get("provider"), entry.get("operation"), entry.get("endpoint", ""))
+                    groups.setdefault(key, []).append(entry)
+        except OSError:
+            continue
+
+    summary = []
+    for (provider, operation, endpoint), entries in groups.items():
+        seconds = [e["seconds"] for e in entries if "seconds" in e]
+
+        def total(name):
+            values = [e[name] for e in entries if isinstance(e.get(name), (int, float))]
+            return sum(values) if values else None
+
+        def mean(name):
+            values = [e[name] for e in entries if isinstance(e.get(name), (int, float))]
+            return round(sum(values) / len(values), 3) if values else None
+
+        summary.append({
+            "provider": provider,
+            "operation": operation,
+            "endpoint": endpoint,
+            "count": len(entries),
+            "errors": sum(1 for e in entries if e.get("ok") is False),
+            "cached": sum(1 for e in entries if e.get("cached")),
+            "total_seconds": round(sum(seconds), 3),
+            "p50_seconds": _percentile(seconds, 0.5) if seconds else None,
+            "p95_seconds": _percentile(seconds, 0.95) if seconds else None,
+            "mean_queue_seconds": mean("queue_seconds"),
+            "mean_processing_seconds": mean("processing_seconds"),
+            "mean_polls": mean("polls"),
+            "retries": total("retries") or 0,
+            "bytes": total("bytes") or 0,
+            "tokens_in": total("tokens_in"),
+            "tokens_out": total("tokens_out"),
+            "cost": round(total("cost"), 4) if total("cost") is not None else None,
+            "unpriced": sum(1 for e in entries if e.get("unpriced")),
+        })
+    summary.sort(key=lambda row: row["total_seconds"], reverse=True)
+    return summary
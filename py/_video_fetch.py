@@ -0,0 +1,278 @@
+# ABOUTME: Shared downloader for video outputs: streams straight to disk with Range resume and size checks.
+# ABOUTME: Files land in a content-addressed cache, so a URL (or identical content) is only downloaded once.
+
+import hashlib
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from . import _config, _telemetry
+from ._http import get_session
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "videos"
+)
+DEFAULT_CHUNK_KB = 1024
+DEFAULT_MAX_SIZE_MB = 4096
+DEFAULT_RESUME_ATTEMPTS = 5
+DOWNLOAD_TIMEOUT = 60  # seconds without data before a stalled download is resumed
+
+_lock = threading.Lock()
+_url_locks = {}  # URL hash -> [lock held while that URL is downloading, callers using it]
+_returned = set()  # cached files handed out this session; never evicted while ComfyUI may still read them
+
+
+def _settings():
+    return {
+        "dir": _config.get("Video", "cache_dir", "") or DEFAULT_CACHE_DIR,
+        "chunk": max(64, _config.get_int("Video", "chunk_size_kb", DEFAULT_CHUNK_KB)) * 1024,
+        "max_bytes": max(0, _config.get_int("Video", "cache_max_size_mb", DEFAULT_MAX_SIZE_MB)) * 1024 * 1024,
+        "attempts": max(1, _config.get_int("Video", "resume_attempts", DEFAULT_RESUME_ATTEMPTS)),
+    }
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _extension(url):
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    return ext if ext in (".mp4", ".mov", ".webm", ".mkv", ".m4v") else ".mp4"
+
+
+def _expected_size(response, offset):
+    """Total file size from Content-Range (resumed) or Content-Length (full), or None."""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
+
+
+def _range_start(response):
+    """First byte of a 206 response from its Content-Range ("bytes 100-199/200"), or None."""
+    content_range = response.headers.get("Content-Range", "")
+    unit, _, spec = content_range.partition(" ")
+    start = spec.split("-", 1)[0]
+    return int(start) if unit == "bytes" and start.isdigit() else None
+
+
+def _hash_file(path, hasher, chunk):
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            hasher.update(block)
+
+
+def _download(url, part_path, settings):
+    """
+    Stream a URL into part_path, resuming with Range requests after interruptions.
+
+    Returns:
+        (sha256 hex digest of the file, size in bytes)
+    """
+    session = get_session(None)
+    last_error = None
+    for attempt in range(settings["attempts"]):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status_code == 416:
+                    # Our partial file doesn't fit the server's copy; start over
+                    os.remove(part_path)
+                    last_error = Exception("server rejected the resume range")
+                    continue
+                response.raise_for_status()
+                if offset:
+                    _telemetry.count("resumes")
+                if offset and response.status_code != 206:
+                    print("[NSVideoFetch] Server ignored the resume request; downloading from the start")
+                    offset = 0
+                elif offset and _range_start(response) != offset:
+                    # Appending a misaligned range would silently corrupt the file
+                    print("[NSVideoFetch] Server resumed at the wrong offset; downloading from the start")
+                    os.remove(part_path)
+                    last_error = Exception("server resumed at the wrong offset")
+                    continue
+                expected = _expected_size(response, offset)
+
+                hasher = hashlib.sha256()
+                if offset:
+                    _hash_file(part_path, hasher, settings["chunk"])
+                    print(f"[NSVideoFetch] Resuming at {offset // (1024 * 1024)} MB")
+                with open(part_path, "ab" if offset else "wb") as f:
+                    for block in response.iter_content(chunk_size=settings["chunk"]):
+                        f.write(block)
+                        hasher.update(block)
+
+            size = os.path.getsize(part_path)
+            if expected is not None and size != expected:
+                if size > expected:
+                    os.remove(part_path)
+                raise requests.exceptions.ChunkedEncodingError(
+                    f"got {size} of {expected} bytes"
+                )
+            return hasher.hexdigest(), size
+
+        except (requests.exceptions.RequestException, OSError) as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if isinstance(e, requests.exceptions.HTTPError) and status is not None and status < 500:
+                raise  # expired or missing URL: resuming won't help
+            last_error = e
+            if attempt + 1 < settings["attempts"]:
+                print(f"[NSVideoFetch] Download interrupted ({e}); resuming "
+                      f"(attempt {attempt + 2}/{settings['attempts']})")
+                time.sleep(min(8, 2 ** attempt))
+    raise Exception(f"Download did not complete after {settings['attempts']} attempts: {last_error}")
+
+
+def fetch_video(url):
+    """
+    Download a video URL to the local cache and return its path.
+
+    The body is streamed to disk in large chunks (no copy held in memory).
+    An interrupted download is resumed with an HTTP Range request from the
+    bytes already on disk, and the finished file must match the size the
+    server announced. Files are stored under the SHA-256 of their content;
+    the URL only maps to that name, so fetching the same URL again (or a
+    different URL with identical bytes) reuses the file.
+
+    Args:
+        url: Video URL
+
+    Returns:
+        Local path of the downloaded video
+    """
+    settings = _settings()
+    url_key = _hash(url)
+    index_path = os.path.join(settings["dir"], "urls", url_key)
+
+    with _lock:
+        entry = _url_locks.setdefault(url_key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            path = _fetch_locked(url, url_key, index_path, settings)
+    finally:
+        with _lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _url_locks[url_key]
+
+    with _lock:
+        _returned.add(path)
+    _evict(settings, keep=path)
+    return path
+
+
+def _fetch_locked(url, url_key, index_path, settings):
+    """fetch_video's body, run while holding the URL's lock. Returns the cached path."""
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            cached = os.path.join(settings["dir"], "objects", f.read().strip())
+        if os.path.exists(cached):
+            os.utime(cached)
+            print(f"[NSVideoFetch] Using cached download of {url}")
+            return cached
+    except OSError:
+        pass
+
+    part_path = os.path.join(settings["dir"], "partial", f"{url_key}.part")
+    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+    print(f"[NSVideoFetch] Downloading {url}...")
+    try:
+        with _telemetry.span("cdn", "video_download", endpoint=urlparse(url).netloc) as span:
+            digest, size = _download(url, part_path, settings)
+            span.set(bytes=size)
+    except Exception as e:
+        raise Exception(f"Failed to download video from {url}: {str(e)}")
+
+    name = f"{digest}{_extension(url)}"
+    path = os.path.join(settings["dir"], "objects", name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        os.remove(part_path)  # same content already cached under another URL
+    else:
+        os.replace(part_path, path)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(name)
+    print(f"[NSVideoFetch] Saved {size // 1024} KB to {path}")
+    return path
+
+
+def load_video(url):
+    """
+    Fetch a video URL and wrap the cached file as a ComfyUI VIDEO.
+
+    The VIDEO reads the downloaded file directly; nothing is decoded,
+    re-encoded or copied.
+
+    Args:
+        url: Video URL
+
+    Returns:
+        comfy_api VideoFromFile for the local file
+    """
+    from comfy_api.latest import InputImpl
+    return InputImpl.VideoFromFile(fetch_video(url))
+
+
+def _evict(settings, keep):
+    """
+    Delete least recently used cached videos until the cache is under its size cap.
+
+    Files returned earlier in this session are skipped, since a VIDEO that
+    ComfyUI still holds may read them again; the cap is a soft limit while
+    they add up to more. URL index entries pointing at a deleted file are
+    removed with it.
+    """
+    folder = os.path.join(settings["dir"], "objects")
+    entries = []
+    try:
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    with _lock:
+        pinned = set(_returned)
+    removed = set()
+    for _, size, path in sorted(entries):
+        if total <= settings["max_bytes"]:
+            break
+        if path == keep or path in pinned:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+            removed.add(os.path.basename(path))
+        except OSError:
+            pass
+    if removed:
+        _prune_index(settings, removed)
+
+
+def _prune_index(settings, names):
+    """Delete URL index entries that point at the given (evicted) object names."""
+    folder = os.path.join(settings["dir"], "urls")
+    try:
+        index_names = os.listdir(folder)
+    except OSError:
+        return
+    for index_name in index_names:
+        index_path = os.path.join(folder, index_name)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                if f.read().strip() in names:
+                    os.remove(index_path)
+        except OSError:
+            pass
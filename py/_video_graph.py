@@ -0,0 +1,294 @@
+# ABOUTME: Lazy VIDEO edit graph: chained NS video nodes append FFmpeg filter steps instead of encoding.
+# ABOUTME: The whole chain is compiled into one filter_complex and encoded once, when something needs the file.
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+
+from . import _config
+from ._bins import FFMPEG
+from ._video_io import materialize, probe
+
+try:
+    from comfy_api.latest import Input as _ComfyInput
+    _VideoBase = _ComfyInput.VideoInput
+except ImportError:  # outside ComfyUI
+    _VideoBase = object
+
+X264_PRESET = "fast"
+X264_CRF = 18
+
+
+def fuse_enabled():
+    """[Video] fuse_edits: chain NS video nodes lazily and encode once (default on)."""
+    return _config.get_bool("Video", "fuse_edits", True)
+
+
+def _remove_all(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+class Resources:
+    """
+    Temp files and folders an edit needs until it has been encoded.
+
+    They are deleted once no LazyVideo refers to them any more (or at exit).
+    """
+
+    def __init__(self, paths=()):
+        self.paths = list(paths)
+        weakref.finalize(self, _remove_all, self.paths)
+
+
+class Labels:
+    """
+    Filter pad names for one step, handed to its filter builders.
+
+    video / audio are the current streams ("[0:v]", "[v2]", ...; audio is
+    None if there is none yet). Each may be consumed once; use split/asplit
+    for more. The builder must end its chain in out_video / out_audio.
+    """
+
+    def __init__(self, video, audio, input_indices, step_index):
+        self.video = video
+        self.audio = audio
+        self.inputs = input_indices
+        self.out_video = f"[v{step_index}]"
+        self.out_audio = f"[a{step_index}]"
+        self._step = step_index
+
+    def input(self, n, kind="v"):
+        """Stream of the step's n-th extra input, e.g. "[2:a]"."""
+        return f"[{self.inputs[n]}:{kind}]"
+
+    def tmp(self, name):
+        """Pad name private to this step."""
+        return f"[s{self._step}_{name}]"
+
+
+class EditStep:
+    """
+    One node's edit: extra FFmpeg inputs plus a video and/or audio filter fragment.
+
+    Args:
+        name: Output file prefix when this is the last step (e.g. "captioned")
+        inputs: Argument lists for extra inputs, each ending in "-i", path
+        video: Callable(Labels) -> filter string ending in labels.out_video, or None
+        audio: Callable(Labels) -> filter string ending in labels.out_audio, or None
+        shortest: Stop the output at the shortest stream (for looped inputs)
+        resources: Temp paths to delete once the step is no longer needed
+    """
+
+    def __init__(self, name, inputs=(), video=None, audio=None, shortest=False, resources=()):
+        self.name = name
+        self.inputs = [list(args) for args in inputs]
+        self.video = video
+        self.audio = audio
+        self.shortest = shortest
+        self.resources = Resources(resources)
+
+
+class LazyVideo(_VideoBase):
+    """
+    A VIDEO that is a source file plus pending edit steps.
+
+    NS video nodes extend it with then() and return it without encoding.
+    Anything else that reads it (Save Video, a preview, a node calling
+    get_stream_source or save_to) triggers render(): the steps are compiled
+    into a single filter_complex over the source and encoded once. Video is
+    only re-encoded if some step filters it; audio-only chains copy it.
+    """
+
+    def __init__(self, source, steps=(), base_resources=None):
+        self.source = source
+        self.steps = tuple(steps)
+        self._base_resources = base_resources
+        info = probe(source) or {}
+        self._source_audio = info.get("audio") is not None
+        self._rendered = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_video(cls, video, log_prefix="[NSVideo]"):
+        """Wrap a VIDEO; an existing LazyVideo is extended as is, so its steps stay fused."""
+        if isinstance(video, LazyVideo):
+            return video
+        temp_files = []
+        source = materialize(video, temp_files, log_prefix)
+        return cls(source, base_resources=Resources(temp_files))
+
+    @classmethod
+    def from_path(cls, path):
+        return cls(path)
+
+    def then(self, step):
+        """New LazyVideo with one more step (this one is unchanged)."""
+        if step is None:
+            return self
+        return LazyVideo(self.source, self.steps + (step,), self._base_resources)
+
+    @property
+    def has_audio(self):
+        return self._source_audio or any(step.audio for step in self.steps)
+
+    @property
+    def has_audio_steps(self):
+        return any(step.audio for step in self.steps)
+
+    def _compile(self, audio_only=False):
+        """FFmpeg input arguments, filter_complex and -map / codec arguments for the chain."""
+        args = ["-i", self.source]
+        video, audio = "[0:v]", "[0:a]" if self._source_audio else None
+        parts = []
+        filtered_video = filtered_audio = shortest = False
+        next_input = 1
+        for index, step in enumerate(self.steps):
+            if audio_only and not step.audio:
+                continue
+            indices = []
+            for input_args in step.inputs:
+                args += input_args
+                indices.append(next_input)
+                next_input += 1
+            labels = Labels(video, audio, indices, index)
+            if step.video and not audio_only:
+                parts.append(step.video(labels))
+                video, filtered_video = labels.out_video, True
+            if step.audio:
+                parts.append(step.audio(labels))
+                audio, filtered_audio = labels.out_audio, True
+            shortest = shortest or step.shortest
+
+        if parts:
+            args += ["-filter_complex", ";".join(parts)]
+        output = []
+        if not audio_only:
+            if filtered_video:
+                output += ["-map", video, "-c:v", "libx264", "-preset", X264_PRESET,
+                           "-crf", str(X264_CRF), "-pix_fmt", "yuv420p"]
+            else:
+                output += ["-map", "0:v", "-c:v", "copy"]
+        if filtered_audio:
+            output += ["-map", audio] + (["-c:a", "aac"] if not audio_only else [])
+        elif audio is not None:
+            output += ["-map", "0:a"] + (["-c:a", "copy"] if not audio_only else [])
+        if shortest:
+            output.append("-shortest")
+        return args, output
+
+    def _run(self, args, output, output_path, what):
+        cmd = [FFMPEG, "-y"] + args + output + [output_path]
+        steps = ", ".join(step.name for step in self.steps) or "copy"
+        print(f"[NSVideoGraph] Encoding {what} in one pass ({steps})...")
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg edit graph error:\n{result.stderr[-1500:]}")
+
+    def render(self, output_path=None):
+        """
+        Encode the chain (once) and return the output path.
+
+        Args:
+            output_path: Where to write; defaults to the ComfyUI output folder,
+                named after the last step
+
+        Returns:
+            Path of the encoded MP4 (the source itself if there are no steps)
+        """
+        with self._lock:
+            if self._rendered is not None and output_path in (None, self._rendered):
+                return self._rendered
+            if not self.steps and output_path is None:
+                self._rendered = self.source
+                return self.source
+            if output_path is None:
+                import folder_paths
+                output_path = os.path.join(
+                    folder_paths.get_output_directory(),
+                    f"{self.steps[-1].name}_{int(time.time() * 1000)}.mp4",
+                )
+            args, output = self._compile()
+            self._run(args, output, output_path, "video")
+            self._rendered = output_path
+            return output_path
+
+    def render_audio(self, output_path):
+        """Write only the chain's audio (e.g. to a .wav), without touching the video stream."""
+        if not self.has_audio:
+            raise RuntimeError("Video has no audio")
+        args, output = self._compile(audio_only=True)
+        self._run(args, ["-vn"] + output, output_path, "audio")
+        return output_path
+
+    def audio_source(self, temp_files):
+        """A file with the chain's current audio: the source itself unless audio steps changed it."""
+        if not self.has_audio_steps:
+            return self.source
+        path = tempfile.NamedTemporaryFile(suffix=".wav", delete=False).name
+        temp_files.append(path)
+        return self.render_audio(path)
+
+    # VIDEO interface: everything that needs the pixels reads the encoded file
+
+    def _file_video(self):
+        from comfy_api.latest import InputImpl
+        return InputImpl.VideoFromFile(self.render())
+
+    def get_stream_source(self):
+        return self.render()
+
+    def get_components(self):
+        return self._file_video().get_components()
+
+    def save_to(self, path, *args, **kwargs):
+        return self._file_video().save_to(path, *args, **kwargs)
+
+    def get_dimensions(self):
+        # Steps overlay onto the source, so its size is the output size
+        from comfy_api.latest import InputImpl
+        return InputImpl.VideoFromFile(self.source).get_dimensions()
+
+    def get_duration(self):
+        return self._file_video().get_duration()
+
+    def __getattr__(self, name):
+        # Other VIDEO methods (container format, frame rate, ...) of newer ComfyUI versions
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._file_video(), name)
+
+
+def _delegate(name):
+    def method(self, *args, **kwargs):
+        return getattr(self._file_video(), name)(*args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+# Abstract VIDEO methods not implemented above are forwarded to the encoded file
+for _name in getattr(_VideoBase, "__abstractmethods__", ()):
+    if _name not in LazyVideo.__dict__:
+        setattr(LazyVideo, _name, _delegate(_name))
+LazyVideo.__abstractmethods__ = frozenset()
+
+
+def finish(video):
+    """
+    What an NS video node returns: the LazyVideo itself, or with
+    [Video] fuse_edits = false, the encoded file as a regular VIDEO.
+    """
+    if fuse_enabled() or not isinstance(video, LazyVideo):
+        return video
+    from comfy_api.latest import InputImpl
+    return InputImpl.VideoFromFile(video.render())
@@ -0,0 +1,165 @@
+# ABOUTME: Shared VIDEO -> local MP4 path helper for the video nodes.
+# ABOUTME: Reuses the file behind a VIDEO when it is already H.264 MP4, remuxes when only the container differs.
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+
+from ._bins import FFMPEG, FFPROBE
+
+# Containers ffprobe reports for MP4/MOV files
+MP4_FORMATS = {"mov", "mp4", "m4a", "3gp", "3g2", "mj2"}
+MP4_EXTENSIONS = {".mp4", ".m4v", ".mov"}
+# Pixel formats save_to(codec="h264") produces; anything else (10-bit, 4:4:4) is re-encoded like before
+PLAIN_PIX_FMTS = {"yuv420p", "yuvj420p"}
+# Audio codecs that can be copied into MP4 as they are
+MP4_AUDIO_CODECS = {"aac", "mp3", "alac"}
+
+_probe_cache = {}  # (path, size, mtime) -> probe result
+_lock = threading.Lock()
+
+
+def _source_path(video):
+    """
+    Path of the whole file a VIDEO reads from, or None if that can't be vouched for.
+
+    Only a LazyVideo (its encoded file) and a plain VideoFromFile whose trim
+    is known to be empty qualify. Subclasses, other VIDEO types and older
+    VideoFromFile versions without trim attributes go through save_to.
+    """
+    from ._video_graph import LazyVideo
+    if isinstance(video, LazyVideo):
+        return video.render()
+    try:
+        from comfy_api.latest import InputImpl
+    except ImportError:
+        return None
+    if type(video) is not InputImpl.VideoFromFile:
+        return None
+    # No public accessor for the trim; a VIDEO trimmed to part of its file can't stand in for it
+    trim = [getattr(video, f"_VideoFromFile__{name}", None) for name in ("start_time", "duration")]
+    if None in trim or any(trim):
+        return None
+    source = video.get_stream_source()
+    if not isinstance(source, str) or not os.path.isfile(source):
+        return None
+    return source
+
+
+def probe(path):
+    """
+    Container and stream parameters of a media file (one ffprobe call, cached per file version).
+
+    Returns:
+        {"formats": set of container names, "duration": seconds or None,
+        "video": codec, "profile", "level", "codec_tag", "extradata_hash",
+        "pix_fmt", "width", "height", "sar",
+        "frame_rate": r_frame_rate string, "time_base",
+        "audio": codec or None, "sample_rate", "channels", "channel_layout"},
+        or None if the file can't be probed
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    with _lock:
+        if key in _probe_cache:
+            return _probe_cache[key]
+
+    result = subprocess.run(
+        [FFPROBE, "-v", "error",
+         "-show_data_hash", "sha256",
+         "-show_entries",
+         "format=format_name,duration:stream=codec_type,codec_name,codec_tag_string,profile,level,"
+         "extradata_hash,pix_fmt,width,height,sample_aspect_ratio,r_frame_rate,time_base,"
+         "sample_rate,channels,channel_layout",
+         "-of", "json", path],
+        capture_output=True, text=True,
+    )
+    info = None
+    if result.returncode == 0:
+        try:
+            data = json.loads(result.stdout)
+            streams = data.get("streams", [])
+            video = next((s for s in streams if s.get("codec_type") == "video"), {})
+            audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+            audio = audio or {}
+            fmt = data.get("format", {})
+            info = {
+                "formats": set(fmt.get("format_name", "").split(",")),
+                "duration": float(fmt["duration"]) if fmt.get("duration") not in (None, "N/A") else None,
+                "video": video.get("codec_name"),
+                "profile": video.get("profile"),
+                "level": video.get("level"),
+                "codec_tag": video.get("codec_tag_string"),
+                # SPS/PPS: clips that differ here can't share one MP4 track
+                "extradata_hash": video.get("extradata_hash"),
+                "pix_fmt": video.get("pix_fmt"),
+                "width": video.get("width"),
+                "height": video.get("height"),
+                "sar": video.get("sample_aspect_ratio"),
+                "frame_rate": video.get("r_frame_rate"),
+                "time_base": video.get("time_base"),
+                "audio": audio.get("codec_name"),
+                "sample_rate": audio.get("sample_rate"),
+                "channels": audio.get("channels"),
+                "channel_layout": audio.get("channel_layout"),
+            }
+        except ValueError:
+            pass
+    with _lock:
+        _probe_cache[key] = info
+    return info
+
+
+def _remux(source, output_path, audio_codec):
+    """Copy the H.264 stream into an MP4 container; audio is copied if MP4 can hold it, else AAC."""
+    cmd = [FFMPEG, "-y", "-v", "error", "-i", source,
+           "-map", "0:v:0", "-map", "0:a:0?", "-c:v", "copy"]
+    cmd += ["-c:a", "copy"] if audio_codec in MP4_AUDIO_CODECS or audio_codec is None else ["-c:a", "aac", "-b:a", "192k"]
+    cmd += ["-movflags", "+faststart", output_path]
+    return subprocess.run(cmd, capture_output=True, text=True).returncode == 0
+
+
+def materialize(video, temp_files, log_prefix="[NSVideo]"):
+    """
+    Get an H.264 MP4 file for a VIDEO, doing as little work as possible.
+
+    - The VIDEO's own file is returned as is when it is already H.264
+      (4:2:0) in an MP4/MOV container: no copy, no encode.
+    - If only the container differs, the streams are copied into a temp MP4.
+    - Otherwise (in-memory videos, other codecs) the VIDEO is encoded with
+      save_to(format="mp4", codec="h264"), as the nodes did before.
+
+    Temp files created here are appended to temp_files for the caller's
+    cleanup. A reused source file is not, so callers must never write to
+    or delete the returned path themselves.
+
+    Args:
+        video: ComfyUI VIDEO
+        temp_files: Caller's list of files to delete when it is done
+        log_prefix: Prefix for log lines (the calling node's tag)
+
+    Returns:
+        Path of an H.264 MP4 with the video's content
+    """
+    source = _source_path(video)
+    if source is not None:
+        info = probe(source)
+        if info and info["video"] == "h264" and info["pix_fmt"] in PLAIN_PIX_FMTS:
+            if info["formats"] & MP4_FORMATS and os.path.splitext(source)[1].lower() in MP4_EXTENSIONS:
+                return source
+
+            remuxed = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
+            temp_files.append(remuxed)
+            if _remux(source, remuxed, info["audio"]):
+                print(f"{log_prefix} Remuxed input to MP4 without re-encoding")
+                return remuxed
+
+    path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
+    temp_files.append(path)
+    video.save_to(path, format="mp4", codec="h264")
+    return path
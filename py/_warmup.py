@@ -0,0 +1,105 @@
+# ABOUTME: Background warm-up run once when the extension loads, so the first queued job is as fast as later ones.
+# ABOUTME: Pre-connects the shared HTTP sessions to the provider hosts and imports the image libraries.
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from . import _config, _telemetry
+from ._http import get_session
+
+DEFAULT_CONNECTIONS = 2
+CONNECT_TIMEOUT = 10
+
+# (base URL override in config.ini, default base URL, [API] key, environment variable) of the API clients' sessions
+PROVIDERS = [
+    (("WaveSpeed", "base_url"), "https://api.wavespeed.ai", "api_key", "WAVESPEED_API_KEY"),
+    (None, "https://api.x.ai", "xai_api_key", "XAI_API_KEY"),
+]
+
+_started = False
+_lock = threading.Lock()
+
+
+def _api_key(config_key, env_var):
+    """The key a client node would use when its api_key input is left empty, or None."""
+    key = _config.get("API", config_key, "") or os.environ.get(env_var, "")
+    return key if key and not key.startswith("YOUR_") else None
+
+
+def _preimport():
+    """Import the modules the image paths load on first use, including PIL's format plugins."""
+    import numpy  # noqa: F401
+    from PIL import Image
+    Image.init()
+    from . import _images  # noqa: F401
+
+
+def _connect(session, url, connections):
+    """
+    Open up to `connections` pooled connections to a host.
+
+    The requests run concurrently so each one opens its own connection
+    (DNS, TCP and TLS); afterwards they stay in the session's pool. Any
+    response counts, the request only exists to establish the connection.
+    """
+    def head(_):
+        try:
+            session.head(url, timeout=CONNECT_TIMEOUT, allow_redirects=False)
+            return True
+        except Exception:
+            return False
+
+    with _telemetry.span("warmup", "connect", endpoint=urlparse(url).netloc) as span:
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            opened = sum(pool.map(head, range(connections)))
+        span.set(ok=opened > 0, connections=opened)
+    return opened
+
+
+def _run():
+    start = time.time()
+    try:
+        _preimport()
+    except Exception as e:
+        print(f"[NSWarmup] Pre-import failed: {e}")
+
+    connections = max(1, _config.get_int("Warmup", "connections", DEFAULT_CONNECTIONS))
+    targets = []
+    for override, base_url, config_key, env_var in PROVIDERS:
+        if override:
+            base_url = _config.get(*override, "") or base_url
+        api_key = _api_key(config_key, env_var)
+        if api_key:
+            targets.append((get_session(base_url, api_key), base_url))
+    # Extra hosts (e.g. the CDN serving outputs) go through the anonymous download session
+    for host in _config.get("Warmup", "hosts", "").split(","):
+        host = host.strip()
+        if host:
+            url = host if "://" in host else f"https://{host}"
+            targets.append((get_session(None), url))
+
+    opened = 0
+    if targets:
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            opened = sum(pool.map(lambda target: _connect(*target, connections), targets))
+    print(f"[NSWarmup] Ready in {time.time() - start:.1f}s "
+          f"({opened} connection(s) to {len(targets)} host(s))")
+
+
+def start():
+    """
+    Start the warm-up on a daemon thread, once per process.
+
+    Returns immediately, so ComfyUI startup is never held up; a host that
+    is slow or unreachable only delays the warm-up thread. Disabled with
+    [Warmup] enabled = false.
+    """
+    global _started
+    with _lock:
+        if _started or not _config.get_bool("Warmup", "enabled", True):
+            return
+        _started = True
+    threading.Thread(target=_run, name="neuralsins-warmup", daemon=True).start()
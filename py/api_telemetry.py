@@ -0,0 +1,89 @@
+# ABOUTME: Summarizes the API telemetry log (latency, queue time, polls, bytes, retries, cost) per endpoint
+# ABOUTME: Slowest endpoints come first, so the providers worth optimizing stand out
+
+import json
+
+from . import _telemetry
+
+
+def _cell(value):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+class NSAPITelemetry:
+    """
+    NS API Telemetry
+
+    Reads the JSONL log written by every remote API call (WaveSpeed, Grok,
+    the LLM providers, ElevenLabs, Submagic and downloads) and summarizes
+    it per provider, operation and endpoint, slowest total time first.
+    """
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "window_hours": ("FLOAT", {
+                    "default": 24.0,
+                    "min": 0.0,
+                    "max": 24.0 * 365,
+                    "step": 1.0,
+                    "tooltip": "Only summarize calls from the last N hours (0 = the whole log)"
+                }),
+            }
+        }
+
+    RETURN_TYPES = ("STRING", "STRING")
+    RETURN_NAMES = ("summary", "summary_json")
+    FUNCTION = "execute"
+    CATEGORY = "neuralsins/Utils"
+
+    @classmethod
+    def IS_CHANGED(s, **kwargs):
+        # The log grows between runs
+        return float("nan")
+
+    def execute(self, window_hours):
+        """
+        Summarize the telemetry log
+
+        Args:
+            window_hours: Time window in hours (0 for everything)
+
+        Returns:
+            (text table, JSON list of per-endpoint summaries)
+        """
+        rows = _telemetry.summarize(window_hours)
+        if not rows:
+            return (f"No telemetry recorded yet ({_telemetry.log_path()})", "[]")
+
+        columns = [
+            ("provider", "provider"), ("operation", "operation"), ("endpoint", "endpoint"),
+            ("count", "n"), ("errors", "err"), ("cached", "cached"),
+            ("total_seconds", "total s"), ("p50_seconds", "p50 s"), ("p95_seconds", "p95 s"),
+            ("mean_queue_seconds", "queue s"), ("mean_processing_seconds", "proc s"),
+            ("mean_polls", "polls"), ("retries", "retries"), ("bytes", "bytes"),
+            ("tokens_in", "tok in"), ("tokens_out", "tok out"), ("cost", "cost $"),
+        ]
+        table = [[header for _, header in columns]]
+        table += [[_cell(row[key]) for key, _ in columns] for row in rows]
+        widths = [max(len(line[i]) for line in table) for i in range(len(columns))]
+        lines = ["  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in table]
+
+        total_cost = sum(row["cost"] for row in rows if row["cost"] is not None)
+        unpriced = sum(row["unpriced"] for row in rows)
+        lines.append("")
+        lines.append(f"Estimated cost: ${total_cost:.2f} for models with a listed price  "
+                     f"(log: {_telemetry.log_path()})")
+        if unpriced:
+            lines.append(f"Not included: {unpriced} finished request(s) to models without a listed price")
+        return ("\n".join(lines), json.dumps(rows, indent=2))
+
+
+NODE_CLASS_MAPPINGS = {"NSAPITelemetry": NSAPITelemetry}
+
+NODE_DISPLAY_NAME_MAPPINGS = {"NSAPITelemetry": "NS API Telemetry"}
@@ -8,10 +8,9 @@ import json
 import shutil
 import time
 
-import folder_paths
-
 from . import _whisper_models
 from ._bins import FFMPEG, FFPROBE, NODE_BIN, NPX_BIN, NPM_BIN
+from ._video_graph import EditStep, LazyVideo, finish
 
 REMOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "remotion")
 REMOTION_BUNDLE = os.path.join(REMOTION_DIR, "bundle")
@@ -43,8 +42,8 @@ class NSCaptionOverlay:
             }
         }
 
-    RETURN_TYPES = ("VIDEO",)
-    RETURN_NAMES = ("video",)
+    RETURN_TYPES = ("VIDEO", "CAPTION_SETTINGS")
+    RETURN_NAMES = ("video", "caption_settings")
     FUNCTION = "execute"
     CATEGORY = "neuralsins/Video"
 
@@ -184,72 +183,90 @@ class NSCaptionOverlay:
             except OSError:
                 pass
 
-    def _overlay_sequence(self, input_path, frames_dir, fps, duration_in_frames, output_path):
-        """Composite PNG caption sequence onto original video with FFmpeg."""
+    def _overlay_inputs(self, frames_dir, fps, duration_in_frames):
+        """FFmpeg input arguments reading the rendered PNG caption sequence."""
         pad_len = len(str(duration_in_frames - 1))
         png_pattern = os.path.join(frames_dir, f"element-%0{pad_len}d.png")
-        cmd = [
-            FFMPEG, "-y",
-            "-i", input_path,
+        return [
             "-framerate", str(round(fps)),
             "-start_number", "0",
             "-i", png_pattern,
-            "-filter_complex", "[0:v][1:v]overlay=format=auto",
-            "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-            "-c:a", "copy",
-            "-shortest",
-            output_path,
         ]
-        print(f"[NSCaptionOverlay] Compositing {duration_in_frames} frames with FFmpeg...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg overlay error:\n{result.stderr[-1000:]}")
 
-    def _process_file(self, input_path, output_path, settings):
-        """Apply caption overlay to a video file on disk. Used by execute() and NSVideoConcatMulti."""
+    def _build_step(self, input_path, settings):
+        """
+        Render the caption sequence for a video and return the edit step compositing it.
+
+        Args:
+            input_path: Base video file (read for fps, size and duration)
+            settings: CAPTION_SETTINGS dict
+
+        Returns:
+            EditStep, or None if settings have no words
+        """
         self._ensure_deps()
 
         words = settings.get("words", [])
         if not words:
-            print("[NSCaptionOverlay] Empty words in settings, copying input")
-            shutil.copy2(input_path, output_path)
-            return
+            return None
 
-        frames_dir = None
-        try:
-            fps, width, height, duration = self._get_video_info(input_path)
-
-            duration_in_frames = int(round(duration * fps))
-
-            font_color = settings.get("fontColor", "")
-            highlight_color = settings.get("highlightColor", "")
-
-            props = {
-                "words": words,
-                "template": settings.get("template", "Hormozi"),
-                "animation": settings.get("animation", "Pop"),
-                "position": settings.get("position", 75),
-                "fontSize": settings.get("fontSize", 58),
-                "wordsPerLine": settings.get("wordsPerLine", 3),
-                "fontColor": font_color if isinstance(font_color, str) and font_color else None,
-                "highlightColor": highlight_color if isinstance(highlight_color, str) and highlight_color else None,
-                "emojis": settings.get("emojis", True),
-                "width": width,
-                "height": height,
-                "fps": round(fps),
-                "durationInFrames": duration_in_frames,
-            }
+        fps, width, height, duration = self._get_video_info(input_path)
+
+        duration_in_frames = int(round(duration * fps))
+
+        font_color = settings.get("fontColor", "")
+        highlight_color = settings.get("highlightColor", "")
+
+        props = {
+            "words": words,
+            "template": settings.get("template", "Hormozi"),
+            "animation": settings.get("animation", "Pop"),
+            "position": settings.get("position", 75),
+            "fontSize": settings.get("fontSize", 58),
+            "wordsPerLine": settings.get("wordsPerLine", 3),
+            "fontColor": font_color if isinstance(font_color, str) and font_color else None,
+            "highlightColor": highlight_color if isinstance(highlight_color, str) and highlight_color else None,
+            "emojis": settings.get("emojis", True),
+            "width": width,
+            "height": height,
+            "fps": round(fps),
+            "durationInFrames": duration_in_frames,
+        }
 
-            # Render transparent caption overlay as PNG sequence (fast — no video in Chrome)
-            frames_dir = tempfile.mkdtemp(prefix="caption_frames_")
+        # Render transparent caption overlay as PNG sequence (fast — no video in Chrome)
+        frames_dir = tempfile.mkdtemp(prefix="caption_frames_")
+        try:
             self._render_sequence(props, frames_dir)
+        except Exception:
+            shutil.rmtree(frames_dir, ignore_errors=True)
+            raise
+
+        # The frames are composited onto the video by FFmpeg; the folder is
+        # removed once the step has been encoded and dropped
+        return EditStep(
+            "captioned",
+            inputs=[self._overlay_inputs(frames_dir, fps, duration_in_frames)],
+            video=lambda labels: f"{labels.video}{labels.input(0)}overlay=format=auto{labels.out_video}",
+            shortest=True,
+            resources=[frames_dir],
+        )
+
+    def _process_file(self, input_path, output_path, settings):
+        """Apply caption overlay to a video file on disk."""
+        step = self._build_step(input_path, settings)
+        if step is None:
+            print("[NSCaptionOverlay] Empty words in settings, copying input")
+            shutil.copy2(input_path, output_path)
+            return
 
-            # Composite PNGs onto original video with FFmpeg
-            self._overlay_sequence(input_path, frames_dir, fps, duration_in_frames, output_path)
+        print("[NSCaptionOverlay] Compositing caption frames with FFmpeg...")
+        LazyVideo.from_path(input_path).then(step).render(output_path)
 
-        finally:
-            if frames_dir:
-                shutil.rmtree(frames_dir, ignore_errors=True)
+    def _clean_words(self, words):
+        """Clean punctuation artifacts from words (em dashes, quotes, etc.) and drop empty ones."""
+        for w in words:
+            w["word"] = w["word"].strip("\u2013\u2014-\"'\u00ab\u00bb\u201e\u201c\u201d")
+        return [w for w in words if w["word"]]
 
     def _transcribe(self, video_path, language, model_size):
         """Run Whisper on a video file and return word list."""
@@ -300,8 +317,6 @@ class NSCaptionOverlay:
                 pass
 
     def execute(self, video, caption_style=None, transcript=None):
-        from comfy_api.latest import InputImpl
-
         style = caption_style or {}
         template = style.get("template", "Hormozi")
         animation = style.get("animation", "Pop")
@@ -324,16 +339,14 @@ class NSCaptionOverlay:
             "fontColor": font_color if font_color else None,
             "highlightColor": highlight_color if highlight_color else None,
             "emojis": emojis,
+            # NSVideoConcatMulti transcribes each clip with these
+            "language": language,
+            "whisper_model": whisper_model,
         }
 
+        base = LazyVideo.from_video(video, "[NSCaptionOverlay]")
         temp_files = []
         try:
-            original_path = tempfile.NamedTemporaryFile(
-                suffix=".mp4", delete=False
-            ).name
-            temp_files.append(original_path)
-            video.save_to(original_path, format="mp4", codec="h264")
-
             # Use provided transcript or run internal whisper
             # Handle both dict (from Whisper nodes) and JSON string (from LLM nodes)
             if transcript:
@@ -353,28 +366,21 @@ class NSCaptionOverlay:
                 else:
                     transcript = None
             if not transcript:
-                words = self._transcribe(original_path, language, whisper_model)
+                # The audio as upstream nodes left it (music, sound effects)
+                words = self._transcribe(base.audio_source(temp_files), language, whisper_model)
 
             if not words:
                 print("[NSCaptionOverlay] No speech detected, returning original video")
-                return (video,)
-
-            # Clean punctuation artifacts from words (em dashes, quotes, etc.)
-            for w in words:
-                w["word"] = w["word"].strip("\u2013\u2014-\"'\u00ab\u00bb\u201e\u201c\u201d")
-            words = [w for w in words if w["word"]]
+                return (video, settings)
 
+            words = self._clean_words(words)
             settings["words"] = words
 
-            output_dir = folder_paths.get_output_directory()
-            output_path = os.path.join(
-                output_dir, f"captioned_{int(time.time())}.mp4"
-            )
-
-            self._process_file(original_path, output_path, settings)
+            step = self._build_step(base.source, settings)
 
-            print(f"[NSCaptionOverlay] Done → {output_path}")
-            return (InputImpl.VideoFromFile(output_path),)
+            # Encoded together with the rest of the chain when the video is used
+            print(f"[NSCaptionOverlay] Queued captions ({len(words)} words)")
+            return (finish(base.then(step)), settings)
 
         finally:
             for f in temp_files:
@@ -10,6 +10,7 @@ import time
 import requests
 
 from ._bins import FFMPEG, FFPROBE
+from ._video_io import materialize
 
 GOOGLE_STT_URL = "https://speech.googleapis.com/v1/speech"
 
@@ -196,9 +197,7 @@ class NSGoogleTranscribe:
         temp_files = []
 
         try:
-            video_path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
-            temp_files.append(video_path)
-            video.save_to(video_path, format="mp4", codec="h264")
+            video_path = materialize(video, temp_files, "[NSGoogleTranscribe]")
 
             flac_path = self._extract_audio_flac(video_path, temp_files)
             if flac_path is None:
@@ -5,6 +5,16 @@ import time
 import requests
 from typing import Dict, Any, Optional
 
+from .. import _result_cache, _telemetry
+from .._http import get_session, never_sent
+from .._polling import PollingStrategy, parse_retry_after
+from .._ratelimit import get_limiter
+from .._retry import FatalError, RetryableError, UnconfirmedError, call_with_retry, get_breaker, http_error
+
+
+# Consecutive failed status requests after which a video is given up on
+MAX_POLL_FAILURES = 8
+
 
 class GrokClient:
     """Client for interacting with xAI Grok API"""
@@ -20,11 +30,61 @@ class GrokClient:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = 600  # Default timeout for requests
+        # Shared keep-alive session: connections are reused across nodes and polls
+        self.session = get_session(base_url, api_key)
+        # Shared request rate / concurrency budget for this API key
+        self.limiter = get_limiter("grok", api_key)
+        # Seconds from the last response's Retry-After header, if any
+        self.last_retry_after = None
+        
+    def _send(self, method: str, url: str, timeout: int, idempotent: bool = True, **kwargs) -> Dict[str, Any]:
+        """
+        Send one request over the shared session and classify failures
+        
+        429/5xx responses and dropped connections raise RetryableError,
+        other error responses raise FatalError. A non-idempotent request is
+        only retried on a 429 or when it never reached the server; any other
+        failure raises UnconfirmedError so a generation is never resubmitted.
+        
+        Returns:
+            API response data
+        """
+        try:
+            with self.limiter.request(poll=method == "get"):
+                response = getattr(self.session, method)(url, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            if idempotent or never_sent(e):
+                raise RetryableError(f"API request failed: {str(e)}")
+            raise UnconfirmedError(f"API request failed, not resent to avoid a duplicate generation: {str(e)}")
+        
+        self.last_retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            self.limiter.throttled(self.last_retry_after)
+        if response.status_code >= 400:
+            message = f"API request failed: {response.status_code} {response.reason}: {response.text[:500]}"
+            if not idempotent and response.status_code >= 500:
+                raise UnconfirmedError(f"{message} (not resent to avoid a duplicate generation)",
+                                       status=response.status_code)
+            raise http_error(response.status_code, message, self.last_retry_after)
+        
+        try:
+            return response.json()
+        except ValueError:
+            message = f"API returned a non-JSON response (HTTP {response.status_code})"
+            if not idempotent:
+                raise UnconfirmedError(f"{message}, not resent to avoid a duplicate generation",
+                                       status=response.status_code)
+            raise RetryableError(message, status=response.status_code, retry_after=self.last_retry_after)
         
     def post(self, endpoint: str, data: Dict[str, Any], timeout: Optional[int] = None) -> Dict[str, Any]:
         """
         Make a POST request to the Grok API
         
+        Requests with an explicit seed are served from the on-disk result
+        cache when the same request has completed before. Rate limits,
+        server errors and dropped connections are retried with backoff
+        behind a per-endpoint circuit breaker.
+        
         Args:
             endpoint: API endpoint path
             data: Request payload
@@ -34,21 +94,29 @@ class GrokClient:
             API response data
         """
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         
         timeout = timeout or self.timeout
         
-        try:
-            response = requests.post(url, json=data, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"API request failed: {str(e)}")
+        # Requests with an explicit seed are deterministic: serve repeats from the result cache
+        key = _result_cache.cache_key(url, data)
+        cached = _result_cache.get_result(key)
+        if cached is not None:
+            print(f"Result cache hit for {endpoint}, skipping API request")
+            _telemetry.record("grok", "request", endpoint=endpoint, cached=True, seconds=0.0, ok=True)
+            return cached
+        
+        with _telemetry.span("grok", "request", endpoint=endpoint, model=data.get("model")) as span:
+            result = call_with_retry(
+                lambda: self._send("post", url, timeout, idempotent=False, json=data),
+                breaker=get_breaker(url),
+                label=f"Request to {endpoint}",
+            )
+            if isinstance(result, dict) and isinstance(result.get("data"), list):
+                span.set(outputs=len(result["data"]))
+        # Only finished generations are cached; async submits just return a request ID
+        if key and isinstance(result, dict) and result.get("data"):
+            _result_cache.put_result(key, result)
+        return result
     
     def get(self, endpoint: str, timeout: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -62,58 +130,67 @@ class GrokClient:
             API response data
         """
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
         
         timeout = timeout or self.timeout
         
-        try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"API request failed: {str(e)}")
+        return self._send("get", url, timeout)
     
-    def wait_for_video(self, request_id: str, polling_interval: int = 5, timeout: int = 600) -> Dict[str, Any]:
+    def wait_for_video(self, request_id: str, polling_interval: float = 5, timeout: int = 600,
+                       model: str = "grok-imagine-video") -> Dict[str, Any]:
         """
-        Poll for video generation completion
+        Poll for video generation completion on an adaptive schedule
         
         Args:
             request_id: Video generation request ID
-            polling_interval: Time between polls in seconds
+            polling_interval: Shortest time between polls in seconds
             timeout: Maximum time to wait in seconds
+            model: Model key for the expected-duration prior
             
         Returns:
             Video result when complete
         """
+        with _telemetry.span("grok", "task", endpoint=model, task_id=request_id) as span:
+            return self._poll_video(request_id, polling_interval, timeout, model, span)
+    
+    def _poll_video(self, request_id, polling_interval, timeout, model, span):
         start_time = time.time()
+        strategy = PollingStrategy(model, base_interval=polling_interval)
         endpoint = f"/v1/videos/{request_id}"
         
+        failures = 0
+        
         while True:
             elapsed = time.time() - start_time
             if elapsed > timeout:
                 raise Exception(f"Video generation timed out after {timeout} seconds")
             
+            span.count("polls")
             try:
                 result = self.get(endpoint, timeout=30)
-                
+            except FatalError:
+                # Bad request ID, revoked key, ...: polling again won't help
+                raise
+            except Exception as e:
+                # Transient: retry on the same schedule, but not forever
+                failures += 1
+                if failures >= MAX_POLL_FAILURES:
+                    raise RetryableError(
+                        f"Video status unavailable after {failures} attempts in a row: {str(e)}"
+                    )
+            else:
+                failures = 0
                 status = result.get("status", "")
                 
                 if status == "completed" or status == "success":
+                    strategy.completed(time.time() - start_time)
                     return result
                 elif status == "failed" or status == "error":
                     error_msg = result.get("error", result.get("message", "Unknown error"))
-                    raise Exception(f"Video generation failed: {error_msg}")
+                    raise FatalError(f"Video generation failed: {error_msg}")
                 
                 # Task still processing, wait and retry
                 print(f"Video generation status: {status}...")
-                time.sleep(polling_interval)
-                
-            except Exception as e:
-                if "timed out" in str(e):
-                    raise
-                # For other errors, retry after interval
-                time.sleep(polling_interval)
+            
+            delay = strategy.next_delay(time.time() - start_time, self.last_retry_after)
+            remaining = timeout - (time.time() - start_time)
+            time.sleep(max(0.0, min(delay, remaining + 0.01)))
@@ -3,6 +3,7 @@
 
 from .grok_api.client import GrokClient
 from .grok_api.utils import imageurl2tensor
+from ._images import BATCH_STRATEGY_INPUT
 
 
 class NSGrokImagineImage:
@@ -85,6 +86,7 @@ class NSGrokImagineImage:
                         "tooltip": "Optional: Image URL for editing (leave empty for text-to-image)",
                     },
                 ),
+                "batch_strategy": BATCH_STRATEGY_INPUT,
             }
         }
     
@@ -101,6 +103,7 @@ class NSGrokImagineImage:
         aspect_ratio,
         num_images,
         image_url="",
+        batch_strategy="resize",
     ):
         """
         Execute Grok Imagine image generation or editing
@@ -112,6 +115,7 @@ class NSGrokImagineImage:
             aspect_ratio: Image aspect ratio
             num_images: Number of images to generate
             image_url: Optional image URL for editing
+            batch_strategy: How to batch images of different sizes (resize, pad or error)
             
         Returns:
             Generated or edited image tensor
@@ -141,7 +145,7 @@ class NSGrokImagineImage:
                 
                 if image_urls:
                     print(f"Generated {len(image_urls)} image(s)")
-                    return (imageurl2tensor(image_urls),)
+                    return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                 else:
                     raise Exception("No image URLs in response")
             else:
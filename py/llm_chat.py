@@ -9,6 +9,8 @@ import requests
 from PIL import Image
 from torch import Tensor
 
+from . import _telemetry
+
 # Latest Claude models (as of 2026)
 # Note: All these models support "Extended thinking" capability for deep reasoning
 claude_models = [
@@ -81,6 +83,20 @@ def pil2base64(image: Image.Image):
     return img_str
 
 
+def post_chat(provider: str, model: str, url: str, data: dict, headers: dict, timeout: int,
+              usage_key: str, input_key: str, output_key: str):
+    """POST a chat request, logging latency, response size and token usage to the telemetry log."""
+    with _telemetry.span(provider, "chat", endpoint=model) as span:
+        response = requests.post(url, json=data, headers=headers, timeout=timeout)
+        span.set(ok=response.status_code == 200, status=response.status_code, bytes=len(response.content))
+        try:
+            usage = response.json().get(usage_key) or {}
+        except (ValueError, AttributeError):
+            usage = {}
+        span.set(tokens_in=usage.get(input_key), tokens_out=usage.get(output_key))
+    return response
+
+
 def call_claude_api(
     api_key: str,
     model: str,
@@ -144,7 +160,8 @@ def call_claude_api(
     }
 
     # Make request
-    response = requests.post(url, json=data, headers=headers, timeout=timeout)
+    response = post_chat("anthropic", model, url, data, headers, timeout,
+                         "usage", "input_tokens", "output_tokens")
 
     # Handle errors
     if response.status_code != 200:
@@ -228,7 +245,8 @@ def call_gemini_api(
     headers = {"x-goog-api-key": api_key, "content-type": "application/json"}
 
     # Make request
-    response = requests.post(url, json=data, headers=headers, timeout=timeout)
+    response = post_chat("gemini", model, url, data, headers, timeout,
+                         "usageMetadata", "promptTokenCount", "candidatesTokenCount")
 
     # Handle errors
     if response.status_code != 200:
@@ -329,7 +347,8 @@ def call_grok_api(
     }
     
     # Make request
-    response = requests.post(url, json=data, headers=headers, timeout=timeout)
+    response = post_chat("xai", model, url, data, headers, timeout,
+                         "usage", "prompt_tokens", "completion_tokens")
     
     # Handle errors
     if response.status_code != 200:
@@ -4,16 +4,16 @@
 import os
 import subprocess
 import tempfile
-import time
 
 import wave
 import struct
 
 import torch
 import requests
-import folder_paths
 
+from . import _telemetry
 from ._bins import FFMPEG, FFPROBE
+from ._video_graph import EditStep, LazyVideo, finish
 
 ELEVENLABS_MUSIC_URL = "https://api.elevenlabs.io/v1/music"
 
@@ -47,15 +47,6 @@ class NSMusic:
     FUNCTION = "execute"
     CATEGORY = "neuralsins/Video"
 
-    def _has_audio(self, path):
-        """Check if a video file has an audio stream."""
-        result = subprocess.run(
-            [FFPROBE, "-v", "error", "-select_streams", "a",
-             "-show_entries", "stream=codec_type", "-of", "csv=p=0", path],
-            capture_output=True, text=True
-        )
-        return result.stdout.strip() != ""
-
     def _get_video_duration(self, path):
         """Return video duration in seconds as a float."""
         result = subprocess.run(
@@ -94,28 +85,56 @@ class NSMusic:
             "Content-Type": "application/json",
         }
 
-        response = requests.post(
-            ELEVENLABS_MUSIC_URL,
-            json=payload,
-            headers=headers,
-            timeout=120,
-        )
-
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"ElevenLabs API error {response.status_code}: {response.text[:300]}"
+        with _telemetry.span("elevenlabs", "music", endpoint=ELEVENLABS_MUSIC_URL) as span:
+            response = requests.post(
+                ELEVENLABS_MUSIC_URL,
+                json=payload,
+                headers=headers,
+                timeout=120,
             )
 
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"ElevenLabs API error {response.status_code}: {response.text[:300]}"
+                )
+            span.set(bytes=len(response.content))
+
         tmp = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
         temp_files.append(tmp.name)
         tmp.write(response.content)
         tmp.close()
         return tmp.name
 
+    def _mix_filter(self, labels, volume, duck, duck_ratio):
+        """Audio filter fragment mixing the music (step input 0) under labels.audio."""
+        music = labels.input(0, "a")
+        if labels.audio is None:
+            return f"{music}volume={volume:.4f}{labels.out_audio}"
+        if duck:
+            speech, sc, level, ducked = (labels.tmp(n) for n in ("speech", "sc", "music", "ducked"))
+            return (
+                f"{labels.audio}asplit=2{speech}{sc};"
+                f"{music}volume={volume:.4f}{level};"
+                f"{level}{sc}sidechaincompress=threshold=0.02:ratio={duck_ratio:.1f}:attack=100:release=800{ducked};"
+                f"{speech}{ducked}amix=inputs=2:duration=first:normalize=0{labels.out_audio}"
+            )
+        level = labels.tmp("m")
+        return (
+            f"{music}volume={volume:.4f}{level};"
+            f"{labels.audio}{level}amix=inputs=2:duration=first:normalize=0{labels.out_audio}"
+        )
+
+    def _ducked_music_filter(self, labels, volume, duck_ratio):
+        """Audio pin: ducked music only, no speech mixed in."""
+        level = labels.tmp("music")
+        return (
+            f"{labels.input(0, 'a')}volume={volume:.4f}{level};"
+            f"{level}{labels.audio}sidechaincompress=threshold=0.02:ratio={duck_ratio:.1f}:attack=100:release=800"
+            f"{labels.out_audio}"
+        )
+
     def execute(self, music_prompt, api_key, duration_sec=30.0, video=None,
                 volume=0.3, force_instrumental=True, duck=True, duck_ratio=4.0, seed=0):
-        from comfy_api.latest import InputImpl
-
         if not music_prompt.strip():
             print("[NSMusic] Empty music_prompt — returning unchanged")
             return (video, None)
@@ -124,13 +143,10 @@ class NSMusic:
         try:
             # Determine duration: from video if connected, else from duration_sec
             if video is not None:
-                video_tmp = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-                temp_files.append(video_tmp.name)
-                video_tmp.close()
-                video.save_to(video_tmp.name, format="mp4", codec="h264")
-                duration_s = self._get_video_duration(video_tmp.name)
+                base = LazyVideo.from_video(video, "[NSMusic]")
+                duration_s = self._get_video_duration(base.source)
             else:
-                video_tmp = None
+                base = None
                 duration_s = duration_sec
 
             duration_ms = int(duration_s * 1000)
@@ -141,13 +157,16 @@ class NSMusic:
                 duration_ms = MAX_MS
                 print("[NSMusic] Duration capped at 600s — music will end before video")
 
+            # The music file lives as long as the edit step that mixes it in
+            step_files = []
             print(f"[NSMusic] Generating music ({duration_ms}ms): \"{music_prompt[:80]}\"")
             music_path = self._call_elevenlabs_music(
-                api_key, music_prompt.strip(), duration_ms, force_instrumental, seed, temp_files
+                api_key, music_prompt.strip(), duration_ms, force_instrumental, seed,
+                step_files if base is not None else temp_files
             )
 
             # No video — return leveled music as audio only (no speech to duck against)
-            if video_tmp is None:
+            if base is None:
                 music_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
                 temp_files.append(music_wav.name)
                 music_wav.close()
@@ -158,63 +177,33 @@ class NSMusic:
                 print("[NSMusic] No video input — returning audio only")
                 return (None, self._wav_to_audio_out(music_wav.name))
 
-            has_original_audio = self._has_audio(video_tmp.name)
-            print(f"[NSMusic] Video has audio: {has_original_audio}")
-
-            if has_original_audio:
-                if duck:
-                    video_filter = (
-                        f"[0:a]asplit=2[speech][sc];"
-                        f"[1:a]volume={volume:.4f}[music];"
-                        f"[music][sc]sidechaincompress=threshold=0.02:ratio={duck_ratio:.1f}:attack=100:release=800[ducked];"
-                        f"[speech][ducked]amix=inputs=2:duration=first:normalize=0[outa]"
-                    )
-                    # Audio pin: ducked music only, no speech mixed in
-                    audio_filter = (
-                        f"[1:a]volume={volume:.4f}[music];"
-                        f"[music][0:a]sidechaincompress=threshold=0.02:ratio={duck_ratio:.1f}:attack=100:release=800[outa]"
-                    )
-                else:
-                    video_filter = (
-                        f"[1:a]volume={volume:.4f}[m];"
-                        f"[0:a][m]amix=inputs=2:duration=first:normalize=0[outa]"
-                    )
-                    audio_filter = None
-            else:
-                video_filter = f"[1:a]volume={volume:.4f}[outa]"
-                audio_filter = None
-
-            output_dir = folder_paths.get_output_directory()
-            output_path = os.path.join(output_dir, f"music_{int(time.time())}.mp4")
-
-            cmd = (
-                [FFMPEG, "-y", "-i", video_tmp.name, "-i", music_path]
-                + ["-filter_complex", video_filter]
-                + ["-map", "0:v", "-map", "[outa]"]
-                + ["-c:v", "copy", "-c:a", "aac"]
-                + [output_path]
-            )
+            try:
+                has_original_audio = base.has_audio
+                print(f"[NSMusic] Video has audio: {has_original_audio}")
 
-            print("[NSMusic] Mixing with FFmpeg...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg error: {result.stderr[-500:]}")
+                music_input = ["-i", music_path]
+                step = EditStep(
+                    "music",
+                    inputs=[music_input],
+                    audio=lambda labels: self._mix_filter(labels, volume, duck, duck_ratio),
+                    resources=step_files,
+                )
+            except Exception:
+                os.unlink(music_path)
+                raise
 
             # Build audio output
             audio_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
             temp_files.append(audio_wav.name)
             audio_wav.close()
-            if audio_filter:
-                # Ducked music only (no speech) for the audio pin
-                cmd_audio = (
-                    [FFMPEG, "-y", "-i", video_tmp.name, "-i", music_path]
-                    + ["-filter_complex", audio_filter]
-                    + ["-map", "[outa]", "-vn"]
-                    + [audio_wav.name]
+            if has_original_audio and duck:
+                # Ducked music only (no speech) for the audio pin, keyed by the chain's audio so far
+                pin = EditStep(
+                    "music",
+                    inputs=[music_input],
+                    audio=lambda labels: self._ducked_music_filter(labels, volume, duck_ratio),
                 )
-                result_audio = subprocess.run(cmd_audio, capture_output=True, text=True)
-                if result_audio.returncode != 0:
-                    raise RuntimeError(f"FFmpeg audio error: {result_audio.stderr[-500:]}")
+                base.then(pin).render_audio(audio_wav.name)
             else:
                 # No ducking — just apply volume to music
                 subprocess.run(
@@ -222,8 +211,9 @@ class NSMusic:
                     capture_output=True, check=True
                 )
 
-            print(f"[NSMusic] Done -> {output_path}")
-            return (InputImpl.VideoFromFile(output_path), self._wav_to_audio_out(audio_wav.name))
+            # The video is mixed together with the rest of the chain when it is used
+            print("[NSMusic] Queued music mix")
+            return (finish(base.then(step)), self._wav_to_audio_out(audio_wav.name))
 
         finally:
             for f in temp_files:
@@ -4,14 +4,12 @@
 import os
 import re
 import json
-import subprocess
 import tempfile
-import time
 
 import requests
-import folder_paths
 
-from ._bins import FFMPEG, FFPROBE
+from . import _telemetry
+from ._video_graph import EditStep, LazyVideo, finish
 
 ELEVENLABS_SFX_URL = "https://api.elevenlabs.io/v1/sound-generation"
 
@@ -42,15 +40,6 @@ class NSSoundEffects:
     FUNCTION = "execute"
     CATEGORY = "neuralsins/Video"
 
-    def _has_audio(self, path):
-        """Check if a video file has an audio stream."""
-        result = subprocess.run(
-            [FFPROBE, "-v", "error", "-select_streams", "a",
-             "-show_entries", "stream=codec_type", "-of", "csv=p=0", path],
-            capture_output=True, text=True
-        )
-        return result.stdout.strip() != ""
-
     def _call_elevenlabs(self, api_key, sfx_text, duration, prompt_influence, temp_files):
         """Call ElevenLabs sound-generation API, return path to downloaded MP3."""
         payload = {"text": sfx_text, "prompt_influence": prompt_influence}
@@ -63,54 +52,53 @@ class NSSoundEffects:
             "Content-Type": "application/json",
         }
 
-        response = requests.post(
-            ELEVENLABS_SFX_URL,
-            json=payload,
-            headers=headers,
-            timeout=60,
-        )
-
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"ElevenLabs API error {response.status_code}: {response.text[:300]}"
+        with _telemetry.span("elevenlabs", "sound_effects", endpoint=ELEVENLABS_SFX_URL) as span:
+            response = requests.post(
+                ELEVENLABS_SFX_URL,
+                json=payload,
+                headers=headers,
+                timeout=60,
             )
 
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"ElevenLabs API error {response.status_code}: {response.text[:300]}"
+                )
+            span.set(bytes=len(response.content))
+
         tmp = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
         temp_files.append(tmp.name)
         tmp.write(response.content)
         tmp.close()
         return tmp.name
 
-    def _build_filter_complex(self, cues, has_original_audio, global_volume):
-        """Build FFmpeg filter_complex string for mixing SFX at precise timestamps."""
+    def _build_filter_complex(self, cues, labels, global_volume):
+        """Build the filter graph fragment mixing SFX (step inputs) at precise timestamps."""
         parts = []
 
         for i, cue in enumerate(cues):
             delay_ms = int(float(cue["time"]) * 1000)
             cue_vol = float(cue.get("volume", 1.0)) * global_volume
-            # Input index i+1 because index 0 is the video
             parts.append(
-                f"[{i + 1}:a]adelay={delay_ms}|{delay_ms},volume={cue_vol:.4f}[s{i}]"
+                f"{labels.input(i, 'a')}adelay={delay_ms}|{delay_ms},volume={cue_vol:.4f}{labels.tmp(i)}"
             )
 
-        sfx_labels = "".join(f"[s{i}]" for i in range(len(cues)))
+        sfx_labels = "".join(labels.tmp(i) for i in range(len(cues)))
 
-        if has_original_audio:
+        if labels.audio is not None:
             num_inputs = len(cues) + 1
             parts.append(
-                f"[0:a]{sfx_labels}amix=inputs={num_inputs}:duration=first:normalize=0[outa]"
+                f"{labels.audio}{sfx_labels}amix=inputs={num_inputs}:duration=first:normalize=0{labels.out_audio}"
             )
         else:
             num_inputs = len(cues)
             parts.append(
-                f"{sfx_labels}amix=inputs={num_inputs}:duration=longest:normalize=0[outa]"
+                f"{sfx_labels}amix=inputs={num_inputs}:duration=longest:normalize=0{labels.out_audio}"
             )
 
         return ";".join(parts)
 
     def execute(self, video, sfx_cues, api_key, volume=0.8, prompt_influence=0.7):
-        from comfy_api.latest import InputImpl
-
         # Strip markdown fences if present
         text = sfx_cues.strip()
         fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
@@ -148,58 +136,34 @@ class NSSoundEffects:
 
         print(f"[NSSoundEffects] Processing {len(valid_cues)} SFX cue(s)...")
 
-        temp_files = []
-        try:
-            # Save video to temp file
-            video_tmp = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-            temp_files.append(video_tmp.name)
-            video_tmp.close()
-            video.save_to(video_tmp.name, format="mp4", codec="h264")
-
-            has_original_audio = self._has_audio(video_tmp.name)
-            print(f"[NSSoundEffects] Video has audio: {has_original_audio}")
+        base = LazyVideo.from_video(video, "[NSSoundEffects]")
+        print(f"[NSSoundEffects] Video has audio: {base.has_audio}")
 
-            # Generate each SFX via ElevenLabs
-            sfx_paths = []
+        # Generate each SFX via ElevenLabs; the files live as long as the edit step
+        sfx_paths = []
+        try:
             for i, cue in enumerate(valid_cues):
                 duration = cue.get("duration")
                 print(f"[NSSoundEffects] Generating SFX {i + 1}/{len(valid_cues)}: \"{cue['sfx'][:60]}\"")
-                path = self._call_elevenlabs(api_key, cue["sfx"], duration, prompt_influence, temp_files)
-                sfx_paths.append(path)
-
-            # Build FFmpeg command
-            filter_complex = self._build_filter_complex(valid_cues, has_original_audio, volume)
-
-            inputs = ["-i", video_tmp.name]
-            for sfx_path in sfx_paths:
-                inputs += ["-i", sfx_path]
-
-            output_dir = folder_paths.get_output_directory()
-            output_path = os.path.join(output_dir, f"sfx_{int(time.time())}.mp4")
-
-            cmd = (
-                [FFMPEG, "-y"]
-                + inputs
-                + ["-filter_complex", filter_complex]
-                + ["-map", "0:v", "-map", "[outa]"]
-                + ["-c:v", "copy", "-c:a", "aac"]
-                + [output_path]
-            )
-
-            print(f"[NSSoundEffects] Mixing with FFmpeg...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg error: {result.stderr[-500:]}")
+                self._call_elevenlabs(api_key, cue["sfx"], duration, prompt_influence, sfx_paths)
 
-            print(f"[NSSoundEffects] Done -> {output_path}")
-            return (InputImpl.VideoFromFile(output_path),)
-
-        finally:
-            for f in temp_files:
+            step = EditStep(
+                "sfx",
+                inputs=[["-i", path] for path in sfx_paths],
+                audio=lambda labels: self._build_filter_complex(valid_cues, labels, volume),
+                resources=sfx_paths,
+            )
+        except Exception:
+            for f in sfx_paths:
                 try:
                     os.unlink(f)
                 except OSError:
                     pass
+            raise
+
+        # Mixed together with the rest of the chain when the video is used
+        print("[NSSoundEffects] Queued SFX mix")
+        return (finish(base.then(step)),)
 
 
 NODE_CLASS_MAPPINGS = {"NSSoundEffects": NSSoundEffects}
@@ -3,12 +3,14 @@
 
 import configparser
 import os
-import tempfile
 import time
 
 import requests
 import folder_paths
 
+from . import _telemetry
+from ._video_io import materialize
+
 API_BASE = "https://api.submagic.co/v1"
 
 SUBMAGIC_TEMPLATES = [
@@ -77,7 +79,8 @@ class NSSubmagicCaptions:
 
     def _upload(self, api_key, file_path, language, template, magic_zooms, magic_brolls):
         """Upload video to Submagic and return project ID."""
-        with open(file_path, "rb") as f:
+        with _telemetry.span("submagic", "upload", endpoint="/projects/upload",
+                             bytes=os.path.getsize(file_path)), open(file_path, "rb") as f:
             resp = requests.post(
                 f"{API_BASE}/projects/upload",
                 headers={"x-api-key": api_key},
@@ -98,10 +101,15 @@ class NSSubmagicCaptions:
 
     def _poll(self, api_key, project_id, field, target, timeout=600):
         """Poll project until a field reaches the target value."""
+        with _telemetry.span("submagic", "processing", endpoint=field, project_id=project_id) as span:
+            return self._poll_until(api_key, project_id, field, target, timeout, span)
+
+    def _poll_until(self, api_key, project_id, field, target, timeout, span):
         headers = {"x-api-key": api_key}
         start = time.time()
 
         while time.time() - start < timeout:
+            span.count("polls")
             resp = requests.get(f"{API_BASE}/projects/{project_id}", headers=headers)
             if resp.status_code != 200:
                 raise RuntimeError(f"Submagic poll failed ({resp.status_code}): {resp.text[:500]}")
@@ -125,21 +133,24 @@ class NSSubmagicCaptions:
 
     def _export(self, api_key, project_id):
         """Trigger export/render of the project."""
-        resp = requests.post(
-            f"{API_BASE}/projects/{project_id}/export",
-            headers={"x-api-key": api_key, "Content-Type": "application/json"},
-            json={},
-        )
-        if resp.status_code != 200:
-            raise RuntimeError(f"Submagic export failed ({resp.status_code}): {resp.text[:500]}")
+        with _telemetry.span("submagic", "export", endpoint="/projects/export"):
+            resp = requests.post(
+                f"{API_BASE}/projects/{project_id}/export",
+                headers={"x-api-key": api_key, "Content-Type": "application/json"},
+                json={},
+            )
+            if resp.status_code != 200:
+                raise RuntimeError(f"Submagic export failed ({resp.status_code}): {resp.text[:500]}")
 
     def _download(self, url, output_path):
         """Download video from URL to local file."""
-        resp = requests.get(url, stream=True)
-        resp.raise_for_status()
-        with open(output_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with _telemetry.span("submagic", "download", endpoint="result") as span:
+            resp = requests.get(url, stream=True)
+            resp.raise_for_status()
+            with open(output_path, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=8192):
+                    f.write(chunk)
+            span.set(bytes=os.path.getsize(output_path))
 
     def execute(self, video, language, template, api_key="", magic_zooms=False, magic_brolls=False):
         from comfy_api.latest import InputImpl
@@ -148,16 +159,12 @@ class NSSubmagicCaptions:
         temp_files = []
 
         try:
-            # Save input video to temp file
-            temp_in = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-            temp_files.append(temp_in.name)
-            temp_in.close()
-            video.save_to(temp_in.name, format="mp4", codec="h264")
+            video_path = materialize(video, temp_files, "[NSSubmagicCaptions]")
 
             # Upload to Submagic
             print("[NSSubmagicCaptions] Uploading...")
             project_id = self._upload(
-                resolved_key, temp_in.name, language, template, magic_zooms, magic_brolls
+                resolved_key, video_path, language, template, magic_zooms, magic_brolls
             )
             print(f"[NSSubmagicCaptions] Project: {project_id}")
 
@@ -9,6 +9,7 @@ import json
 import torch
 
 from ._bins import FFMPEG, FFPROBE
+from ._video_io import materialize
 
 
 class NSGetVideoComponents:
@@ -33,9 +34,7 @@ class NSGetVideoComponents:
     def execute(self, video):
         temp_files = []
         try:
-            video_path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
-            temp_files.append(video_path)
-            video.save_to(video_path, format="mp4", codec="h264")
+            video_path = materialize(video, temp_files, "[NSGetVideoComponents]")
 
             fps = self._get_fps(video_path)
             audio = self._extract_audio(video_path, temp_files)
@@ -124,9 +123,7 @@ class NSCreateVideo:
 
         temp_files = []
         try:
-            video_path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
-            temp_files.append(video_path)
-            video.save_to(video_path, format="mp4", codec="h264")
+            video_path = materialize(video, temp_files, "[NSCreateVideo]")
 
             inputs = [FFMPEG, "-y", "-i", video_path]
             filter_parts = []
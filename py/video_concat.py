@@ -4,12 +4,15 @@
 import os
 import subprocess
 import tempfile
+import threading
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 import folder_paths
 
-from ._bins import FFMPEG, FFPROBE
+from . import _config
+from ._bins import FFMPEG
+from ._video_io import materialize, probe
 
 # Quartic ease-out slideup for TikTok-style swipe.
 # Fast start, long smooth deceleration — like a real finger flick.
@@ -25,6 +28,28 @@ _EASED_SLIDEUP_EXPR = (
     "))"
 )
 
+# Stream parameters that must be identical for clips to be joined with -c copy
+COPY_VIDEO_KEYS = ("video", "codec_tag", "profile", "level", "extradata_hash", "pix_fmt",
+                   "width", "height", "frame_rate", "time_base")
+COPY_AUDIO_KEYS = ("audio", "sample_rate", "channels", "channel_layout")
+
+# Per-clip settings inputs, in the order they are applied to each clip
+CLIP_SETTINGS = ("effects_settings", "overlay_settings", "visual_cues_settings", "caption_settings")
+
+# Remotion renders already use every core, and a failed render kills all
+# headless Chrome processes before retrying, so they run one at a time
+_remotion_lock = threading.Lock()
+# Each transcription loads its own Whisper model; keep one in memory at a time
+_whisper_lock = threading.Lock()
+
+
+def _cpu_count():
+    """CPU cores this process may use, respecting affinity / cgroup limits on Linux."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
 
 class NSVideoConcatMulti:
     """
@@ -33,6 +58,8 @@ class NSVideoConcatMulti:
     Uses FFmpeg to merge all inputs into one output.
     Preserves audio when present.
     Connect an NS Transition Settings node to add transitions between clips.
+    Effects, overlay, infographics and caption settings from the matching
+    NS nodes are applied to every clip before they are joined.
     """
 
     @classmethod
@@ -45,6 +72,10 @@ class NSVideoConcatMulti:
             "optional": {
                 "video_2": ("VIDEO",),
                 "transition_settings": ("TRANSITION_SETTINGS",),
+                "effects_settings": ("EFFECTS_SETTINGS",),
+                "overlay_settings": ("OVERLAY_SETTINGS",),
+                "visual_cues_settings": ("VISUAL_CUES_SETTINGS",),
+                "caption_settings": ("CAPTION_SETTINGS",),
             }
         }
 
@@ -54,21 +85,19 @@ class NSVideoConcatMulti:
     CATEGORY = "neuralsins/Video"
 
     def _save_video_to_temp(self, video, temp_files):
-        """Save a VIDEO input to a temp file and return the path."""
-        temp_file = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-        temp_files.append(temp_file.name)
-        temp_file.close()
-        video.save_to(temp_file.name, format="mp4", codec="h264")
-        return temp_file.name
+        """Local H.264 MP4 path for a VIDEO input (its own file when possible)."""
+        return materialize(video, temp_files, "[NSVideoConcatMulti]")
+
+    def _probe(self, path):
+        """Stream parameters of a clip (one cached ffprobe call per file)."""
+        info = probe(path)
+        if info is None or not info.get("video"):
+            raise RuntimeError(f"Could not read video stream of {path}")
+        return info
 
     def _has_audio(self, path):
         """Check if a video file has an audio stream."""
-        result = subprocess.run(
-            [FFPROBE, "-v", "error", "-select_streams", "a",
-             "-show_entries", "stream=codec_type", "-of", "csv=p=0", path],
-            capture_output=True, text=True
-        )
-        return result.stdout.strip() != ""
+        return self._probe(path)["audio"] is not None
 
     def _add_silent_audio(self, path, temp_files):
         """Add a silent audio track to a video that has none."""
@@ -84,26 +113,52 @@ class NSVideoConcatMulti:
         return out.name
 
     def _get_video_info(self, path):
-        """Get video duration, width, height, and fps via ffprobe."""
-        result = subprocess.run(
-            [FFPROBE, "-v", "error",
-             "-select_streams", "v:0",
-             "-show_entries", "stream=width,height,r_frame_rate",
-             "-show_entries", "format=duration",
-             "-of", "json", path],
-            capture_output=True, text=True
-        )
-        data = json.loads(result.stdout)
-        duration = float(data["format"]["duration"])
-        stream = data["streams"][0]
-        width = int(stream["width"])
-        height = int(stream["height"])
+        """Get video duration, width, height, and fps from the clip's probe."""
+        info = self._probe(path)
         # r_frame_rate is like "30/1" or "30000/1001"
-        num, den = stream["r_frame_rate"].split("/")
+        num, den = info["frame_rate"].split("/")
         fps = float(num) / float(den)
-        return duration, width, height, fps
+        return info["duration"], int(info["width"]), int(info["height"]), fps
+
+    def _can_stream_copy(self, paths):
+        """
+        True if the clips can be joined without re-encoding.
+
+        Every clip must have the same video codec, codec tag, profile, level,
+        parameter sets (extradata), pixel format, size, frame rate and
+        timebase, and either no clip has audio or all of them have the same
+        audio codec, sample rate and layout.
+        """
+        infos = [self._probe(p) for p in paths]
+        first = infos[0]
+        if first["video"] not in ("h264", "hevc") or first["extradata_hash"] is None:
+            return False
+        keys = COPY_VIDEO_KEYS + (COPY_AUDIO_KEYS if first["audio"] else ("audio",))
+        return all(info[key] == first[key] for info in infos[1:] for key in keys)
+
+    def _concat_copy(self, paths, output_path, temp_files):
+        """Join clips with the concat demuxer, copying every stream. Returns False if FFmpeg fails."""
+        list_file = tempfile.NamedTemporaryFile(suffix=".txt", delete=False, mode="w", encoding="utf-8")
+        temp_files.append(list_file.name)
+        with list_file:
+            for path in paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+        cmd = [
+            FFMPEG, "-y",
+            "-f", "concat", "-safe", "0", "-i", list_file.name,
+            "-map", "0:v", "-map", "0:a?",
+            "-c", "copy",
+            "-movflags", "+faststart",
+            output_path,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"[NSVideoConcatMulti] Stream copy failed, re-encoding: {result.stderr[-300:]}")
+            return False
+        return True
 
-    def _normalize_video(self, path, width, height, fps, temp_files):
+    def _normalize_video(self, path, width, height, fps, temp_files, timescale=None, threads=0):
         """Re-encode a video to a target resolution, fps, and pixel format."""
         out = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
         temp_files.append(out.name)
@@ -113,14 +168,146 @@ class NSVideoConcatMulti:
             "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
                    f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,fps={fps},format=yuv420p,setsar=1",
             "-c:v", "libx264", "-preset", "fast",
+            "-threads", str(threads),
             "-c:a", "aac", "-ar", "44100", "-ac", "2",
-            out.name
         ]
+        if timescale:
+            # Same timebase as the clips that are used as they are (xfade requires it)
+            cmd += ["-video_track_timescale", str(timescale)]
+        cmd.append(out.name)
         result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg normalize error: {result.stderr[-500:]}")
         return out.name
 
+    def _matches_target(self, path, width, height, frame_rate, time_base):
+        """True if a clip can go into xfade as it is: same size, frame rate, timebase, yuv420p and square pixels."""
+        info = self._probe(path)
+        return (
+            (info["width"], info["height"]) == (width, height)
+            and info["frame_rate"] == frame_rate
+            and info["time_base"] == time_base
+            and info["pix_fmt"] == "yuv420p"
+            and info["sar"] in (None, "1:1", "0:1", "N/A")
+        )
+
+    def _normalize_all(self, paths, width, height, fps, temp_files):
+        """
+        Bring every clip to the target resolution/fps/pixel format for xfade.
+
+        Clips that already match are used as they are. The rest are encoded
+        concurrently: one worker per two available cores (at most one per
+        clip), with x264's threads split between the workers.
+
+        Returns:
+            List of clip paths, in input order
+        """
+        # xfade compares frame rates exactly, so the first clip's rate is
+        # matched as a fraction (30000/1001, not 29.97)
+        first = self._probe(paths[0])
+        frame_rate, time_base = first["frame_rate"] or fps, first["time_base"]
+        timescale = time_base.split("/")[1] if time_base and "/" in time_base else None
+        pending = [i for i, path in enumerate(paths)
+                   if not self._matches_target(path, width, height, frame_rate, time_base)]
+        skipped = len(paths) - len(pending)
+        if not pending:
+            print(f"[NSVideoConcatMulti] All {len(paths)} clips already match, skipping normalization")
+            return list(paths)
+
+        cpus = _cpu_count()
+        workers = max(1, min(len(pending), cpus // 2))
+        threads = max(1, cpus // workers)
+        print(f"[NSVideoConcatMulti] Normalizing {len(pending)} clip(s) ({skipped} already match) "
+              f"on {workers} worker(s), {threads} x264 thread(s) each")
+
+        results = list(paths)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ns-normalize") as pool:
+            normalized = pool.map(
+                lambda i: self._normalize_video(paths[i], width, height, frame_rate, temp_files, timescale, threads),
+                pending,
+            )
+            for i, path in zip(pending, normalized):
+                results[i] = path
+        return results
+
+    def _temp_mp4(self, temp_files):
+        out = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
+        temp_files.append(out.name)
+        out.close()
+        return out.name
+
+    def _process_clip(self, index, path, clip_settings, temp_files):
+        """
+        Apply the per-clip settings to one clip file.
+
+        Effects are rendered first (Remotion re-renders the pixels); the
+        overlay, infographics and captions are then composited in a single
+        FFmpeg encode. Captions are transcribed from each clip's own audio.
+
+        Returns:
+            Path of the processed clip (the input path if nothing applied)
+        """
+        from ._video_graph import LazyVideo
+
+        effects = clip_settings.get("effects_settings")
+        if effects and (effects.get("zoom") or effects.get("wiggle")):
+            from .video_effects import NSVideoEffects
+            out = self._temp_mp4(temp_files)
+            with _remotion_lock:
+                NSVideoEffects()._process_file(path, out, effects)
+            path = out
+
+        clip = LazyVideo.from_path(path)
+
+        overlay = clip_settings.get("overlay_settings")
+        if overlay:
+            from .video_overlay import NSVideoOverlay
+            clip = clip.then(NSVideoOverlay()._build_step(path, overlay))
+
+        visual = clip_settings.get("visual_cues_settings")
+        if visual and visual.get("cues"):
+            from .visual_overlay import NSVisualOverlay
+            with _remotion_lock:
+                clip = clip.then(NSVisualOverlay()._build_step(path, visual))
+
+        caption = clip_settings.get("caption_settings")
+        if caption:
+            from .caption_overlay import NSCaptionOverlay
+            node = NSCaptionOverlay()
+            with _whisper_lock:
+                words = node._clean_words(node._transcribe(
+                    path, caption.get("language", "auto"), caption.get("whisper_model", "base")
+                ))
+            if words:
+                with _remotion_lock:
+                    clip = clip.then(node._build_step(path, dict(caption, words=words)))
+            else:
+                print(f"[NSVideoConcatMulti] Clip {index + 1}: no speech, skipping captions")
+
+        if not clip.steps:
+            return path
+        out = self._temp_mp4(temp_files)
+        clip.render(out)
+        print(f"[NSVideoConcatMulti] Clip {index + 1}: applied {', '.join(s.name for s in clip.steps)}")
+        return out
+
+    def _process_clips(self, paths, clip_settings, temp_files):
+        """
+        Apply the per-clip settings to every clip on a bounded worker pool.
+
+        Workers overlap one clip's transcription, FFmpeg encode and face
+        detection with another's Remotion render. [Video] clip_workers sets the pool size
+        (0 = half the available cores, at most one per clip).
+        """
+        workers = _config.get_int("Video", "clip_workers", 0) or max(1, _cpu_count() // 2)
+        workers = max(1, min(workers, len(paths)))
+        print(f"[NSVideoConcatMulti] Applying clip settings to {len(paths)} clips ({workers} workers)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ns-concat") as pool:
+            return list(pool.map(
+                lambda item: self._process_clip(item[0], item[1], clip_settings, temp_files),
+                enumerate(paths),
+            ))
+
     def _get_whoosh_path(self):
         """Return path to the bundled whoosh sound effect."""
         return os.path.join(os.path.dirname(__file__), "..", "assets", "whoosh.mp3")
@@ -270,9 +457,26 @@ class NSVideoConcatMulti:
             if len(paths) == 0:
                 raise ValueError("No video inputs provided")
 
+            clip_settings = {name: kwargs.get(name) for name in CLIP_SETTINGS if kwargs.get(name)}
+            if clip_settings:
+                paths = self._process_clips(paths, clip_settings, temp_files)
+
             if len(paths) == 1:
+                # Keep the clip: temp files are deleted below
+                if paths[0] in temp_files:
+                    temp_files.remove(paths[0])
                 return (InputImpl.VideoFromFile(paths[0]),)
 
+            output_dir = folder_paths.get_output_directory()
+            concat_file = os.path.join(output_dir, f"concat_{int(time.time())}.mp4")
+
+            # Clips that already match (e.g. from the same model) are joined losslessly in seconds
+            if not transitions and self._can_stream_copy(paths):
+                print(f"[NSVideoConcatMulti] concat: {len(paths)} videos with matching streams, copying...")
+                if self._concat_copy(paths, concat_file, temp_files):
+                    print(f"[NSVideoConcatMulti] Done → {concat_file}")
+                    return (InputImpl.VideoFromFile(concat_file),)
+
             # Check which inputs have audio
             has_audio = [self._has_audio(p) for p in paths]
             any_audio = any(has_audio)
@@ -297,10 +501,7 @@ class NSVideoConcatMulti:
                 # Normalize all clips to matching resolution/fps/pixel format
                 # xfade requires exact match on all of these
                 print(f"[NSVideoConcatMulti] Normalizing to {target_w}x{target_h} @ {target_fps}fps")
-                for i in range(n):
-                    paths[i] = self._normalize_video(
-                        paths[i], target_w, target_h, target_fps, temp_files
-                    )
+                paths = self._normalize_all(paths, target_w, target_h, target_fps, temp_files)
 
                 # Re-probe durations after normalization (fps change can shift them)
                 durations = [self._get_video_info(p)[0] for p in paths]
@@ -341,9 +542,6 @@ class NSVideoConcatMulti:
             for label in output_labels:
                 map_args.extend(["-map", label])
 
-            output_dir = folder_paths.get_output_directory()
-            concat_file = os.path.join(output_dir, f"concat_{int(time.time())}.mp4")
-
             cmd = (
                 [FFMPEG, "-y"]
                 + inputs
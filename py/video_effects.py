@@ -11,6 +11,7 @@ import time
 import folder_paths
 
 from ._bins import FFMPEG, FFPROBE, NODE_BIN, NPX_BIN, NPM_BIN
+from ._video_io import materialize
 
 REMOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "remotion")
 REMOTION_BUNDLE = os.path.join(REMOTION_DIR, "bundle")
@@ -47,8 +48,8 @@ class NSVideoEffects:
             }
         }
 
-    RETURN_TYPES = ("VIDEO",)
-    RETURN_NAMES = ("video",)
+    RETURN_TYPES = ("VIDEO", "EFFECTS_SETTINGS")
+    RETURN_NAMES = ("video", "effects_settings")
     FUNCTION = "execute"
     CATEGORY = "neuralsins/Video"
 
@@ -292,15 +293,11 @@ class NSVideoEffects:
 
         if not zoom and not wiggle:
             print("[NSVideoEffects] No effects enabled, returning original video")
-            return (video,)
+            return (video, settings)
 
         temp_files = []
         try:
-            original_path = tempfile.NamedTemporaryFile(
-                suffix=".mp4", delete=False
-            ).name
-            temp_files.append(original_path)
-            video.save_to(original_path, format="mp4", codec="h264")
+            original_path = materialize(video, temp_files, "[NSVideoEffects]")
 
             output_dir = folder_paths.get_output_directory()
             output_path = os.path.join(
@@ -310,7 +307,7 @@ class NSVideoEffects:
             self._process_file(original_path, output_path, settings)
 
             print(f"[NSVideoEffects] Done → {output_path}")
-            return (InputImpl.VideoFromFile(output_path),)
+            return (InputImpl.VideoFromFile(output_path), settings)
 
         finally:
             for f in temp_files:
@@ -0,0 +1,41 @@
+# ABOUTME: Turns a video URL (e.g. from a WaveSpeed video node) into a ComfyUI VIDEO
+# ABOUTME: Downloads through the shared resumable, cached video fetcher and reads the file as-is
+
+
+class NSLoadVideoFromURL:
+    """
+    NS Load Video From URL
+
+    Downloads a video URL into the extension's video cache and returns it
+    as a VIDEO that reads the downloaded file directly (no re-encoding).
+    Re-running with the same URL reuses the cached file.
+    """
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "video_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of the video to load (e.g. the video_url output of a WaveSpeed video node)"
+                }),
+            }
+        }
+
+    RETURN_TYPES = ("VIDEO",)
+    RETURN_NAMES = ("video",)
+    FUNCTION = "execute"
+    CATEGORY = "neuralsins/Video"
+
+    def execute(self, video_url):
+        from ._video_fetch import load_video
+
+        video_url = video_url.strip()
+        if not video_url:
+            raise ValueError("video_url is empty")
+        return (load_video(video_url),)
+
+
+NODE_CLASS_MAPPINGS = {"NSLoadVideoFromURL": NSLoadVideoFromURL}
+
+NODE_DISPLAY_NAME_MAPPINGS = {"NSLoadVideoFromURL": "NS Load Video From URL"}
@@ -3,14 +3,14 @@
 
 import os
 import subprocess
-import tempfile
 import time
 import shutil
 import json
 
 import folder_paths
 
-from ._bins import FFMPEG, FFPROBE
+from ._bins import FFPROBE
+from ._video_graph import EditStep, LazyVideo, finish
 
 NODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -110,8 +110,8 @@ class NSVideoOverlay:
         else:  # Custom
             return x, y
 
-    def _build_filter(self, settings, vw, vh, ow, oh, is_video):
-        """Build the FFmpeg filter_complex string."""
+    def _build_filter(self, settings, vw, vh, ow, oh, is_video, labels):
+        """Build the filter graph fragment compositing labels.input(0) onto labels.video."""
         scale_factor = settings["scale"]
         opacity = settings["opacity"]
         blend_mode = settings["blend_mode"]
@@ -127,11 +127,15 @@ class NSVideoOverlay:
             vw, vh, sw, sh
         )
 
+        overlay_in = labels.input(0)
+        sc = labels.tmp("sc")
         if blend_mode == "normal":
-            # Simple overlay — FFmpeg handles alpha natively
+            # Simple overlay — FFmpeg handles alpha natively. The overlay input
+            # loops forever, so stop with the base video.
             parts = [
-                f"[1:v]scale={sw}:{sh},format=rgba,colorchannelmixer=aa={opacity}[sc]",
-                f"[0:v][sc]overlay=x={px}:y={py}:format=auto:eof_action=repeat[outv]",
+                f"{overlay_in}scale={sw}:{sh},format=rgba,colorchannelmixer=aa={opacity}{sc}",
+                f"{labels.video}{sc}overlay=x={px}:y={py}:format=auto:eof_action=repeat:shortest=1"
+                f"{labels.out_video}",
             ]
         else:
             # Blend mode: crop overlay to visible area, pad to video size,
@@ -146,32 +150,41 @@ class NSVideoOverlay:
             pad_x = max(0, px)
             pad_y = max(0, py)
 
+            base_a, base_b = labels.tmp("base_a"), labels.tmp("base_b")
+            prgb, palpha = labels.tmp("prgb"), labels.tmp("palpha")
+            mask, padded, blended = labels.tmp("mask"), labels.tmp("padded"), labels.tmp("blended")
             parts = [
-                f"[1:v]scale={sw}:{sh},format=rgba,colorchannelmixer=aa={opacity},"
-                f"crop={visible_w}:{visible_h}:{crop_x}:{crop_y}[sc]",
-                f"[sc]split[prgb][palpha]",
-                f"[palpha]alphaextract,pad={vw}:{vh}:{pad_x}:{pad_y}:color=black[mask]",
-                f"[prgb]pad={vw}:{vh}:{pad_x}:{pad_y}:color=black@0[padded]",
-                f"[0:v][padded]blend=all_mode={blend_mode}[blended]",
-                f"[blended][0:v][mask]maskedmerge[outv]",
+                f"{overlay_in}scale={sw}:{sh},format=rgba,colorchannelmixer=aa={opacity},"
+                f"crop={visible_w}:{visible_h}:{crop_x}:{crop_y}{sc}",
+                f"{sc}split{prgb}{palpha}",
+                f"{palpha}alphaextract,pad={vw}:{vh}:{pad_x}:{pad_y}:color=black{mask}",
+                f"{prgb}pad={vw}:{vh}:{pad_x}:{pad_y}:color=black@0{padded}",
+                f"{labels.video}split{base_a}{base_b}",
+                f"{base_a}{padded}blend=all_mode={blend_mode}:shortest=1{blended}",
+                f"{blended}{base_b}{mask}maskedmerge=shortest=1{labels.out_video}",
             ]
 
         return ";".join(parts)
 
-    def _process_file(self, input_path, output_path, settings):
-        """Apply overlay to a video file on disk. Used by execute() and NSVideoConcatMulti."""
+    def _build_step(self, input_path, settings):
+        """
+        Edit step compositing the overlay from settings onto a video.
+
+        Args:
+            input_path: Base video file (only read for its dimensions)
+            settings: OVERLAY_SETTINGS dict
+
+        Returns:
+            EditStep, or None if there is no overlay file
+        """
         overlay_path = settings.get("overlay_path")
         if not overlay_path or not os.path.isfile(overlay_path):
-            print("[NSVideoOverlay] No overlay file found, copying input")
-            shutil.copy2(input_path, output_path)
-            return
+            return None
 
         is_video = settings.get("overlay_type") == "video"
         _, vw, vh, _ = self._get_video_info(input_path)
         ow, oh = self._get_overlay_dimensions(overlay_path, is_video)
 
-        filter_complex = self._build_filter(settings, vw, vh, ow, oh, is_video)
-
         # Loop overlay to cover the whole video duration.
         is_webm = overlay_path.lower().endswith(".webm")
         if not is_video:
@@ -185,32 +198,27 @@ class NSVideoOverlay:
         else:
             overlay_inputs = ["-stream_loop", "-1", "-i", overlay_path]
 
-        cmd = [
-            FFMPEG, "-y",
-            "-i", input_path,
-        ] + overlay_inputs + [
-            "-filter_complex", filter_complex,
-            "-map", "[outv]",
-            "-map", "0:a?",
-            "-c:v", "libx264", "-preset", "fast",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "copy",
-            "-shortest",
-            output_path,
-        ]
+        return EditStep(
+            "overlaid",
+            inputs=[overlay_inputs],
+            video=lambda labels: self._build_filter(settings, vw, vh, ow, oh, is_video, labels),
+            shortest=True,
+        )
+
+    def _process_file(self, input_path, output_path, settings):
+        """Apply overlay to a video file on disk."""
+        step = self._build_step(input_path, settings)
+        if step is None:
+            print("[NSVideoOverlay] No overlay file found, copying input")
+            shutil.copy2(input_path, output_path)
+            return
 
         print(f"[NSVideoOverlay] Compositing overlay ({settings['blend_mode']})...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"FFmpeg overlay error:\n{result.stderr[-1000:]}"
-            )
+        LazyVideo.from_path(input_path).then(step).render(output_path)
 
     def execute(self, video, overlay_preset="None", image=None,
                 overlay_video=None, position="Center", x=0, y=0,
                 scale=1.0, opacity=1.0, blend_mode="normal"):
-        from comfy_api.latest import InputImpl
-
         has_overlay = (
             overlay_video is not None
             or image is not None
@@ -229,93 +237,81 @@ class NSVideoOverlay:
             }
             return (video, settings)
 
-        temp_files = []
-        try:
-            # Save base video to temp
-            original_path = tempfile.NamedTemporaryFile(
-                suffix=".mp4", delete=False
-            ).name
-            temp_files.append(original_path)
-            video.save_to(original_path, format="mp4", codec="h264")
-
-            # Determine overlay type and save to persistent location
-            output_dir = folder_paths.get_output_directory()
-            timestamp = int(time.time())
-
-            # Resolve overlay source: preset > overlay_video > image
-            preset_rel = OVERLAY_PRESETS.get(overlay_preset)
-            preset_path = None
-            if preset_rel is not None:
-                candidate = os.path.join(NODE_DIR, preset_rel)
-                if os.path.isfile(candidate):
-                    preset_path = candidate
-
-            if preset_path is not None:
-                overlay_type = "video"
-                overlay_persist = preset_path
-            elif overlay_video is not None:
-                overlay_type = "video"
-                overlay_persist = None
-
-                # Try to use original file to preserve alpha channel.
-                # ComfyUI's get_components/save_to strip alpha to RGB.
-                try:
-                    source = overlay_video.get_stream_source()
-                    if isinstance(source, str) and os.path.isfile(source):
-                        overlay_persist = source
-                except (AttributeError, Exception):
-                    pass
-
-                if overlay_persist is None:
-                    overlay_persist = os.path.join(
-                        output_dir, f"overlay_{timestamp}.mp4"
-                    )
-                    overlay_video.save_to(
-                        overlay_persist, format="mp4", codec="h264"
-                    )
-            else:
-                overlay_type = "image"
+        # Base video as a local MP4 (its own file when possible), or the
+        # pending edit chain of an upstream NS video node
+        base = LazyVideo.from_video(video, "[NSVideoOverlay]")
+
+        # Determine overlay type and save to persistent location
+        output_dir = folder_paths.get_output_directory()
+        timestamp = int(time.time())
+
+        # Resolve overlay source: preset > overlay_video > image
+        preset_rel = OVERLAY_PRESETS.get(overlay_preset)
+        preset_path = None
+        if preset_rel is not None:
+            candidate = os.path.join(NODE_DIR, preset_rel)
+            if os.path.isfile(candidate):
+                preset_path = candidate
+
+        if preset_path is not None:
+            overlay_type = "video"
+            overlay_persist = preset_path
+        elif overlay_video is not None:
+            overlay_type = "video"
+            overlay_persist = None
+
+            # Try to use original file to preserve alpha channel.
+            # ComfyUI's get_components/save_to strip alpha to RGB.
+            try:
+                source = overlay_video.get_stream_source()
+                if isinstance(source, str) and os.path.isfile(source):
+                    overlay_persist = source
+            except (AttributeError, Exception):
+                pass
+
+            if overlay_persist is None:
                 overlay_persist = os.path.join(
-                    output_dir, f"overlay_{timestamp}.png"
+                    output_dir, f"overlay_{timestamp}.mp4"
                 )
-                from PIL import Image as PILImage
-                import numpy as np
-                img_np = image.cpu().numpy().squeeze()
-                if img_np.max() <= 1.0:
-                    img_np = (img_np * 255).astype(np.uint8)
-                if img_np.ndim == 3 and img_np.shape[2] == 4:
-                    pil_img = PILImage.fromarray(img_np, mode="RGBA")
-                elif img_np.ndim == 3 and img_np.shape[2] == 3:
-                    pil_img = PILImage.fromarray(img_np, mode="RGB")
-                else:
-                    pil_img = PILImage.fromarray(img_np)
-                pil_img.save(overlay_persist, format="PNG")
-
-            settings = {
-                "overlay_path": overlay_persist,
-                "overlay_type": overlay_type,
-                "position": position,
-                "x": x, "y": y,
-                "scale": scale,
-                "opacity": opacity,
-                "blend_mode": blend_mode,
-            }
-
-            output_path = os.path.join(
-                output_dir, f"overlaid_{timestamp}.mp4"
+                overlay_video.save_to(
+                    overlay_persist, format="mp4", codec="h264"
+                )
+        else:
+            overlay_type = "image"
+            overlay_persist = os.path.join(
+                output_dir, f"overlay_{timestamp}.png"
             )
+            from PIL import Image as PILImage
+            import numpy as np
+            img_np = image.cpu().numpy().squeeze()
+            if img_np.max() <= 1.0:
+                img_np = (img_np * 255).astype(np.uint8)
+            if img_np.ndim == 3 and img_np.shape[2] == 4:
+                pil_img = PILImage.fromarray(img_np, mode="RGBA")
+            elif img_np.ndim == 3 and img_np.shape[2] == 3:
+                pil_img = PILImage.fromarray(img_np, mode="RGB")
+            else:
+                pil_img = PILImage.fromarray(img_np)
+            pil_img.save(overlay_persist, format="PNG")
+
+        settings = {
+            "overlay_path": overlay_persist,
+            "overlay_type": overlay_type,
+            "position": position,
+            "x": x, "y": y,
+            "scale": scale,
+            "opacity": opacity,
+            "blend_mode": blend_mode,
+        }
 
-            self._process_file(original_path, output_path, settings)
-
-            print(f"[NSVideoOverlay] Done → {output_path}")
-            return (InputImpl.VideoFromFile(output_path), settings)
+        step = self._build_step(base.source, settings)
+        if step is None:
+            print("[NSVideoOverlay] No overlay file found, returning original video")
+            return (video, settings)
 
-        finally:
-            for f in temp_files:
-                try:
-                    os.unlink(f)
-                except OSError:
-                    pass
+        # Encoded together with the rest of the chain when the video is used
+        print(f"[NSVideoOverlay] Queued overlay ({blend_mode})")
+        return (finish(base.then(step)), settings)
 
 
 NODE_CLASS_MAPPINGS = {
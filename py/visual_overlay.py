@@ -12,11 +12,11 @@ import base64
 import io
 
 import requests
-import folder_paths
 
 from .llm_chat import claude_models
 
 from ._bins import FFMPEG, FFPROBE, NODE_BIN, NPX_BIN, NPM_BIN
+from ._video_graph import EditStep, LazyVideo, finish
 
 REMOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "remotion")
 REMOTION_BUNDLE = os.path.join(REMOTION_DIR, "bundle")
@@ -394,8 +394,8 @@ class NSVisualOverlay:
             }
         }
 
-    RETURN_TYPES = ("VIDEO",)
-    RETURN_NAMES = ("video",)
+    RETURN_TYPES = ("VIDEO", "VISUAL_CUES_SETTINGS")
+    RETURN_NAMES = ("video", "visual_cues_settings")
     FUNCTION = "execute"
     CATEGORY = "neuralsins/Video"
 
@@ -738,130 +738,111 @@ class NSVisualOverlay:
             except OSError:
                 pass
 
-    def _composite(self, original_path, overlay_path, output_path):
-        """Composite the transparent overlay onto the original video with FFmpeg."""
-        cmd = [
-            FFMPEG, "-y",
-            "-i", original_path,
-            "-c:v", "libvpx-vp9", "-i", overlay_path,
-            "-filter_complex", "[0:v][1:v]overlay=format=auto[outv]",
-            "-map", "[outv]",
-            "-map", "0:a?",
-            "-c:v", "libx264", "-preset", "fast",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "copy",
-            output_path
-        ]
+    def _build_step(self, input_path, settings):
+        """
+        Render the infographics overlay for a video and return the edit step compositing it.
 
-        print("[NSVisualOverlay] Compositing overlay onto video...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"FFmpeg composite error:\n{result.stderr[-1000:]}"
-            )
+        Args:
+            input_path: Base video file (read for fps, size and duration)
+            settings: VISUAL_CUES settings dict
 
-    def _process_file(self, input_path, output_path, settings):
-        """Apply visual overlay to a video file on disk. Used by execute() and NSVideoConcatMulti."""
+        Returns:
+            EditStep, or None if settings have no cues
+        """
         self._ensure_deps()
 
         cues = settings.get("cues", [])
         if not cues:
-            print("[NSVisualOverlay] No cues in settings, copying input")
-            shutil.copy2(input_path, output_path)
-            return
+            return None
 
-        temp_files = []
-        try:
-            fps, width, height, duration = self._get_video_info(input_path)
-            duration_in_frames = int(round(duration * fps))
-
-            props = {
-                "cues": cues,
-                "width": width,
-                "height": height,
-                "fps": round(fps),
-                "durationInFrames": duration_in_frames,
-            }
+        fps, width, height, duration = self._get_video_info(input_path)
+        duration_in_frames = int(round(duration * fps))
 
-            if settings.get("defaultStyle"):
-                props["defaultStyle"] = settings["defaultStyle"]
+        props = {
+            "cues": cues,
+            "width": width,
+            "height": height,
+            "fps": round(fps),
+            "durationInFrames": duration_in_frames,
+        }
 
-            overlay_path = tempfile.NamedTemporaryFile(
-                suffix=".webm", delete=False
-            ).name
-            temp_files.append(overlay_path)
+        if settings.get("defaultStyle"):
+            props["defaultStyle"] = settings["defaultStyle"]
 
+        overlay_path = tempfile.NamedTemporaryFile(
+            suffix=".webm", delete=False
+        ).name
+        try:
             self._render_overlay(props, overlay_path)
-            self._composite(input_path, overlay_path, output_path)
+        except Exception:
+            os.unlink(overlay_path)
+            raise
+
+        # Transparent VP9 needs the libvpx decoder to keep its alpha
+        return EditStep(
+            "infographic",
+            inputs=[["-c:v", "libvpx-vp9", "-i", overlay_path]],
+            video=lambda labels: f"{labels.video}{labels.input(0)}overlay=format=auto{labels.out_video}",
+            resources=[overlay_path],
+        )
 
-        finally:
-            for f in temp_files:
-                try:
-                    os.unlink(f)
-                except OSError:
-                    pass
+    def _process_file(self, input_path, output_path, settings):
+        """Apply visual overlay to a video file on disk."""
+        step = self._build_step(input_path, settings)
+        if step is None:
+            print("[NSVisualOverlay] No cues in settings, copying input")
+            shutil.copy2(input_path, output_path)
+            return
 
-    def execute(self, video, transcript, api_key="", model="claude-sonnet-4-5", density="Medium", style="Auto"):
-        from comfy_api.latest import InputImpl
+        print("[NSVisualOverlay] Compositing overlay onto video...")
+        LazyVideo.from_path(input_path).then(step).render(output_path)
 
+    def execute(self, video, transcript, api_key="", model="claude-sonnet-4-5", density="Medium", style="Auto"):
         if isinstance(transcript, str):
             transcript = json.loads(transcript)
         words = transcript.get("words", [])
 
         if not words:
             print("[NSVisualOverlay] Empty transcript, returning original video")
-            return (video,)
+            return (video, {"cues": []})
 
         resolved_key = self._resolve_api_key(api_key)
 
-        temp_files = []
-        try:
-            original_path = tempfile.NamedTemporaryFile(
-                suffix=".mp4", delete=False
-            ).name
-            temp_files.append(original_path)
-            video.save_to(original_path, format="mp4", codec="h264")
-
-            fps, width, height, duration = self._get_video_info(original_path)
-
-            # Pass 1: Content analysis (text-only)
-            analysis = self._pass1_analyze_content(
-                resolved_key, model, words
-            )
-
-            # Extract frames with face detection
-            frames, face_regions = self._extract_frames(
-                original_path, duration, width, height
-            )
+        # Frames are analysed on the base file; upstream NS edits are only
+        # encoded together with this one, when the video is used
+        base = LazyVideo.from_video(video, "[NSVisualOverlay]")
+        original_path = base.source
 
-            # Pass 2: Generate cues (with images, analysis, face data)
-            cues = self._pass2_generate_cues(
-                resolved_key, model, words, density, style,
-                original_path, duration, width, height,
-                analysis, frames, face_regions
-            )
+        fps, width, height, duration = self._get_video_info(original_path)
 
-            settings = {"cues": cues}
-            if style != "Auto":
-                settings["defaultStyle"] = style
+        # Pass 1: Content analysis (text-only)
+        analysis = self._pass1_analyze_content(
+            resolved_key, model, words
+        )
 
-            output_dir = folder_paths.get_output_directory()
-            output_path = os.path.join(
-                output_dir, f"infographic_{int(time.time())}.mp4"
-            )
+        # Extract frames with face detection
+        frames, face_regions = self._extract_frames(
+            original_path, duration, width, height
+        )
 
-            self._process_file(original_path, output_path, settings)
+        # Pass 2: Generate cues (with images, analysis, face data)
+        cues = self._pass2_generate_cues(
+            resolved_key, model, words, density, style,
+            original_path, duration, width, height,
+            analysis, frames, face_regions
+        )
 
-            print(f"[NSVisualOverlay] Done -> {output_path}")
-            return (InputImpl.VideoFromFile(output_path),)
+        settings = {"cues": cues}
+        if style != "Auto":
+            settings["defaultStyle"] = style
 
-        finally:
-            for f in temp_files:
-                try:
-                    os.unlink(f)
-                except OSError:
-                    pass
+        step = self._build_step(original_path, settings)
+        if step is None:
+            print("[NSVisualOverlay] No cues generated, returning original video")
+            return (video, settings)
 
+        print(f"[NSVisualOverlay] Queued {len(cues)} visual cues")
+        return (finish(base.then(step)), settings)
 
 NODE_CLASS_MAPPINGS = {
     "NSVisualOverlay": NSVisualOverlay,
@@ -0,0 +1,72 @@
+# ABOUTME: Concurrent fan-out of many WaveSpeed requests from a single node
+# Submits a list of payloads with a bounded number in flight and gathers results in order
+
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional
+
+from .client import WaveSpeedClient
+from .. import _images
+
+
+def split_prompts(text: Optional[str]) -> List[str]:
+    """
+    Split a comma-separated prompt list (as produced by NS Prompt List)
+
+    Args:
+        text: Comma-separated prompts, may be empty
+
+    Returns:
+        Non-empty, stripped prompts
+    """
+    if not text:
+        return []
+    return [p.strip() for p in text.split(",") if p.strip()]
+
+
+def run_batch(api_key: str, endpoint: str, payloads: List[Dict[str, Any]], max_in_flight: int = 4,
+              polling_interval: float = 1, timeout: int = 300) -> List[Dict[str, Any]]:
+    """
+    Run many requests against one endpoint concurrently
+
+    Each payload is submitted as soon as a slot is free; async tasks are
+    awaited through the shared background poller. Results come back in the
+    same order as payloads. The first failure is raised as soon as it
+    happens and payloads not yet submitted are dropped.
+
+    Args:
+        api_key: WaveSpeed AI API key
+        endpoint: API endpoint path
+        payloads: Request payloads, one per task
+        max_in_flight: Maximum number of tasks submitted but not yet finished
+        polling_interval: Shortest time between polls in seconds
+        timeout: Maximum time to wait for each task in seconds
+
+    Returns:
+        List of task results, each with an "outputs" list
+    """
+    def run_one(payload):
+        # One client per task: the client tracks its last submit for the polling prior
+        client = WaveSpeedClient(api_key=api_key)
+        response = client.post(endpoint, payload, timeout=client.once_timeout)
+        if payload.get("enable_sync_mode"):
+            # Download this task's images while the rest of the batch is still generating
+            for url in response.get("outputs") or []:
+                if isinstance(url, str):
+                    _images.prefetch(url)
+            return response
+        task_id = response["id"]
+        print(f"Batch task submitted. Request ID: {task_id}")
+        return client.wait_for_task(task_id, polling_interval=polling_interval, timeout=timeout)
+
+    workers = max(1, min(max_in_flight, len(payloads)))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wavespeed-batch")
+    try:
+        futures = [pool.submit(run_one, payload) for payload in payloads]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            if future in done and future.exception() is not None:
+                raise future.exception()
+        return [future.result() for future in futures]
+    finally:
+        # On failure, drop payloads not yet submitted and don't wait for tasks still polling
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -3,28 +3,119 @@
 
 import time
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Tuple
+
+from .. import _config, _result_cache, _telemetry
+from .._http import get_session, never_sent
+from .._polling import parse_retry_after
+from .._ratelimit import get_limiter
+from .._retry import (CircuitOpenError, FatalError, RetryableError, UnconfirmedError, call_with_retry,
+                      get_breaker, http_error)
+from . import journal
+from .poller import get_poller, processing_seconds
+
+TASK_ENDPOINT_PREFIX = "/api/v3/wavespeed-ai/task/"
+DEFAULT_BASE_URL = "https://api.wavespeed.ai"
+
+
+def default_base_url() -> str:
+    """API base URL: [WaveSpeed] base_url from config.ini (e.g. a proxy or local mock server), else WaveSpeed."""
+    return _config.get("WaveSpeed", "base_url", "") or DEFAULT_BASE_URL
 
 
 class WaveSpeedClient:
     """Client for interacting with WaveSpeed AI API"""
     
-    def __init__(self, api_key: str, base_url: str = "https://api.wavespeed.ai"):
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
         """
         Initialize WaveSpeed API client
         
         Args:
             api_key: WaveSpeed AI API key
-            base_url: Base URL for the API (default: https://api.wavespeed.ai)
+            base_url: Base URL for the API (default: [WaveSpeed] base_url, else https://api.wavespeed.ai)
         """
         self.api_key = api_key
-        self.base_url = base_url
+        self.base_url = base_url or default_base_url()
         self.once_timeout = 300  # Default timeout for single requests
+        # Shared keep-alive session: connections are reused across nodes and polls
+        self.session = get_session(self.base_url, api_key)
+        # Shared request rate / concurrency budget for this API key
+        self.limiter = get_limiter("wavespeed", api_key)
+        # (endpoint, submit time) of the last non-polling request, used as the polling prior
+        self.last_submit = None
+        # Task results served from the result cache, by task ID
+        self._cached_results = {}
+        # Result cache keys of submitted tasks whose results should be stored, by task ID
+        self._cache_keys = {}
+        # Journaled task IDs to mark finished once their result is delivered
+        self._journaled = set()
+        # Payloads of submitted tasks, for the cost estimate once they finish
+        self._payloads = {}
+        
+    def _request(self, endpoint: str, data: Dict[str, Any], timeout: int,
+                 idempotent: bool = True) -> Tuple[Dict[str, Any], Optional[float]]:
+        """
+        POST to the WaveSpeed API over the shared session, once
+        
+        Failures are classified: 429/5xx responses and dropped connections
+        raise RetryableError, other error responses raise FatalError. A
+        submit (idempotent=False) is only retried on a 429 or when it never
+        reached the server; after a read timeout, a dropped connection, a
+        5xx or an unreadable reply it may already have created a task, so
+        it raises UnconfirmedError instead of being resent.
+        
+        Returns:
+            (response data, Retry-After seconds or None)
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        try:
+            with self.limiter.request(poll=endpoint.startswith(TASK_ENDPOINT_PREFIX)):
+                response = self.session.post(url, json=data, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            if idempotent or never_sent(e):
+                raise RetryableError(f"API request failed: {str(e)}")
+            raise UnconfirmedError(f"API request failed, not resent to avoid a duplicate task: {str(e)}")
+        
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            self.limiter.throttled(retry_after)
+        if response.status_code >= 400:
+            message = f"API request failed: {response.status_code} {response.reason}: {response.text[:500]}"
+            if not idempotent and response.status_code >= 500:
+                raise UnconfirmedError(f"{message} (not resent to avoid a duplicate task)",
+                                       status=response.status_code)
+            raise http_error(response.status_code, message, retry_after)
         
+        try:
+            result = response.json()
+        except ValueError:
+            message = f"API returned a non-JSON response (HTTP {response.status_code})"
+            if not idempotent:
+                raise UnconfirmedError(f"{message}, not resent to avoid a duplicate task",
+                                       status=response.status_code)
+            raise RetryableError(message, status=response.status_code, retry_after=retry_after)
+        
+        # Extract 'data' field if present in response
+        if isinstance(result, dict) and "data" in result:
+            return result["data"], retry_after
+        
+        return result, retry_after
+    
     def post(self, endpoint: str, data: Dict[str, Any], timeout: int = 300) -> Dict[str, Any]:
         """
         Make a POST request to the WaveSpeed API
         
+        Submits with an explicit seed are looked up in the on-disk result
+        cache first; a hit is returned without contacting the API. Async
+        submits are journaled, and a submit whose payload matches a task
+        left unfinished by a previous run re-attaches to that task instead.
+        
+        Rate limits, server errors and dropped connections are retried with
+        backoff; each endpoint has a circuit breaker so a provider outage
+        fails every caller fast instead of tying them up.
+        
         Args:
             endpoint: API endpoint path
             data: Request payload
@@ -33,63 +124,148 @@ class WaveSpeedClient:
         Returns:
             API response data
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        try:
-            response = requests.post(url, json=data, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # Extract 'data' field if present in response
-            if isinstance(result, dict) and "data" in result:
-                return result["data"]
-            
+        if endpoint.startswith(TASK_ENDPOINT_PREFIX):
+            result, _ = call_with_retry(lambda: self._request(endpoint, data, timeout),
+                                        label=f"Request to {endpoint}")
             return result
+        
+        self.last_submit = (endpoint, time.time())
+        
+        # Requests with an explicit seed are deterministic: serve repeats from the result cache
+        key = _result_cache.cache_key(f"{self.base_url}{endpoint}", data)
+        cached = _result_cache.get_result(key)
+        if cached is not None:
+            cached.setdefault("id", f"cached-{key[:16]}")
+            self._cached_results[cached["id"]] = cached
+            print(f"Result cache hit for {endpoint} (task {cached['id']}), skipping API request")
+            _telemetry.record("wavespeed", "submit", endpoint=endpoint, cached=True, seconds=0.0, ok=True, cost=0.0)
+            return cached
+        
+        # A previous run may have submitted this exact payload and stopped before the result came back
+        payload_hash = _result_cache.payload_hash(f"{self.base_url}{endpoint}", data)
+        previous = journal.find(payload_hash)
+        if previous is not None:
+            task_id = previous["task_id"]
+            print(f"Re-attaching to task {task_id} submitted "
+                  f"{int(time.time() - previous['submitted_at'])}s ago with the same payload")
+            self.last_submit = (endpoint, previous["submitted_at"])
+            self._journaled.add(task_id)
+            self._payloads[task_id] = data
+            _telemetry.record("wavespeed", "submit", endpoint=endpoint, reattached=True, seconds=0.0, ok=True)
+            if key:
+                self._cache_keys[task_id] = key
+            if data.get("enable_sync_mode"):
+                return self.wait_for_task(task_id, timeout=timeout)
+            return {"id": task_id, "status": "created", "outputs": []}
+        
+        with _telemetry.span("wavespeed", "submit", endpoint=endpoint,
+                             sync=bool(data.get("enable_sync_mode"))) as span:
+            result, _ = call_with_retry(
+                lambda: self._request(endpoint, data, timeout, idempotent=False),
+                breaker=get_breaker(f"{self.base_url}{endpoint}"),
+                label=f"Submit to {endpoint}",
+            )
+            if isinstance(result, dict) and result.get("outputs"):
+                # Sync mode: the request covered the whole generation
+                span.set(outputs=len(result["outputs"]), processing_seconds=processing_seconds(result),
+                         **_telemetry.cost_fields(endpoint, data, result["outputs"]))
+        
+        if isinstance(result, dict) and not result.get("outputs") and result.get("id"):
+            journal.record(payload_hash, result["id"], endpoint, self.last_submit[1])
+            self._journaled.add(result["id"])
+            self._payloads[result["id"]] = data
+        
+        if key and isinstance(result, dict):
+            if result.get("outputs"):
+                _result_cache.put_result(key, result)
+            elif result.get("id"):
+                self._cache_keys[result["id"]] = key
+        return result
+    
+    def get_task_status(self, task_id: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """
+        Fetch the current status of a task once
+        
+        Raises RetryableError or FatalError as classified by _request.
+        
+        Args:
+            task_id: Task ID to query
             
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"API request failed: {str(e)}")
+        Returns:
+            (task data, Retry-After seconds or None)
+        """
+        return self._request(f"{TASK_ENDPOINT_PREFIX}{task_id}", {}, timeout=30)
     
-    def wait_for_task(self, task_id: str, polling_interval: int = 1, timeout: int = 300) -> Dict[str, Any]:
+    def watch_task(self, task_id: str, polling_interval: float = 1, timeout: int = 300,
+                   model: Optional[str] = None) -> Future:
         """
-        Poll for task completion
+        Hand a task to the shared background poller without blocking
         
         Args:
             task_id: Task ID to poll
-            polling_interval: Time between polls in seconds
+            polling_interval: Shortest time between polls in seconds
             timeout: Maximum time to wait in seconds
+            model: Model key for the duration prior (defaults to the last submitted endpoint)
             
         Returns:
-            Task result when complete
+            Future resolving to the task result when complete
         """
-        start_time = time.time()
-        endpoint = f"/api/v3/wavespeed-ai/task/{task_id}"
+        if task_id in self._cached_results:
+            future = Future()
+            future.set_result(self._cached_results[task_id])
+            return future
         
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
-                raise Exception(f"Task polling timed out after {timeout} seconds")
-            
+        submitted_at = None
+        if self.last_submit is not None:
+            model = model or self.last_submit[0]
+            submitted_at = self.last_submit[1]
+        future = get_poller().watch(
+            self, task_id, polling_interval=polling_interval, timeout=timeout,
+            model=model, submitted_at=submitted_at, payload=self._payloads.pop(task_id, None),
+        )
+        
+        key = self._cache_keys.pop(task_id, None)
+        journaled = task_id in self._journaled
+        if not key and not journaled:
+            return future
+        
+        # Cache and journal the outcome before anyone waiting on it can fetch its outputs
+        settled = Future()
+        def settle(done):
             try:
-                result = self.post(endpoint, {}, timeout=30)
-                
-                status = result.get("status", "")
-                
-                if status == "completed" or status == "success":
-                    return result
-                elif status == "failed" or status == "error":
-                    error_msg = result.get("error", "Unknown error")
-                    raise Exception(f"Task failed: {error_msg}")
-                
-                # Task still processing, wait and retry
-                time.sleep(polling_interval)
-                
-            except Exception as e:
-                if "Task polling timed out" in str(e):
-                    raise
-                # For other errors, retry after interval
-                time.sleep(polling_interval)
+                result = done.result()
+            except BaseException as e:
+                # Only a definite failure is final; a task we lost track of may still finish
+                if journaled and isinstance(e, FatalError) and not isinstance(e, CircuitOpenError):
+                    journal.finish(task_id)
+                settled.set_exception(e)
+                return
+            if key:
+                _result_cache.put_result(key, result)
+            if journaled:
+                journal.finish(task_id)
+            settled.set_result(result)
+        future.add_done_callback(settle)
+        return settled
+    
+    def wait_for_task(self, task_id: str, polling_interval: float = 1, timeout: int = 300,
+                      model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Poll for task completion on an adaptive schedule
+        
+        The task is polled by the shared TaskPoller, which multiplexes every
+        outstanding task onto one event loop. Polls are spaced by a
+        PollingStrategy: sparse while the task is well short of the model's
+        expected duration, every polling_interval seconds around the expected
+        finish, backing off once overdue.
+        
+        Args:
+            task_id: Task ID to poll
+            polling_interval: Shortest time between polls in seconds
+            timeout: Maximum time to wait in seconds
+            model: Model key for the duration prior (defaults to the last submitted endpoint)
+            
+        Returns:
+            Task result when complete
+        """
+        return self.watch_task(task_id, polling_interval, timeout, model).result()
@@ -0,0 +1,150 @@
+# ABOUTME: Durable JSONL journal of submitted WaveSpeed tasks keyed by payload hash
+# ABOUTME: Lets a re-executed node re-attach to a task that was still running when ComfyUI stopped
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from .. import _config
+
+DEFAULT_JOURNAL_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "cache", "wavespeed_tasks.jsonl",
+)
+DEFAULT_MAX_AGE_HOURS = 24
+
+# Rewrite the journal with only unfinished tasks once it has this many lines
+COMPACT_AFTER_LINES = 500
+
+_lock = threading.Lock()
+_pending: Optional[Dict[str, Dict[str, Any]]] = None  # task_id -> submitted entry
+_claimed = set()  # task IDs already owned by a node in this process
+_lines = 0
+
+
+def _path() -> str:
+    return _config.get("WaveSpeed", "journal", "") or DEFAULT_JOURNAL_PATH
+
+
+def _max_age() -> float:
+    return max(0.0, _config.get_float("WaveSpeed", "journal_max_age_hours", DEFAULT_MAX_AGE_HOURS)) * 3600
+
+
+def _load():
+    """Fold the journal into the set of unfinished tasks on first use."""
+    global _pending, _lines
+    if _pending is not None:
+        return
+    pending = {}
+    lines = 0
+    try:
+        with open(_path(), "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crash
+                if entry.get("event") == "submitted":
+                    pending[entry["task_id"]] = entry
+                elif entry.get("event") == "finished":
+                    pending.pop(entry.get("task_id"), None)
+    except OSError:
+        pass
+    _pending = pending
+    _lines = lines
+
+
+def _append(entry: Dict[str, Any]):
+    global _lines
+    try:
+        os.makedirs(os.path.dirname(_path()), exist_ok=True)
+        with open(_path(), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        _lines += 1
+    except OSError as e:
+        print(f"[NSWaveSpeedJournal] Could not write task journal: {e}")
+
+
+def _compact():
+    global _lines
+    path = _path()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in _pending.values():
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp, path)
+        _lines = len(_pending)
+    except OSError as e:
+        print(f"[NSWaveSpeedJournal] Could not compact task journal: {e}")
+
+
+def find(payload_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Claim an unfinished task submitted earlier with the same payload
+
+    Tasks submitted by this process are already claimed by the node that
+    submitted them, so identical payloads in one run (e.g. a batch) never
+    share a task; only tasks left over from a previous run are handed out.
+
+    Args:
+        payload_hash: Hash of the endpoint and canonical payload
+
+    Returns:
+        Journal entry with task_id, endpoint and submitted_at, or None
+    """
+    with _lock:
+        _load()
+        now = time.time()
+        max_age = _max_age()
+        for task_id, entry in list(_pending.items()):
+            if max_age and now - entry.get("submitted_at", 0) > max_age:
+                del _pending[task_id]
+                continue
+            if entry.get("hash") == payload_hash and task_id not in _claimed:
+                _claimed.add(task_id)
+                return entry
+    return None
+
+
+def record(payload_hash: str, task_id: str, endpoint: str, submitted_at: float):
+    """
+    Journal a newly submitted task
+
+    Args:
+        payload_hash: Hash of the endpoint and canonical payload
+        task_id: Task ID returned by the API
+        endpoint: Submit endpoint path
+        submitted_at: Submit timestamp
+    """
+    entry = {
+        "event": "submitted",
+        "hash": payload_hash,
+        "task_id": task_id,
+        "endpoint": endpoint,
+        "submitted_at": submitted_at,
+    }
+    with _lock:
+        _load()
+        _pending[task_id] = entry
+        _claimed.add(task_id)
+        _append(entry)
+
+
+def finish(task_id: str):
+    """
+    Mark a task's result as delivered so it is never re-attached
+
+    Args:
+        task_id: Task ID
+    """
+    with _lock:
+        _load()
+        if _pending.pop(task_id, None) is None:
+            return
+        _append({"event": "finished", "task_id": task_id, "finished_at": time.time()})
+        if _lines >= COMPACT_AFTER_LINES:
+            _compact()
@@ -0,0 +1,187 @@
+# ABOUTME: Background task multiplexer that polls every outstanding WaveSpeed task
+# ABOUTME: from one asyncio event loop and resolves a per-task future on completion
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from .. import _config, _images, _telemetry
+from .._polling import PollingStrategy
+from .._retry import FatalError, RetryableError
+
+DEFAULT_POLL_WORKERS = 4
+
+# Consecutive failed status requests after which a task is given up on
+MAX_POLL_FAILURES = 8
+
+
+def processing_seconds(result) -> Optional[float]:
+    """Generation time the API reports for a finished task (timings.inference, in ms), in seconds."""
+    inference = (result.get("timings") or {}).get("inference") if isinstance(result, dict) else None
+    return round(inference / 1000.0, 3) if isinstance(inference, (int, float)) else None
+
+
+class TaskPoller:
+    """
+    Polls many WaveSpeed tasks from a single event loop thread.
+
+    Each watched task is a lightweight coroutine that sleeps on its own
+    adaptive schedule; the blocking status requests go through a small fixed
+    pool over the shared keep-alive session. Thread and connection use stay
+    constant no matter how many tasks are in flight.
+
+    Output images are prefetched as soon as a status response lists them,
+    including partial outputs of multi-image tasks still running, so their
+    downloads overlap the remaining generation time. Every watched task is
+    recorded in the telemetry log with its poll count, wait, queue and
+    processing time and estimated cost.
+    """
+
+    def __init__(self, poll_workers: int = DEFAULT_POLL_WORKERS):
+        """
+        Args:
+            poll_workers: Maximum number of status requests in flight at once
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, poll_workers), thread_name_prefix="wavespeed-poll"
+        )
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks currently being watched."""
+        return self._pending
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="wavespeed-poller", daemon=True
+            )
+            thread.start()
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    def watch(self, client, task_id: str, polling_interval: float = 1, timeout: int = 300,
+              model: Optional[str] = None, submitted_at: Optional[float] = None,
+              payload: Optional[dict] = None) -> Future:
+        """
+        Start watching a task and return a future for its final result.
+
+        Args:
+            client: WaveSpeedClient that submitted the task
+            task_id: Task ID to poll
+            polling_interval: Shortest time between polls in seconds
+            timeout: Maximum time to wait in seconds
+            model: Model key for the duration prior
+            submitted_at: Submit timestamp (defaults to now)
+            payload: Submitted payload, for the telemetry cost estimate
+
+        Returns:
+            concurrent.futures.Future resolving to the completed task result
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._watch(client, task_id, polling_interval, timeout, model,
+                        submitted_at or time.time(), payload),
+            loop,
+        )
+
+    async def _watch(self, client, task_id, polling_interval, timeout, model, submitted_at, payload=None):
+        loop = asyncio.get_running_loop()
+        strategy = PollingStrategy(model, base_interval=polling_interval)
+        start_time = time.time()
+        failures = 0
+        polls = 0
+        result = None
+        error = None
+        self._pending += 1
+        try:
+            while True:
+                elapsed = time.time() - start_time
+                if elapsed > timeout:
+                    raise Exception(f"Task polling timed out after {timeout} seconds")
+
+                retry_after = None
+                polls += 1
+                try:
+                    result, retry_after = await loop.run_in_executor(
+                        self._executor, client.get_task_status, task_id
+                    )
+                except FatalError:
+                    # Bad task ID, revoked key, ...: polling again won't help
+                    raise
+                except Exception as e:
+                    # Transient: retry on the same schedule, but not forever
+                    failures += 1
+                    if failures >= MAX_POLL_FAILURES:
+                        raise RetryableError(
+                            f"Task status unavailable after {failures} attempts in a row: {str(e)}"
+                        )
+                    retry_after = getattr(e, "retry_after", None)
+                else:
+                    failures = 0
+                    status = result.get("status", "")
+                    for url in result.get("outputs") or []:
+                        if isinstance(url, str):
+                            _images.prefetch(url)
+
+                    if status == "completed" or status == "success":
+                        strategy.completed(time.time() - submitted_at)
+                        return result
+                    elif status == "failed" or status == "error":
+                        error_msg = result.get("error", "Unknown error")
+                        raise FatalError(f"Task failed: {error_msg}")
+
+                delay = strategy.next_delay(time.time() - submitted_at, retry_after)
+                remaining = timeout - (time.time() - start_time)
+                await asyncio.sleep(max(0.0, min(delay, remaining + 0.01)))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._pending -= 1
+            self._record(task_id, model, submitted_at, polls, result, error, payload)
+
+    @staticmethod
+    def _record(task_id, model, submitted_at, polls, result, error, payload):
+        """Log a watched task's timings: queue time is the wait not spent generating."""
+        waited = round(time.time() - submitted_at, 3)
+        processing = processing_seconds(result) if error is None else None
+        outputs = result.get("outputs") if error is None and isinstance(result, dict) else None
+        _telemetry.record(
+            "wavespeed", "task",
+            endpoint=model,
+            task_id=task_id,
+            ok=error is None,
+            error=str(error)[:300] if error is not None else None,
+            seconds=waited,
+            polls=polls,
+            processing_seconds=processing,
+            queue_seconds=round(max(0.0, waited - processing), 3) if processing is not None else None,
+            outputs=len(outputs) if outputs else None,
+            **(_telemetry.cost_fields(model, payload, outputs) if outputs else {}),
+        )
+
+
+_poller = None
+_poller_lock = threading.Lock()
+
+
+def get_poller() -> TaskPoller:
+    """Return the process-wide TaskPoller, starting it on first use."""
+    global _poller
+    if _poller is None:
+        with _poller_lock:
+            if _poller is None:
+                workers = _config.get_int("WaveSpeed", "poll_workers", DEFAULT_POLL_WORKERS)
+                _poller = TaskPoller(poll_workers=workers)
+    return _poller
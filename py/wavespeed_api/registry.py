@@ -0,0 +1,302 @@
+# ABOUTME: Declarative WaveSpeed model registry that generates ComfyUI node classes from specs
+# ABOUTME: Every generated node shares one submit / sync-or-poll / output conversion path
+
+import inspect
+from typing import Dict, Any, List, Tuple
+
+from .client import WaveSpeedClient
+from .tasks import completed_task, defer_task
+from .utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
+from .. import _polling, _telemetry
+from .._images import BATCH_STRATEGY_INPUT
+
+CATEGORY = "neuralsins/WaveSpeed"
+
+DEFER_RESULT_INPUT = ("BOOLEAN", {
+    "default": False,
+    "tooltip": "Return a task handle immediately instead of waiting; resolve it with NS WaveSpeed Task Result"
+})
+
+
+# Payload rules
+#
+# A spec's "payload" is an ordered list of rules. Each rule reads the node's
+# input values and writes zero or more keys into the request payload.
+
+def field(name: str, key: str = None):
+    """Send an input as-is, optionally under a different payload key."""
+    def apply(values, payload):
+        payload[key or name] = values[name]
+    return apply
+
+
+def const(key: str, value: Any):
+    """Send a fixed value."""
+    def apply(values, payload):
+        payload[key] = value
+    return apply
+
+
+def optional_text(name: str, key: str = None):
+    """Send a stripped string input only when it isn't empty."""
+    def apply(values, payload):
+        value = values.get(name)
+        if value and str(value).strip():
+            payload[key or name] = str(value).strip()
+    return apply
+
+
+def seed(name: str = "seed", random_value: int = -1):
+    """Send the seed unless it is the API's "random" value."""
+    def apply(values, payload):
+        if values[name] != random_value:
+            payload[name] = values[name]
+    return apply
+
+
+def url_list(key: str, first: str, *rest: str):
+    """Send a list of URLs: the first input always, the others when set."""
+    def apply(values, payload):
+        urls = [values[first]]
+        for name in rest:
+            value = values.get(name)
+            if value and value.strip():
+                urls.append(value.strip())
+        payload[key] = urls
+    return apply
+
+
+def url_lines(key: str, first: str, lines: str, limit: int):
+    """Send a list of URLs: the first input plus up to limit newline-separated extras."""
+    def apply(values, payload):
+        urls = [values[first]]
+        extra = values.get(lines) or ""
+        urls.extend([url.strip() for url in extra.split("\n") if url.strip()][:limit])
+        payload[key] = urls
+    return apply
+
+
+def lora_list(key: str, *pairs: Tuple[str, str]):
+    """Send a list of {path, scale} LoRAs from (path input, scale input) pairs, skipping empty paths."""
+    def apply(values, payload):
+        payload[key] = [
+            {"path": values[path].strip(), "scale": values[scale]}
+            for path, scale in pairs
+            if values.get(path) and values[path].strip()
+        ]
+    return apply
+
+
+def size_override(key: str, name: str, override: str):
+    """Send a 'width*height' size, letting a free-text input override the dropdown."""
+    def apply(values, payload):
+        custom = (values.get(override) or "").strip()
+        if custom and "*" not in custom:
+            raise ValueError(f"Invalid custom size format: {custom}. Must be 'width*height'")
+        payload[key] = custom or values[name]
+    return apply
+
+
+# Output kinds
+
+def _video_outputs(client: WaveSpeedClient, task_id, outputs: List[str], values: Dict[str, Any]):
+    video_url = outputs[0]
+    print(f"Video generation completed. URL: {video_url}")
+    return (video_url, completed_task(client, task_id, [video_url]))
+
+
+def _image_outputs(client: WaveSpeedClient, task_id, outputs: List[str], values: Dict[str, Any]):
+    print(f"Task completed. Generated {len(outputs)} image(s)")
+    return (imageurl2tensor(outputs, batch_strategy=values.get("batch_strategy", "resize")),)
+
+
+OUTPUT_KINDS = {
+    "video": {
+        "types": ("STRING", "WAVESPEED_TASK"),
+        "names": ("video_url", "task"),
+        "convert": _video_outputs,
+        "deferrable": True,
+    },
+    "image": {
+        "types": ("IMAGE",),
+        "names": ("output_image",),
+        "convert": _image_outputs,
+        "deferrable": False,
+    },
+}
+
+
+def _input_default(input_type) -> Any:
+    kind = input_type[0]
+    options = input_type[1] if len(input_type) > 1 else {}
+    if "default" in options:
+        return options["default"]
+    if isinstance(kind, list) and kind:
+        return kind[0]
+    return None
+
+
+class WaveSpeedModelNode:
+    """
+    Base class for registry-generated WaveSpeed nodes.
+
+    Subclasses only set SPEC; submitting, sync or async waiting, deferred
+    task handles and output conversion are shared by every model.
+    """
+
+    SPEC: Dict[str, Any] = {}
+    CATEGORY = CATEGORY
+    FUNCTION = "execute"
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        inputs = cls.SPEC["inputs"]
+        required = {"client": ("WAVESPEED_AI_API_CLIENT",)}
+        required.update(inputs["required"])
+        optional = dict(inputs.get("optional", {}))
+        if OUTPUT_KINDS[cls.SPEC["output"]]["deferrable"]:
+            optional["defer_result"] = DEFER_RESULT_INPUT
+        if cls.SPEC.get("base64_output"):
+            optional["output_mode"] = OUTPUT_MODE_INPUT
+        if cls.SPEC.get("multi_output"):
+            optional["batch_strategy"] = BATCH_STRATEGY_INPUT
+        result = {"required": required}
+        if optional:
+            result["optional"] = optional
+        return result
+
+    @classmethod
+    def build_payload(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the request payload from input values
+
+        Args:
+            values: Node input values, with defaults filled in for unset optionals
+
+        Returns:
+            Request payload dict
+        """
+        payload = {}
+        for rule in cls.SPEC["payload"]:
+            rule(values, payload)
+        return payload
+
+    def execute(self, client, **kwargs):
+        """
+        Submit the model request and return its outputs
+
+        Args:
+            client: WaveSpeed API client
+            **kwargs: Node inputs as declared in the spec
+
+        Returns:
+            Outputs converted according to the spec's output kind
+        """
+        spec = self.SPEC
+        kind = OUTPUT_KINDS[spec["output"]]
+        values = {name: _input_default(input_type)
+                  for section in spec["inputs"].values()
+                  for name, input_type in section.items()}
+        values.update(kwargs)
+
+        try:
+            payload = self.build_payload(values)
+            if spec.get("base64_output"):
+                apply_output_mode(payload, values.get("output_mode", "auto"))
+
+            # Create the actual client object from the client dict
+            real_client = WaveSpeedClient(api_key=client["api_key"])
+            response = real_client.post(spec["endpoint"], payload, timeout=real_client.once_timeout)
+
+            if values.get("enable_sync_mode"):
+                # For sync mode, response should contain outputs directly
+                if "outputs" in response and response["outputs"]:
+                    return kind["convert"](real_client, response.get("id"), response["outputs"], values)
+                else:
+                    raise Exception(f"No output received from sync API. Response: {response}")
+
+            # For async mode, get task ID and poll for results
+            task_id = response.get("id")
+            if not task_id:
+                raise Exception(f"No task ID received from API. Response: {response}")
+
+            if kind["deferrable"] and values.get("defer_result"):
+                print(f"Task submitted. Request ID: {task_id} (resolve with NS WaveSpeed Task Result)")
+                handle = defer_task(real_client, task_id, polling_interval=spec["polling_interval"],
+                                    timeout=spec["timeout"])
+                return ("",) * (len(kind["types"]) - 1) + (handle,)
+
+            print(f"Task submitted successfully. Request ID: {task_id}")
+            try:
+                result = real_client.wait_for_task(task_id, polling_interval=spec["polling_interval"],
+                                                   timeout=spec["timeout"])
+
+                if "outputs" in result and result["outputs"]:
+                    return kind["convert"](real_client, task_id, result["outputs"], values)
+                else:
+                    raise Exception("Task completed but no output received")
+
+            except Exception as e:
+                raise Exception(f"Async task failed: {str(e)}")
+
+        except Exception as e:
+            print(f"Error in {spec['display_name']}: {str(e)}")
+            raise e
+
+
+def build_node_class(spec: Dict[str, Any]) -> type:
+    """
+    Generate a node class from a model spec
+
+    Spec keys:
+        name: Node class name (the key saved in workflows)
+        display_name: Name shown in the node menu
+        description: Node docstring
+        endpoint: API endpoint path
+        output: Output kind, a key of OUTPUT_KINDS
+        output_name: Optional name for the first output
+        expected_latency: Typical generation time in seconds, used as the polling prior
+        polling_interval: Shortest time between polls in seconds
+        timeout: Maximum time to wait in seconds
+        base64_output: True if the model can return images inline; adds an output_mode input
+        multi_output: True if one request can return several images; adds a batch_strategy input
+        pricing: {"unit", "price", "by"} for cost estimates in the telemetry log (see _telemetry.register_price)
+        inputs: {"required": {...}, "optional": {...}} without the client input
+        payload: Ordered list of payload rules
+
+    Args:
+        spec: Model spec dict
+
+    Returns:
+        Node class
+    """
+    kind = OUTPUT_KINDS[spec["output"]]
+    return_names = (spec.get("output_name", kind["names"][0]),) + kind["names"][1:]
+    if spec.get("expected_latency"):
+        _polling.register_prior(spec["endpoint"], spec["expected_latency"])
+    if spec.get("pricing"):
+        _telemetry.register_price(spec["endpoint"], **spec["pricing"])
+    return type(spec["name"], (WaveSpeedModelNode,), {
+        "__doc__": inspect.cleandoc(spec.get("description", "")),
+        "SPEC": spec,
+        "RETURN_TYPES": kind["types"],
+        "RETURN_NAMES": return_names,
+    })
+
+
+def build_node_mappings(specs: List[Dict[str, Any]]) -> Tuple[Dict[str, type], Dict[str, str]]:
+    """
+    Generate node classes for a list of model specs
+
+    Args:
+        specs: Model spec dicts
+
+    Returns:
+        (NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS)
+    """
+    class_mappings = {}
+    display_mappings = {}
+    for spec in specs:
+        class_mappings[spec["name"]] = build_node_class(spec)
+        display_mappings[spec["name"]] = spec["display_name"]
+    return class_mappings, display_mappings
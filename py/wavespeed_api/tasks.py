@@ -0,0 +1,99 @@
+# ABOUTME: WAVESPEED_TASK handles for deferred result resolution
+# Lets a node submit a task, return immediately, and resolve the result in a later node
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional
+
+from .client import WaveSpeedClient
+
+# Handles kept before finished futures are pruned
+MAX_TRACKED_TASKS = 256
+
+_futures: Dict[str, Future] = {}
+_lock = threading.Lock()
+
+
+def _track(task_id: str, future: Future):
+    with _lock:
+        if len(_futures) >= MAX_TRACKED_TASKS:
+            for key in [k for k, f in _futures.items() if f.done()]:
+                del _futures[key]
+        _futures[task_id] = future
+
+
+def defer_task(client: WaveSpeedClient, task_id: str, polling_interval: float = 1,
+               timeout: int = 300) -> Dict[str, Any]:
+    """
+    Start polling a submitted task in the background and return its handle
+
+    Args:
+        client: WaveSpeedClient that submitted the task
+        task_id: Task ID returned by the submit request
+        polling_interval: Shortest time between polls in seconds
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        WAVESPEED_TASK handle dict
+    """
+    endpoint = client.last_submit[0] if client.last_submit else None
+    _track(task_id, client.watch_task(task_id, polling_interval, timeout))
+    return {
+        "api_key": client.api_key,
+        "task_id": task_id,
+        "endpoint": endpoint,
+        "polling_interval": polling_interval,
+        "timeout": timeout,
+        "outputs": None,
+    }
+
+
+def completed_task(client: WaveSpeedClient, task_id: Optional[str], outputs: List[str]) -> Dict[str, Any]:
+    """
+    Build a handle for a task whose outputs are already known
+
+    Args:
+        client: WaveSpeedClient that ran the task
+        task_id: Task ID, if the API returned one
+        outputs: Output URLs of the finished task
+
+    Returns:
+        WAVESPEED_TASK handle dict
+    """
+    return {
+        "api_key": client.api_key,
+        "task_id": task_id,
+        "endpoint": client.last_submit[0] if client.last_submit else None,
+        "polling_interval": 1,
+        "timeout": 0,
+        "outputs": list(outputs),
+    }
+
+
+def resolve_task(handle: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Block until a task handle's result is available
+
+    Reuses the background watch started by defer_task when it is still
+    tracked; otherwise (e.g. after a restart) starts a new one.
+
+    Args:
+        handle: WAVESPEED_TASK handle dict
+
+    Returns:
+        Completed task result with an "outputs" list
+    """
+    if handle.get("outputs"):
+        return {"id": handle.get("task_id"), "status": "completed", "outputs": handle["outputs"]}
+
+    task_id = handle["task_id"]
+    with _lock:
+        future = _futures.get(task_id)
+    if future is None:
+        client = WaveSpeedClient(api_key=handle["api_key"])
+        future = client.watch_task(
+            task_id, handle.get("polling_interval", 1), handle.get("timeout", 300),
+            model=handle.get("endpoint"),
+        )
+        _track(task_id, future)
+    return future.result()
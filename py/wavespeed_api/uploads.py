@@ -0,0 +1,310 @@
+# ABOUTME: Uploads ComfyUI IMAGE tensors to a media host so they can feed URL-only model inputs
+# ABOUTME: Uploads are deduplicated by content hash and their URLs cached on disk until they expire
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import requests
+from PIL import Image
+
+from .. import _config, _telemetry
+from .._http import get_session
+from .._polling import parse_retry_after
+from .._ratelimit import get_limiter
+from .._retry import RetryableError, call_with_retry, get_breaker, http_error
+from .client import default_base_url
+
+UPLOAD_ENDPOINT = "/api/v3/media/upload/binary"
+UPLOAD_TIMEOUT = 120
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "cache", "uploads.json",
+)
+DEFAULT_URL_TTL_HOURS = 24
+
+# format -> (PIL format, MIME type, file extension)
+FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+    "png": ("PNG", "image/png", "png"),
+    "webp": ("WEBP", "image/webp", "webp"),
+}
+
+
+def _post_file(session, url: str, field: str, filename: str, data: bytes, content_type: str,
+               limiter=None) -> Dict[str, Any]:
+    """
+    POST one file as multipart form data, once
+
+    Failures are classified like API requests: 429/5xx responses and
+    dropped connections raise RetryableError, other errors FatalError.
+
+    Returns:
+        Parsed JSON response
+    """
+    try:
+        with limiter.request() if limiter is not None else nullcontext():
+            response = session.post(url, files={field: (filename, data, content_type)},
+                                    timeout=UPLOAD_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        raise RetryableError(f"Upload failed: {str(e)}")
+
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    if response.status_code == 429 and limiter is not None:
+        limiter.throttled(retry_after)
+    if response.status_code >= 400:
+        raise http_error(
+            response.status_code,
+            f"Upload failed: {response.status_code} {response.reason}: {response.text[:500]}",
+            retry_after,
+        )
+    try:
+        return response.json()
+    except ValueError:
+        raise RetryableError(f"Upload returned a non-JSON response (HTTP {response.status_code})",
+                             status=response.status_code, retry_after=retry_after)
+
+
+def _lookup_path(result: Any, path: str) -> Optional[str]:
+    """Follow a dotted key path (e.g. "data.download_url") into a JSON response."""
+    for key in path.split("."):
+        if not isinstance(result, dict):
+            return None
+        result = result.get(key)
+    return result if isinstance(result, str) and result else None
+
+
+class WaveSpeedUploadBackend:
+    """Uploads to WaveSpeed's media endpoint with the account's API key."""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        self.base_url = base_url or default_base_url()
+        self.session = get_session(self.base_url, api_key)
+        self.limiter = get_limiter("wavespeed", api_key)
+        # Uploaded files are public URLs, so any account's upload of the same image can be reused
+        self.identity = f"wavespeed:{self.base_url}"
+
+    def upload(self, data: bytes, filename: str, content_type: str) -> str:
+        url = f"{self.base_url}{UPLOAD_ENDPOINT}"
+        result = call_with_retry(
+            lambda: _post_file(self.session, url, "file", filename, data, content_type, self.limiter),
+            breaker=get_breaker(url),
+            label=f"Upload to {UPLOAD_ENDPOINT}",
+        )
+        download_url = _lookup_path(result, "data.download_url")
+        if not download_url:
+            raise Exception(f"No download URL in upload response: {result}")
+        return download_url
+
+
+class HttpUploadBackend:
+    """
+    Uploads to any endpoint accepting a multipart file POST and answering with JSON.
+
+    Configured through [Upload] http_url, http_field and http_url_key; a
+    small local HTTP server can stand in for the media host this way.
+    """
+
+    def __init__(self, url: str, field: str = "file", url_key: str = "url"):
+        if not url:
+            raise ValueError("Upload backend 'http' needs [Upload] http_url in config.ini")
+        self.url = url
+        self.field = field
+        self.url_key = url_key
+        self.session = get_session(url)
+        self.identity = f"http:{url}"
+
+    def upload(self, data: bytes, filename: str, content_type: str) -> str:
+        result = call_with_retry(
+            lambda: _post_file(self.session, self.url, self.field, filename, data, content_type),
+            breaker=get_breaker(self.url),
+            label=f"Upload to {self.url}",
+        )
+        uploaded_url = _lookup_path(result, self.url_key)
+        if not uploaded_url:
+            raise Exception(f"No '{self.url_key}' in upload response: {result}")
+        return uploaded_url
+
+
+def _http_backend(api_key: str) -> HttpUploadBackend:
+    return HttpUploadBackend(
+        _config.get("Upload", "http_url", ""),
+        field=_config.get("Upload", "http_field", "file") or "file",
+        url_key=_config.get("Upload", "http_url_key", "url") or "url",
+    )
+
+
+# Backend name -> factory taking the WaveSpeed API key
+BACKENDS: Dict[str, Callable[[str], Any]] = {
+    "wavespeed": WaveSpeedUploadBackend,
+    "http": _http_backend,
+}
+
+
+def register_backend(name: str, factory: Callable[[str], Any]):
+    """
+    Make an upload backend selectable with [Upload] backend = name
+
+    Args:
+        name: Backend name
+        factory: Callable taking the API key and returning an object with an
+            identity string and upload(data, filename, content_type) -> URL
+    """
+    BACKENDS[name] = factory
+
+
+def get_backend(api_key: str, name: Optional[str] = None):
+    """
+    Create the configured upload backend
+
+    Args:
+        api_key: WaveSpeed AI API key
+        name: Backend name (defaults to [Upload] backend, then "wavespeed")
+
+    Returns:
+        Upload backend
+    """
+    name = name or _config.get("Upload", "backend", "") or "wavespeed"
+    factory = BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown upload backend: {name}. Available: {', '.join(BACKENDS)}")
+    return factory(api_key)
+
+
+# URL index: content hash -> {"url", "uploaded_at"}, shared by all runs
+
+_lock = threading.Lock()
+_index: Optional[Dict[str, Dict[str, Any]]] = None
+_uploading: Dict[str, list] = {}  # content hash -> [lock held while it is being uploaded, callers using it]
+
+
+def _index_path() -> str:
+    return _config.get("Upload", "index", "") or DEFAULT_INDEX_PATH
+
+
+def _ttl() -> float:
+    return max(0.0, _config.get_float("Upload", "url_ttl_hours", DEFAULT_URL_TTL_HOURS)) * 3600
+
+
+def _load_index():
+    global _index
+    if _index is not None:
+        return
+    try:
+        with open(_index_path(), "r", encoding="utf-8") as f:
+            _index = json.load(f)
+    except (OSError, ValueError):
+        _index = {}
+
+
+def _cached_url(digest: str) -> Optional[str]:
+    with _lock:
+        _load_index()
+        entry = _index.get(digest)
+        if entry and time.time() - entry.get("uploaded_at", 0) < _ttl():
+            return entry["url"]
+    return None
+
+
+def _remember_url(digest: str, url: str):
+    with _lock:
+        _load_index()
+        now = time.time()
+        ttl = _ttl()
+        for key in [key for key, entry in _index.items() if now - entry.get("uploaded_at", 0) >= ttl]:
+            del _index[key]
+        _index[digest] = {"url": url, "uploaded_at": now}
+        path = _index_path()
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(_index, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[NSWaveSpeedUpload] Could not write upload index: {e}")
+
+
+def encode_image(pixels: np.ndarray, image_format: str = "jpeg", quality: int = 90) -> bytes:
+    """
+    Encode uint8 RGB pixels
+
+    Args:
+        pixels: uint8 array [height, width, 3]
+        image_format: "jpeg", "png" or "webp"
+        quality: JPEG/WebP quality (1-100); PNG is lossless and ignores it
+
+    Returns:
+        Encoded image bytes
+    """
+    pil_format = FORMATS[image_format][0]
+    options = {"compress_level": 4} if pil_format == "PNG" else {"quality": quality}
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format=pil_format, **options)
+    return buffer.getvalue()
+
+
+def upload_image(backend, image, image_format: str = "jpeg", quality: int = 90) -> str:
+    """
+    Upload one image and return its URL, reusing an earlier upload of the same content
+
+    The content hash covers the pixels, the encoding settings and the
+    backend, so an unchanged reference image is uploaded once and its URL
+    reused across runs until [Upload] url_ttl_hours have passed.
+
+    Args:
+        backend: Upload backend from get_backend
+        image: ComfyUI image tensor [height, width, channels]
+        image_format: "jpeg", "png" or "webp"
+        quality: JPEG/WebP quality (1-100)
+
+    Returns:
+        URL of the uploaded image
+    """
+    if image_format not in FORMATS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+    pixels = np.clip(255.0 * image[..., :3].cpu().numpy(), 0, 255).astype(np.uint8)
+
+    hasher = hashlib.sha256()
+    hasher.update(f"{backend.identity}\n{image_format}\n{quality}\n{pixels.shape}\n".encode("utf-8"))
+    hasher.update(pixels.tobytes())
+    digest = hasher.hexdigest()
+
+    # Identical images uploaded at the same time (e.g. within one batch) wait for the first upload
+    with _lock:
+        entry = _uploading.setdefault(digest, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            return _upload_locked(backend, digest, pixels, image_format, quality)
+    finally:
+        with _lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _uploading[digest]
+
+
+def _upload_locked(backend, digest: str, pixels: np.ndarray, image_format: str, quality: int) -> str:
+    """upload_image's body, run while holding the content hash's lock. Returns the URL."""
+    url = _cached_url(digest)
+    if url:
+        print(f"[NSWaveSpeedUpload] Reusing upload of identical image: {url}")
+        _telemetry.record(backend.identity.split(":", 1)[0], "upload", endpoint=UPLOAD_ENDPOINT,
+                          cached=True)
+        return url
+
+    _, content_type, extension = FORMATS[image_format]
+    data = encode_image(pixels, image_format, quality)
+    with _telemetry.span(backend.identity.split(":", 1)[0], "upload", endpoint=UPLOAD_ENDPOINT,
+                         bytes=len(data)):
+        url = backend.upload(data, f"{digest[:16]}.{extension}", content_type)
+    _remember_url(digest, url)
+    print(f"[NSWaveSpeedUpload] Uploaded {len(data) // 1024} KB: {url}")
+    return url
@@ -1,56 +1,102 @@
 # ABOUTME: Utility functions for WaveSpeed API nodes
-# Handles image URL to tensor conversions for ComfyUI
+# Handles image URL to tensor conversions for ComfyUI and how output images are delivered
 
-import io
-import requests
+import re
 import torch
-import numpy as np
-from PIL import Image
-from typing import Union, List
+from typing import Union, List, Dict, Any
 
+from .. import _config
+from .._images import load_images
 
-def imageurl2tensor(image_urls: Union[str, List[str]]) -> torch.Tensor:
+OUTPUT_MODES = ["auto", "url", "base64"]
+
+OUTPUT_MODE_INPUT = (OUTPUT_MODES, {
+    "default": "auto",
+    "tooltip": "How output images are delivered: inline base64 in the API response (one round-trip), "
+               "URLs downloaded afterwards, or auto (inline for small and medium images in sync mode)"
+})
+
+# Largest total output, in pixels, that auto mode requests inline (about two 1024x1024 images)
+DEFAULT_INLINE_MAX_PIXELS = 2 * 1024 * 1024
+# Assumed output size when the payload doesn't say (most models default to about 1 megapixel)
+DEFAULT_OUTPUT_PIXELS = 1024 * 1024
+
+# Pixel counts of the "1k" / "2k" / ... resolution values
+RESOLUTION_PIXELS = {
+    "1k": 1024 * 1024,
+    "2k": 2048 * 2048,
+    "4k": 4096 * 4096,
+    "8k": 8192 * 8192,
+}
+
+_SIZE_PATTERN = re.compile(r"(\d+)\s*[*x×]\s*(\d+)")
+
+
+def imageurl2tensor(image_urls: Union[str, List[str]], batch_strategy: str = "resize") -> torch.Tensor:
     """
     Convert image URL(s) to ComfyUI tensor format
-    
+
+    Images are downloaded and decoded concurrently by the shared loader.
+    Base64 outputs (data URIs or bare base64) are decoded without a download.
+
     Args:
         image_urls: Single URL string or list of URL strings
-        
+        batch_strategy: "resize", "pad" or "error" when the images differ in size
+
     Returns:
         torch.Tensor in ComfyUI format [batch, height, width, channels]
     """
-    # Handle single URL
-    if isinstance(image_urls, str):
-        image_urls = [image_urls]
-    
-    tensors = []
-    
-    for url in image_urls:
-        try:
-            # Download image
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Convert to PIL Image
-            image = Image.open(io.BytesIO(response.content))
-            
-            # Convert to RGB if necessary
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-            
-            # Convert to numpy array
-            image_np = np.array(image).astype(np.float32) / 255.0
-            
-            # Convert to tensor
-            image_tensor = torch.from_numpy(image_np)
-            
-            tensors.append(image_tensor)
-            
-        except Exception as e:
-            raise Exception(f"Failed to load image from {url}: {str(e)}")
-    
-    # Stack all images into batch
-    if len(tensors) == 1:
-        return tensors[0].unsqueeze(0)
+    return load_images(image_urls, strategy=batch_strategy)
+
+
+def estimate_output_pixels(payload: Dict[str, Any]) -> int:
+    """
+    Estimate the total pixel count of a request's output images
+
+    Reads a "width*height" size, a "1k"/"2k"/... resolution or an upscaler
+    target resolution, multiplied by the number of images requested.
+
+    Args:
+        payload: Request payload dict
+
+    Returns:
+        Estimated pixels across all output images
+    """
+    pixels = DEFAULT_OUTPUT_PIXELS
+    match = _SIZE_PATTERN.search(str(payload.get("size") or ""))
+    if match:
+        pixels = int(match.group(1)) * int(match.group(2))
+    else:
+        resolution = str(payload.get("resolution") or payload.get("target_resolution") or "").lower()
+        pixels = RESOLUTION_PIXELS.get(resolution, pixels)
+
+    count = payload.get("num_images") or payload.get("max_images") or 1
+    return pixels * max(1, int(count))
+
+
+def apply_output_mode(payload: Dict[str, Any], output_mode: str = "auto") -> bool:
+    """
+    Set enable_base64_output on a payload according to the node's output mode
+
+    In auto mode images come back inline when the request is synchronous
+    and the estimated output is at most [Images] inline_max_pixels: the
+    bytes then arrive with the response instead of over a second connection
+    to the CDN. Large images and async tasks keep URL delivery, where the
+    base64 overhead outweighs the saved round-trip.
+
+    Args:
+        payload: Request payload dict, modified in place
+        output_mode: "auto", "url" or "base64"
+
+    Returns:
+        True if base64 output was requested
+    """
+    if output_mode == "base64":
+        inline = True
+    elif output_mode == "url":
+        inline = False
     else:
-        return torch.stack(tensors)
+        limit = _config.get_int("Images", "inline_max_pixels", DEFAULT_INLINE_MAX_PIXELS)
+        inline = bool(payload.get("enable_sync_mode")) and estimate_output_pixels(payload) <= limit
+    payload["enable_base64_output"] = inline
+    return inline
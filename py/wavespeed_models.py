@@ -0,0 +1,2154 @@
+# ABOUTME: Spec table for the WaveSpeed models served by the generic registry engine
+# ABOUTME: Adding a model is one entry here: endpoint, inputs, payload rules, output kind and expected latency
+
+from .wavespeed_api.registry import (
+    build_node_mappings, const, field, lora_list, optional_text, seed, size_override, url_lines, url_list,
+)
+
+MODEL_SPECS = [
+    # Video models
+    {
+        "name": "NSWaveSpeedSora2ImageToVideo",
+        "display_name": "NS WaveSpeed Sora 2 Image to Video",
+        "description": """
+            OpenAI Sora 2 Image-to-Video Node
+
+            Transforms static images into dynamic videos with physics-aware motion.
+            Preserves image identity, lighting, and composition while adding cinematic camera movements.
+            Pricing: $0.10 per second.
+        """,
+        "endpoint": "/api/v3/openai/sora-2/image-to-video",
+        "pricing": {"unit": "second", "price": 0.10},
+        "output": "video",
+        "expected_latency": 180,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Source image URL for video generation (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Positive prompt guiding video generation - describe desired motion and characteristics",
+                }),
+                "duration": ([4, 8, 12], {
+                    "default": 4,
+                    "tooltip": "Video duration in seconds (4s=$0.40, 8s=$0.80, 12s=$1.20)",
+                }),
+            },
+            "optional": {
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("image"),
+            field("prompt"),
+            field("duration"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedSora2ImageToVideoPro",
+        "display_name": "NS WaveSpeed Sora 2 Image to Video Pro",
+        "description": """
+            OpenAI Sora 2 Image-to-Video Pro Node
+
+            Professional-grade image-to-video with higher resolutions (720p/1080p).
+            Preserves image identity, lighting, and composition while generating physics-aware motion.
+            Supports cinematic camera movements and optional synchronized audio.
+        """,
+        "endpoint": "/api/v3/openai/sora-2/image-to-video-pro",
+        "pricing": {"unit": "second", "price": {"720p": 0.30, "1080p": 0.50}, "by": "resolution"},
+        "output": "video",
+        "expected_latency": 180,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Reference image URL for video generation (PNG/JPEG) - connect from Upload Image node",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe the mood, motion style, or camera behavior for video generation",
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "720p",
+                    "tooltip": "Video output resolution - 720p or 1080p (higher cost)",
+                }),
+                "duration": ([4, 8, 12], {
+                    "default": 4,
+                    "tooltip": "Video duration in seconds (720p: 4s=$1.20, 8s=$2.40, 12s=$3.60 | 1080p: 4s=$2.00, 8s=$4.00, 12s=$6.00)",
+                }),
+            },
+            "optional": {
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image"),
+            field("resolution"),
+            field("duration"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedSora2TextToVideo",
+        "display_name": "NS WaveSpeed Sora 2 Text to Video",
+        "description": """
+            OpenAI Sora 2 Text-to-Video Node
+
+            Generates high-quality videos with physics-aware motion and synchronized audio.
+            Features temporal consistency, high-frequency detail preservation, and strong prompt steerability.
+        """,
+        "endpoint": "/api/v3/openai/sora-2/text-to-video",
+        "pricing": {"unit": "second", "price": 0.10},
+        "output": "video",
+        "expected_latency": 180,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe the scene, style, camera movements, and audio cues for video generation",
+                }),
+                "size": (["720*1280", "1280*720"], {
+                    "default": "1280*720",
+                    "tooltip": "Video resolution - 720*1280 (portrait) or 1280*720 (landscape)",
+                }),
+                "duration": ([4, 8, 12], {
+                    "default": 4,
+                    "tooltip": "Video duration in seconds (4s=$0.40, 8s=$0.80, 12s=$1.20)",
+                }),
+            },
+            "optional": {
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("size"),
+            field("duration"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedSora2TextToVideoPro",
+        "display_name": "NS WaveSpeed Sora 2 Text to Video Pro",
+        "description": """
+            OpenAI Sora 2 Text-to-Video Pro Node
+
+            Professional-grade video generation with higher resolutions (up to 1792*1024).
+            Features physics-aware motion, synchronized audio, and cinematic camera techniques.
+        """,
+        "endpoint": "/api/v3/openai/sora-2/text-to-video-pro",
+        "output": "video",
+        "expected_latency": 180,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe the scene, style, camera movements, and audio cues for video generation",
+                }),
+                "size": (["720*1280", "1280*720", "1024*1792", "1792*1024"], {
+                    "default": "1280*720",
+                    "tooltip": "Video resolution - Standard (720*1280, 1280*720) or Pro (1024*1792, 1792*1024)",
+                }),
+                "duration": ([4, 8, 12], {
+                    "default": 4,
+                    "tooltip": "Video duration in seconds (pricing varies by resolution and duration)",
+                }),
+            },
+            "optional": {
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("size"),
+            field("duration"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedVeo31TextToVideo",
+        "display_name": "NS WaveSpeed VEO 3.1 Text to Video",
+        "description": """
+            Google VEO 3.1 Text-to-Video Node
+
+            Generates high-quality cinematic videos at 1080p with advanced motion and lighting.
+            Standard model with more detailed generation (takes ~2-3 minutes per 8-second clip).
+        """,
+        "endpoint": "/api/v3/google/veo3.1/text-to-video",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the desired video scene",
+                }),
+                "aspect_ratio": (["16:9", "9:16"], {
+                    "default": "16:9",
+                    "tooltip": "Video aspect ratio - 16:9 (landscape) or 9:16 (portrait)",
+                }),
+                "duration": ([4, 6, 8], {
+                    "default": 8,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "1080p",
+                    "tooltip": "Video output resolution",
+                }),
+                "generate_audio": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Generate native audio synchronized with the video",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Specify what to avoid in the generated video",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("aspect_ratio"),
+            field("duration"),
+            field("resolution"),
+            field("generate_audio"),
+            optional_text("negative_prompt"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedVeo31FastTextToVideo",
+        "display_name": "NS WaveSpeed VEO 3.1 Fast Text to Video",
+        "description": """
+            Google VEO 3.1 Fast Text-to-Video Node
+
+            Generates cinematic 1080p videos with natural motion and lighting.
+            Processes up to 30% faster than standard model.
+        """,
+        "endpoint": "/api/v3/google/veo3.1-fast/text-to-video",
+        "output": "video",
+        "expected_latency": 60,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the desired video scene",
+                }),
+                "aspect_ratio": (["16:9", "9:16"], {
+                    "default": "16:9",
+                    "tooltip": "Video aspect ratio - 16:9 (landscape) or 9:16 (portrait)",
+                }),
+                "duration": ([4, 6, 8], {
+                    "default": 8,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "1080p",
+                    "tooltip": "Video output resolution",
+                }),
+                "generate_audio": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Generate native audio synchronized with the video",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Specify what to avoid in the generated video",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("aspect_ratio"),
+            field("duration"),
+            field("resolution"),
+            field("generate_audio"),
+            optional_text("negative_prompt"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedVeo31ImageToVideo",
+        "display_name": "NS WaveSpeed VEO 3.1 Image to Video",
+        "description": """
+            Google VEO 3.1 Image-to-Video Node
+
+            Transforms static images into dynamic videos with high-quality motion.
+            Standard model with more detailed generation (~2-3 minutes per 8-second clip).
+            Supports optional ending frame for transition effects.
+        """,
+        "endpoint": "/api/v3/google/veo3.1/image-to-video",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Starting frame image URL (JPEG/PNG/WEBP) - connect from Upload Image node",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe motion/story context (e.g., 'Slow dolly zoom on a city skyline')",
+                }),
+                "aspect_ratio": (["16:9", "9:16"], {
+                    "default": "16:9",
+                    "tooltip": "Video aspect ratio - 16:9 (landscape) or 9:16 (portrait)",
+                }),
+                "duration": ([4, 6, 8], {
+                    "default": 8,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "1080p",
+                    "tooltip": "Video output resolution",
+                }),
+                "generate_audio": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Generate native audio synchronized with the video",
+                }),
+            },
+            "optional": {
+                "last_frame": ("STRING", {
+                    "default": "",
+                    "tooltip": "Optional ending frame image URL for transition effect (JPEG/PNG/WEBP)",
+                }),
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Specify undesired generation characteristics",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image"),
+            field("aspect_ratio"),
+            field("duration"),
+            field("resolution"),
+            field("generate_audio"),
+            optional_text("last_frame", "lastFrame"),
+            optional_text("negative_prompt"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedVeo31FastImageToVideo",
+        "display_name": "NS WaveSpeed VEO 3.1 Fast Image to Video",
+        "description": """
+            Google VEO 3.1 Fast Image-to-Video Node
+
+            Transforms static images into dynamic videos with natural motion.
+            Fast version processes up to 30% faster than standard model.
+            Preserves original image composition while adding cinematic motion.
+        """,
+        "endpoint": "/api/v3/google/veo3.1-fast/image-to-video",
+        "output": "video",
+        "expected_latency": 60,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Source image URL for video generation (connect from Upload Image node). Recommended: bright, high-contrast images",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe desired motion and video characteristics (e.g., 'Slow cinematic zoom out as wind moves through trees')",
+                }),
+                "aspect_ratio": (["16:9", "9:16"], {
+                    "default": "16:9",
+                    "tooltip": "Video aspect ratio - 16:9 (landscape) or 9:16 (portrait)",
+                }),
+                "duration": ([4, 6, 8], {
+                    "default": 8,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "1080p",
+                    "tooltip": "Video output resolution",
+                }),
+                "generate_audio": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Generate automatic audio synchronized with the video",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Specify unwanted elements or characteristics in the generated video",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image"),
+            field("aspect_ratio"),
+            field("duration"),
+            field("resolution"),
+            field("generate_audio"),
+            optional_text("last_frame", "lastFrame"),
+            optional_text("negative_prompt"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedVeo31ReferenceToVideo",
+        "display_name": "NS WaveSpeed VEO 3.1 Reference to Video",
+        "description": """
+            Google VEO 3.1 Reference-to-Video Node
+
+            Generates videos with consistent subject appearance across frames.
+            Supports 1-3 reference images to maintain character/object consistency.
+            Ideal for character-driven narratives and branded content.
+        """,
+        "endpoint": "/api/v3/google/veo3.1/reference-to-video",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for video generation with subject consistency",
+                }),
+                "image_1": ("STRING", {
+                    "default": "",
+                    "tooltip": "First reference image URL (required) - connect from Upload Image node. PNG/JPEG/JPG/WebP, min 128x128px, max 50MB",
+                    "forceInput": True,
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "1080p",
+                    "tooltip": "Video output resolution",
+                }),
+                "generate_audio": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Generate native audio synchronized with the video",
+                }),
+            },
+            "optional": {
+                "image_2": ("STRING", {
+                    "default": "",
+                    "tooltip": "Second reference image URL (optional) for additional subject reference",
+                }),
+                "image_3": ("STRING", {
+                    "default": "",
+                    "tooltip": "Third reference image URL (optional) for additional subject reference",
+                }),
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Specify elements to avoid in the generated video",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            url_list("images", "image_1", "image_2", "image_3"),
+            field("resolution"),
+            field("generate_audio"),
+            optional_text("negative_prompt"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan25ImageToVideo",
+        "display_name": "NS WaveSpeed Wan 2.5 Image to Video",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/alibaba/wan-2.5/image-to-video",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Image URL to animate (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for video animation",
+                }),
+                "resolution": (["480p", "720p", "1080p"], {
+                    "default": "720p",
+                    "tooltip": "Video output resolution",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe what you don't want in the video",
+                }),
+                "audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Audio URL to guide video generation (3-30 seconds, wav/mp3, ≤15MB)",
+                }),
+                "duration": ([5, 10], {
+                    "default": 5,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "enable_prompt_expansion": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Automatically expand and enhance the prompt",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("image"),
+            field("prompt"),
+            field("resolution"),
+            field("duration"),
+            field("enable_prompt_expansion"),
+            field("seed"),
+            optional_text("negative_prompt"),
+            optional_text("audio"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan25ImageToVideoFast",
+        "display_name": "NS WaveSpeed Wan 2.5 Image to Video Fast",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/alibaba/wan-2.5/image-to-video-fast",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Image URL to animate (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for video animation",
+                }),
+                "resolution": (["720p", "1080p"], {
+                    "default": "720p",
+                    "tooltip": "Video output resolution",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe what you don't want in the video",
+                }),
+                "audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Audio URL to guide video generation (3-30 seconds, wav/mp3, ≤15MB)",
+                }),
+                "duration": ([5, 10], {
+                    "default": 5,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "enable_prompt_expansion": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Automatically expand and enhance the prompt",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("image"),
+            field("prompt"),
+            field("resolution"),
+            field("duration"),
+            field("enable_prompt_expansion"),
+            field("seed"),
+            optional_text("negative_prompt"),
+            optional_text("audio"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan25TextToVideo",
+        "display_name": "NS WaveSpeed Wan 2.5 Text to Video",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/alibaba/wan-2.5/text-to-video",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for video generation",
+                }),
+                "size": (["832*480", "480*832", "1280*720", "720*1280", "1920*1080", "1080*1920"], {
+                    "default": "1280*720",
+                    "tooltip": "Video resolution (width*height)",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe what you don't want in the video",
+                }),
+                "audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Audio URL to guide video generation (3-30 seconds, wav/mp3, ≤15MB)",
+                }),
+                "duration": ([5, 10], {
+                    "default": 5,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "enable_prompt_expansion": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Automatically expand and enhance the prompt",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("size"),
+            field("duration"),
+            field("enable_prompt_expansion"),
+            field("seed"),
+            optional_text("negative_prompt"),
+            optional_text("audio"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan25TextToVideoFast",
+        "display_name": "NS WaveSpeed Wan 2.5 Text to Video Fast",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/alibaba/wan-2.5/text-to-video-fast",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for video generation",
+                }),
+                "size": (["1280*720", "720*1280", "1920*1080", "1080*1920"], {
+                    "default": "1280*720",
+                    "tooltip": "Video resolution (width*height)",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe what you don't want in the video",
+                }),
+                "audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Audio URL to guide video generation (3-30 seconds, wav/mp3, ≤15MB)",
+                }),
+                "duration": ([5, 10], {
+                    "default": 5,
+                    "tooltip": "Video duration in seconds",
+                }),
+                "enable_prompt_expansion": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Automatically expand and enhance the prompt",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("size"),
+            field("duration"),
+            field("enable_prompt_expansion"),
+            field("seed"),
+            optional_text("negative_prompt"),
+            optional_text("audio"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan22Animate",
+        "display_name": "NS WaveSpeed Wan 2.2 Animate",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/wan-2.2/animate",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 600,
+        "inputs": {
+            "required": {
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of input image for generating output (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "video_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of input video for generating output (connect from Upload Video node)",
+                    "forceInput": True,
+                }),
+                "resolution": (["480p", "720p"], {
+                    "default": "480p",
+                    "tooltip": "Output video resolution. 480p costs $0.25 per 5 seconds, 720p costs $0.50 per 5 seconds",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Additional generation guidance for the animation",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+            },
+        },
+        "payload": [
+            field("image_url", "image"),
+            field("video_url", "video"),
+            field("resolution"),
+            field("seed"),
+            optional_text("prompt"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan22I2V720p",
+        "display_name": "NS WaveSpeed Wan 2.2 I2V 720p",
+        "description": """
+            WaveSpeed AI Wan 2.2 I2V 720p Node
+
+            Advanced image-to-video generation model that creates high-quality 720p videos
+            from still images. Features enhanced motion modeling and temporal consistency
+            with support for both short and medium duration outputs.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/wan-2.2/i2v-720p",
+        "output": "video",
+        "expected_latency": 120,
+        "polling_interval": 2,
+        "timeout": 600,
+        "inputs": {
+            "required": {
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of input image for video generation (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text prompt describing the desired motion and content",
+                }),
+                "duration": ([5, 8], {
+                    "default": 5,
+                    "tooltip": "Duration of the generated video in seconds (5 or 8)",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Negative text prompt of what to avoid in the generation",
+                }),
+                "last_image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "Optional URL of an image to guide the end of the video (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+            },
+        },
+        "payload": [
+            field("image_url", "image"),
+            field("prompt"),
+            field("duration"),
+            field("seed"),
+            optional_text("negative_prompt"),
+            optional_text("last_image_url", "last_image"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedInfiniteTalk",
+        "display_name": "NS WaveSpeed InfiniteTalk",
+        "description": """
+            WaveSpeed AI InfiniteTalk Node
+
+            Audio-driven conversational AI video generation model that creates talking or singing videos
+            from a single image and audio input. Features accurate lip synchronization, head movement
+            alignment, and facial expression matching with the audio.
+
+            Unlike traditional dubbing methods, InfiniteTalk enables infinite-length video generation
+            with consistent identity preservation and instruction following capabilities.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/infinitetalk",
+        "output": "video",
+        "expected_latency": 300,
+        "polling_interval": 2,
+        "timeout": 1200,
+        "inputs": {
+            "required": {
+                "audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Audio file URL for generating lip-synced output (connect from Upload Audio node)",
+                    "forceInput": True,
+                }),
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Image to animate (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "resolution": (["480p", "720p"], {
+                    "default": "720p",
+                    "tooltip": "Output video resolution (480p: $0.15 per 5 seconds, 720p: $0.3 per 5 seconds)",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for video generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Optional generation instructions to control scene, pose, and behavior while maintaining audio synchronization",
+                }),
+                "mask_image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Optional mask image URL to specify which person to animate (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_base64_output": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Enable base64 output format",
+                }),
+            },
+        },
+        "payload": [
+            field("audio"),
+            field("image"),
+            field("resolution"),
+            field("enable_sync_mode"),
+            field("enable_base64_output"),
+            optional_text("prompt"),
+            optional_text("mask_image"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedInfiniteTalkMulti",
+        "display_name": "NS WaveSpeed InfiniteTalk Multi",
+        "description": """
+            WaveSpeed AI InfiniteTalk Multi Node
+
+            Audio-driven multi-character conversational AI video generation model that creates
+            talking or singing videos from a single image and 2 audio inputs. Features accurate
+            lip synchronization, head movement alignment, and multi-character conversation support.
+
+            Unlike standard InfiniteTalk, this Multi version enables simultaneous multi-character
+            conversations with synchronized audio and movements, perfect for dialogue scenes
+            and multi-person interactions.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/infinitetalk/multi",
+        "output": "video",
+        "expected_latency": 300,
+        "polling_interval": 2,
+        "timeout": 1200,
+        "inputs": {
+            "required": {
+                "left_audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Left audio file URL for multi-character conversation (connect from Upload Audio node)",
+                    "forceInput": True,
+                }),
+                "right_audio": ("STRING", {
+                    "default": "",
+                    "tooltip": "Right audio file URL for multi-character conversation (connect from Upload Audio node)",
+                    "forceInput": True,
+                }),
+                "image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Image containing multiple characters to animate (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "resolution": (["480p", "720p"], {
+                    "default": "720p",
+                    "tooltip": "Output video resolution (480p: $0.15 per 5 seconds, 720p: $0.3 per 5 seconds)",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for video generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Optional generation instructions to control scene, pose, and multi-character behavior",
+                }),
+                "audio_order": (["meanwhile", "left_right", "right_left"], {
+                    "default": "meanwhile",
+                    "tooltip": "Audio order for multi-character conversation: meanwhile (simultaneous), left_right, or right_left",
+                }),
+                "mask_image": ("STRING", {
+                    "default": "",
+                    "tooltip": "Optional mask image URL to specify which characters to animate (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_base64_output": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Enable base64 output format",
+                }),
+            },
+        },
+        "payload": [
+            field("left_audio"),
+            field("right_audio"),
+            field("image"),
+            field("resolution"),
+            field("enable_sync_mode"),
+            field("enable_base64_output"),
+            optional_text("prompt"),
+            optional_text("audio_order", "order"),
+            optional_text("mask_image"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedRunwayUpscale",
+        "display_name": "NS WaveSpeed RunwayML Upscale V1",
+        "description": """
+            WaveSpeed AI RunwayML Upscale V1 Node
+
+            Enhanced video upscaling using RunwayML's advanced AI models.
+            Improves video resolution and quality while preserving content integrity.
+        """,
+        "endpoint": "/api/v3/runwayml/upscale-v1",
+        "output": "video",
+        "output_name": "upscaled_video_url",
+        "expected_latency": 60,
+        "polling_interval": 2,
+        "timeout": 600,
+        "inputs": {
+            "required": {
+                "video_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of input video for upscaling (connect from Upload Video node)",
+                    "forceInput": True,
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for upscaling to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("video_url", "video"),
+        ],
+    },
+
+    # Image models
+    {
+        "name": "NSWaveSpeedFluxKontextDev",
+        "display_name": "NS WaveSpeed Flux Kontext Dev",
+        "description": """
+            Flux Kontext Dev Node
+
+            Advanced image-to-image transformation model for style conversion.
+            Specializes in converting images to anime style and other artistic transformations.
+            Built on Flux architecture with enhanced context understanding.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/flux-kontext-dev",
+        "output": "image",
+        "base64_output": True,
+        "multi_output": True,
+        "expected_latency": 10,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "Turn pictures into anime style",
+                    "tooltip": "Text prompt describing the desired transformation (e.g., 'Turn pictures into anime style')",
+                }),
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "The image URL to transform (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "guidance_scale": ("FLOAT", {
+                    "default": 2.5,
+                    "min": 1.0,
+                    "max": 20.0,
+                    "step": 0.1,
+                    "tooltip": "How closely to follow the prompt (1.0 = loose, 20.0 = strict)",
+                }),
+                "num_inference_steps": ("INT", {
+                    "default": 28,
+                    "min": 10,
+                    "max": 100,
+                    "step": 1,
+                    "tooltip": "Number of denoising steps (more steps = higher quality, slower)",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 0xffffffffffffffff,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "output_format": (["jpeg", "png", "webp"], {
+                    "default": "jpeg",
+                    "tooltip": "The format of the output image",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for image generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "num_images": ("INT", {
+                    "default": 1,
+                    "min": 1,
+                    "max": 4,
+                    "step": 1,
+                    "tooltip": "Number of images to generate (1-4)",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image_url", "image"),
+            field("guidance_scale"),
+            field("num_inference_steps"),
+            field("num_images"),
+            field("seed"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedFluxKontextMax",
+        "display_name": "NS WaveSpeed Flux Kontext Max",
+        "description": """
+            Flux Kontext Max Node
+
+            Maximum capability image-to-image transformation model with advanced safety controls.
+            Top-tier version of Flux Kontext featuring enhanced performance and configurable
+            safety tolerance for professional content creation workflows.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/flux-kontext-max",
+        "output": "image",
+        "expected_latency": 10,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "To toy style",
+                    "tooltip": "Text prompt describing the desired transformation or scene",
+                }),
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "The image URL to transform (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "guidance_scale": ("FLOAT", {
+                    "default": 3.5,
+                    "min": 1.0,
+                    "max": 20.0,
+                    "step": 0.1,
+                    "tooltip": "How closely to follow the prompt (1.0 = loose, 20.0 = strict)",
+                }),
+                "safety_tolerance": (["1", "2", "3", "4", "5"], {
+                    "default": "2",
+                    "tooltip": "Safety filter tolerance level (1 = strict, 5 = permissive)",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for image generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image_url", "image"),
+            field("guidance_scale"),
+            field("safety_tolerance"),
+            field("enable_sync_mode"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedFluxKontextPro",
+        "display_name": "NS WaveSpeed Flux Kontext Pro",
+        "description": """
+            Flux Kontext Pro Node
+
+            Professional-grade image-to-image transformation model optimized for production use.
+            Streamlined version of Flux Kontext with simplified parameters and enhanced performance.
+            Ideal for consistent, high-quality image transformations with minimal configuration.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/flux-kontext-pro",
+        "output": "image",
+        "expected_latency": 10,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "A woman is brewing tea",
+                    "tooltip": "Text prompt describing the desired transformation or scene",
+                }),
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "The image URL to transform (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "guidance_scale": ("FLOAT", {
+                    "default": 3.5,
+                    "min": 1.0,
+                    "max": 20.0,
+                    "step": 0.1,
+                    "tooltip": "How closely to follow the prompt (1.0 = loose, 20.0 = strict)",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for image generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image_url", "image"),
+            field("guidance_scale"),
+            field("enable_sync_mode"),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedFluxControlNetUnionPro2",
+        "display_name": "NS WaveSpeed Flux ControlNet Union Pro 2",
+        "description": """
+            Flux ControlNet Union Pro 2.0 Node
+
+            Advanced ControlNet model supporting simultaneous Canny, Depth, Soft Edge, Pose,
+            and Grayscale conditioning for precise image generation control.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/flux-controlnet-union-pro-2.0",
+        "output": "image",
+        "multi_output": True,
+        "expected_latency": 10,
+        "polling_interval": 1,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the image to generate",
+                }),
+                "control_image": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of control image for ControlNet guidance (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "size": ([
+                    "1024*1024",
+                    "1024*768",
+                    "768*1024",
+                    "1024*576",
+                    "576*1024",
+                    "1152*896",
+                    "896*1152",
+                    "1344*768",
+                    "768*1344",
+                    "1536*640",
+                    "640*1536",
+                ], {
+                    "default": "1024*1024",
+                    "tooltip": "Resolution of the generated image",
+                }),
+                "num_inference_steps": ("INT", {
+                    "default": 28,
+                    "min": 1,
+                    "max": 50,
+                    "tooltip": "Number of denoising steps (higher = better quality, slower)",
+                }),
+                "guidance_scale": ("FLOAT", {
+                    "default": 3.5,
+                    "min": 0.0,
+                    "max": 20.0,
+                    "step": 0.1,
+                    "tooltip": "How closely to follow the prompt (higher = more adherence)",
+                }),
+                "controlnet_conditioning_scale": ("FLOAT", {
+                    "default": 0.7,
+                    "min": 0.0,
+                    "max": 2.0,
+                    "step": 0.1,
+                    "tooltip": "Influence of control image on generation (0=none, 2=maximum)",
+                }),
+                "control_guidance_start": ("FLOAT", {
+                    "default": 0.0,
+                    "min": 0.0,
+                    "max": 1.0,
+                    "step": 0.01,
+                    "tooltip": "When to start applying control (0=beginning)",
+                }),
+                "control_guidance_end": ("FLOAT", {
+                    "default": 0.8,
+                    "min": 0.0,
+                    "max": 1.0,
+                    "step": 0.01,
+                    "tooltip": "When to stop applying control (1=end)",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 0xffffffffffffffff,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "num_images": ("INT", {
+                    "default": 1,
+                    "min": 1,
+                    "max": 4,
+                    "tooltip": "Number of images to generate (1-4)",
+                }),
+                "output_format": (["jpeg", "png", "webp"], {
+                    "default": "jpeg",
+                    "tooltip": "Format of the output image",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "custom_size": ("STRING", {
+                    "default": "",
+                    "tooltip": "Custom size as 'width*height' (e.g. '1920*1080'). Overrides size dropdown if provided.",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("control_image"),
+            size_override("size", "size", "custom_size"),
+            field("num_inference_steps"),
+            field("guidance_scale"),
+            field("controlnet_conditioning_scale"),
+            field("control_guidance_start"),
+            field("control_guidance_end"),
+            field("num_images"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedImageUpscaler",
+        "display_name": "NS WaveSpeed Image Upscaler",
+        "description": """
+            WaveSpeed AI Image Upscaler Node
+
+            The AI image upscaler is a powerful tool designed to enhance the resolution and quality of images.
+            Our model allows users to choose different levels of enhancement by adjusting the value of creativity.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/image-upscaler",
+        "output": "image",
+        "base64_output": True,
+        "output_name": "upscaled_image",
+        "expected_latency": 30,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of the image to upscale (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "target_resolution": (["2k", "4k", "8k"], {
+                    "default": "4k",
+                    "tooltip": "Target resolution for upscaling",
+                }),
+                "creativity": ("FLOAT", {
+                    "default": 0.0,
+                    "min": -2.0,
+                    "max": 2.0,
+                    "step": 0.1,
+                    "display": "slider",
+                    "tooltip": "Enhancement level (-2 to 2). Higher values add more detail but may alter the image",
+                }),
+                "output_format": (["jpeg", "png", "webp"], {
+                    "default": "jpeg",
+                    "tooltip": "Output image format",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for upscaling to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("image_url", "image"),
+            field("target_resolution"),
+            field("creativity"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaTextToImage",
+        "display_name": "NS WaveSpeed Nano Banana Text to Image",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/google/nano-banana/text-to-image",
+        "output": "image",
+        "base64_output": True,
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the image to generate",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 0xffffffffffffffff,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "output_format": (["jpeg", "png", "webp"], {
+                    "default": "png",
+                    "tooltip": "The format of the output image",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            const("enable_base64_output", False),
+            field("enable_sync_mode"),
+            field("output_format"),
+            field("prompt"),
+            seed(),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaEdit",
+        "display_name": "NS WaveSpeed Nano Banana Edit",
+        "description": """
+            Google Nano Banana Edit Node
+
+            Google's state-of-the-art image generation and editing model
+        """,
+        "endpoint": "/api/v3/google/nano-banana/edit",
+        "output": "image",
+        "base64_output": True,
+        "output_name": "image",
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "The positive prompt for image generation",
+                }),
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "URL of input image for editing (or connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "output_format": (["png", "jpeg"], {
+                    "default": "png",
+                    "tooltip": "Output format - use PNG for transparency support",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for image generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "additional_images": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Additional image URLs (one per line, max 9 additional)",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            url_lines("images", "image_url", "additional_images", 9),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaProTextToImageMulti",
+        "display_name": "NS WaveSpeed Nano Banana Pro Text to Image Multi",
+        "description": """
+            Google Nano Banana Pro Text-to-Image Multi (Gemini 3.0 Pro Image)
+
+            Generate multiple high-quality images from a single prompt in one run.
+            Extremely cost-effective at only $0.07 per image.
+
+            Features true multi-image batching, consistent style across outputs,
+            and powerful prompt understanding for editorial-style prompts.
+
+            Pricing: $0.07/image
+        """,
+        "endpoint": "/api/v3/google/nano-banana-pro/text-to-image-multi",
+        "pricing": {"unit": "image", "price": 0.07},
+        "output": "image",
+        "base64_output": True,
+        "multi_output": True,
+        "output_name": "output_images",
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the images to generate",
+                }),
+                "aspect_ratio": (["3:2", "2:3", "3:4", "4:3"], {
+                    "default": "3:2",
+                    "tooltip": "Aspect ratio of the generated images",
+                }),
+                "num_images": ("INT", {
+                    "default": 2,
+                    "min": 2,
+                    "max": 2,
+                    "tooltip": "Number of images to generate (fixed at 2)",
+                }),
+                "output_format": (["png", "jpeg"], {
+                    "default": "png",
+                    "tooltip": "Output format - use PNG for transparency support",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("aspect_ratio"),
+            field("num_images"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaProTextToImageUltra",
+        "display_name": "NS WaveSpeed Nano Banana Pro Text to Image Ultra",
+        "description": """
+            Google Nano Banana Pro Text-to-Image Ultra (Gemini 3.0 Pro Image)
+
+            Ultra high-resolution text-to-image generation with 4K/8K output support.
+            Native 4K/8K image generation with fine detail and clean edges.
+
+            Features multilingual on-image text, camera-style controls,
+            and consistent character/style rendering.
+
+            Pricing: $0.15/image (4k), $0.18/image (8k)
+        """,
+        "endpoint": "/api/v3/google/nano-banana-pro/text-to-image-ultra",
+        "pricing": {"unit": "image", "price": {"4k": 0.15, "8k": 0.18}, "by": "resolution"},
+        "output": "image",
+        "base64_output": True,
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the image to generate",
+                }),
+                "aspect_ratio": (["1:1", "3:2", "2:3", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"], {
+                    "default": "1:1",
+                    "tooltip": "Aspect ratio of the generated image",
+                }),
+                "resolution": (["4k", "8k"], {
+                    "default": "4k",
+                    "tooltip": "Output resolution: 4k ($0.15), 8k ($0.18)",
+                }),
+                "output_format": (["png", "jpeg"], {
+                    "default": "png",
+                    "tooltip": "Output format - use PNG for transparency support",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("aspect_ratio"),
+            field("resolution"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaProEdit",
+        "display_name": "NS WaveSpeed Nano Banana Pro Edit",
+        "description": """
+            Google Nano Banana Pro Edit (Gemini 3.0 Pro Image)
+
+            Advanced AI-powered image editing with 1K/2K/4K resolution support.
+            Combines precision, flexibility, and semantic awareness for professional-grade editing.
+
+            Features:
+            - Native 4K image generation with fine detail
+            - Natural-language, context-aware editing
+            - Multilingual on-image text with auto translation
+            - Camera-style controls (angle, focus, depth of field)
+            - Consistent character and style rendering
+            - Supports up to 6 input images
+
+            Pricing: $0.14/image (1k/2k), $0.24/image (4k)
+        """,
+        "endpoint": "/api/v3/google/nano-banana-pro/edit",
+        "pricing": {"unit": "image", "price": {"1k": 0.14, "2k": 0.14, "4k": 0.24}, "by": "resolution"},
+        "output": "image",
+        "base64_output": True,
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the edit to perform (e.g., 'Replace the cloudy sky with a clear sunset')",
+                }),
+                "image_1": ("STRING", {
+                    "default": "",
+                    "tooltip": "Primary input image URL (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "image_2": ("STRING", {
+                    "default": "",
+                    "tooltip": "Second input image URL (optional)",
+                }),
+                "image_3": ("STRING", {
+                    "default": "",
+                    "tooltip": "Third input image URL (optional)",
+                }),
+                "image_4": ("STRING", {
+                    "default": "",
+                    "tooltip": "Fourth input image URL (optional)",
+                }),
+                "image_5": ("STRING", {
+                    "default": "",
+                    "tooltip": "Fifth input image URL (optional)",
+                }),
+                "image_6": ("STRING", {
+                    "default": "",
+                    "tooltip": "Sixth input image URL (optional)",
+                }),
+                "aspect_ratio": (["1:1", "3:2", "2:3", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"], {
+                    "default": "1:1",
+                    "tooltip": "Aspect ratio of the output image",
+                }),
+                "resolution": (["1k", "2k", "4k"], {
+                    "default": "1k",
+                    "tooltip": "Output resolution: 1k ($0.14), 2k ($0.14), 4k ($0.24)",
+                }),
+                "output_format": (["png", "jpeg"], {
+                    "default": "png",
+                    "tooltip": "Output format - use PNG for transparency support",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            url_list("images", "image_1", "image_2", "image_3", "image_4", "image_5", "image_6"),
+            field("aspect_ratio"),
+            field("resolution"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaProEditMulti",
+        "display_name": "NS WaveSpeed Nano Banana Pro Edit Multi",
+        "description": """
+            Google Nano Banana Pro Edit Multi (Gemini 3.0 Pro Image)
+
+            Next-generation multi-image editing model that produces multiple edited outputs
+            from one or more input images in a single run.
+
+            Features:
+            - True multi-edit generation (multiple variants per request)
+            - Consistent editing style across outputs
+            - Industry-leading cost efficiency at $0.07/image
+            - Precise editing behavior (object replacement, style changes, etc.)
+            - Fast, reliable, no cold starts
+            - Supports up to 6 input images
+
+            Pricing: $0.07/image
+        """,
+        "endpoint": "/api/v3/google/nano-banana-pro/edit-multi",
+        "pricing": {"unit": "image", "price": 0.07},
+        "output": "image",
+        "base64_output": True,
+        "multi_output": True,
+        "output_name": "output_images",
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the edit to perform",
+                }),
+                "image_1": ("STRING", {
+                    "default": "",
+                    "tooltip": "Primary input image URL (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "image_2": ("STRING", {
+                    "default": "",
+                    "tooltip": "Second input image URL (optional)",
+                }),
+                "image_3": ("STRING", {
+                    "default": "",
+                    "tooltip": "Third input image URL (optional)",
+                }),
+                "image_4": ("STRING", {
+                    "default": "",
+                    "tooltip": "Fourth input image URL (optional)",
+                }),
+                "image_5": ("STRING", {
+                    "default": "",
+                    "tooltip": "Fifth input image URL (optional)",
+                }),
+                "image_6": ("STRING", {
+                    "default": "",
+                    "tooltip": "Sixth input image URL (optional)",
+                }),
+                "aspect_ratio": (["3:2", "2:3", "3:4", "4:3"], {
+                    "default": "3:2",
+                    "tooltip": "Aspect ratio of the output images",
+                }),
+                "num_images": ("INT", {
+                    "default": 2,
+                    "min": 2,
+                    "max": 2,
+                    "tooltip": "Number of edited images to generate (fixed at 2)",
+                }),
+                "output_format": (["png", "jpeg"], {
+                    "default": "png",
+                    "tooltip": "Output format - use PNG for transparency support",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            url_list("images", "image_1", "image_2", "image_3", "image_4", "image_5", "image_6"),
+            field("aspect_ratio"),
+            field("num_images"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedNanoBananaProEditUltra",
+        "display_name": "NS WaveSpeed Nano Banana Pro Edit Ultra",
+        "description": """
+            Google Nano Banana Pro Edit Ultra (Gemini 3.0 Pro Image)
+
+            Ultra high-resolution AI-powered image editing with 4K/8K output support.
+            Combines precision, flexibility, and semantic awareness for professional-grade editing.
+
+            Features:
+            - Native 4K/8K image generation with fine detail and clean edges
+            - Natural-language, context-aware editing
+            - Multilingual on-image text with auto translation
+            - Camera-style controls (angle, focus, depth of field)
+            - Consistent character and style rendering
+            - Supports up to 6 input images
+
+            Pricing: $0.15/image (4k), $0.18/image (8k)
+        """,
+        "endpoint": "/api/v3/google/nano-banana-pro/edit-ultra",
+        "pricing": {"unit": "image", "price": {"4k": 0.15, "8k": 0.18}, "by": "resolution"},
+        "output": "image",
+        "base64_output": True,
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the edit to perform (e.g., 'Replace the cloudy sky with a clear sunset')",
+                }),
+                "image_1": ("STRING", {
+                    "default": "",
+                    "tooltip": "Primary input image URL (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "image_2": ("STRING", {
+                    "default": "",
+                    "tooltip": "Second input image URL (optional)",
+                }),
+                "image_3": ("STRING", {
+                    "default": "",
+                    "tooltip": "Third input image URL (optional)",
+                }),
+                "image_4": ("STRING", {
+                    "default": "",
+                    "tooltip": "Fourth input image URL (optional)",
+                }),
+                "image_5": ("STRING", {
+                    "default": "",
+                    "tooltip": "Fifth input image URL (optional)",
+                }),
+                "image_6": ("STRING", {
+                    "default": "",
+                    "tooltip": "Sixth input image URL (optional)",
+                }),
+                "aspect_ratio": (["1:1", "3:2", "2:3", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"], {
+                    "default": "1:1",
+                    "tooltip": "Aspect ratio of the output image",
+                }),
+                "resolution": (["4k", "8k"], {
+                    "default": "4k",
+                    "tooltip": "Output resolution: 4k ($0.15), 8k ($0.18)",
+                }),
+                "output_format": (["png", "jpeg"], {
+                    "default": "png",
+                    "tooltip": "Output format - use PNG for transparency support",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            url_list("images", "image_1", "image_2", "image_3", "image_4", "image_5", "image_6"),
+            field("aspect_ratio"),
+            field("resolution"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedQwenEdit",
+        "display_name": "NS WaveSpeed Qwen Edit",
+        "description": """
+            Qwen Image Edit Node
+
+            Qwen-Image-Edit — a 20B MMDiT model for next-gen image edit generation. 
+            Built on 20B Qwen-Image, it brings precise bilingual text editing (Chinese & English) 
+            while preserving style, and supports both semantic and appearance-level editing.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/qwen-image/edit",
+        "output": "image",
+        "base64_output": True,
+        "output_name": "image",
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 1800,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "The prompt to generate an image from (supports Chinese & English)",
+                }),
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "The image URL to edit (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 0xffffffffffffffff,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "output_format": (["jpeg", "png", "webp"], {
+                    "default": "jpeg",
+                    "tooltip": "The format of the output image",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for image generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image_url", "image"),
+            field("seed"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedQwenEditLora",
+        "display_name": "NS WaveSpeed Qwen Edit LoRA",
+        "description": """
+            Qwen Image Edit with LoRA Node
+
+            Advanced version of Qwen-Image-Edit that supports LoRA (Low-Rank Adaptation) models
+            for fine-tuned image editing capabilities. Enables more precise control over style
+            and editing behavior through custom LoRA weights.
+        """,
+        "endpoint": "/api/v3/wavespeed-ai/qwen-image/edit-lora",
+        "output": "image",
+        "base64_output": True,
+        "expected_latency": 15,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "The prompt to edit the image (e.g., 'Change into a white shirt and a black coat')",
+                }),
+                "image_url": ("STRING", {
+                    "default": "",
+                    "tooltip": "The image URL to edit (connect from Upload Image node)",
+                    "forceInput": True,
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 0xffffffffffffffff,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "output_format": (["jpeg", "png", "webp"], {
+                    "default": "jpeg",
+                    "tooltip": "The format of the output image",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Wait for image generation to complete before returning",
+                }),
+            },
+            "optional": {
+                "lora_1_path": ("STRING", {
+                    "default": "",
+                    "tooltip": "First LoRA model path (e.g., 'flymy-ai/qwen-image-style-lora')",
+                }),
+                "lora_1_scale": ("FLOAT", {
+                    "default": 1.0,
+                    "min": 0.0,
+                    "max": 2.0,
+                    "step": 0.1,
+                    "tooltip": "First LoRA influence scale (0.0 to 2.0)",
+                }),
+                "lora_2_path": ("STRING", {
+                    "default": "",
+                    "tooltip": "Second LoRA model path (optional)",
+                }),
+                "lora_2_scale": ("FLOAT", {
+                    "default": 1.0,
+                    "min": 0.0,
+                    "max": 2.0,
+                    "step": 0.1,
+                    "tooltip": "Second LoRA influence scale (0.0 to 2.0)",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("image_url", "image"),
+            field("seed"),
+            field("output_format"),
+            field("enable_sync_mode"),
+            const("enable_base64_output", False),
+            lora_list("loras", ("lora_1_path", "lora_1_scale"), ("lora_2_path", "lora_2_scale")),
+        ],
+    },
+    {
+        "name": "NSWaveSpeedWan25TextToImage",
+        "display_name": "NS WaveSpeed Wan 2.5 Text to Image",
+        "description": """
+
+        """,
+        "endpoint": "/api/v3/alibaba/wan-2.5/text-to-image",
+        "output": "image",
+        "expected_latency": 20,
+        "polling_interval": 1,
+        "timeout": 300,
+        "inputs": {
+            "required": {
+                "prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for image generation",
+                }),
+            },
+            "optional": {
+                "size": ("STRING", {
+                    "default": "1024*1024",
+                    "tooltip": "Image resolution (width*height). Range: 768~1440 pixels per dimension",
+                }),
+                "negative_prompt": ("STRING", {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Describe what you don't want in the image",
+                }),
+                "enable_prompt_expansion": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Automatically expand and enhance the prompt",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "control_after_generate": True,
+                    "tooltip": "Random seed for reproducible results. -1 for random seed",
+                }),
+                "enable_sync_mode": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Wait for generation to complete before returning",
+                }),
+            },
+        },
+        "payload": [
+            field("prompt"),
+            field("size"),
+            field("enable_prompt_expansion"),
+            field("seed"),
+            optional_text("negative_prompt"),
+        ],
+    },
+]
+
+# Node registration
+NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS = build_node_mappings(MODEL_SPECS)
@@ -1,7 +1,14 @@
 import time
 
 from .wavespeed_api.client import WaveSpeedClient
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
+from .wavespeed_api.batch import run_batch, split_prompts
+from ._images import BATCH_STRATEGY_INPUT
+from . import _telemetry
+
+ENDPOINT = "/api/v3/google/nano-banana-pro/text-to-image"
+
+_telemetry.register_price(ENDPOINT, "image", {"1k": 0.14, "2k": 0.14, "4k": 0.24}, by="resolution")
 
 
 class NSWaveSpeedNanoBananaProTextToImage:
@@ -72,7 +79,36 @@ class NSWaveSpeedNanoBananaProTextToImage:
                         "tooltip": "Wait for generation to complete before returning",
                     },
                 ),
-            }
+            },
+            "optional": {
+                "batch_prompts": (
+                    "STRING",
+                    {
+                        "forceInput": True,
+                        "tooltip": "Comma-separated prompts (e.g. from NS Prompt List). Each one is generated concurrently instead of the prompt above",
+                    },
+                ),
+                "batch_count": (
+                    "INT",
+                    {
+                        "default": 1,
+                        "min": 1,
+                        "max": 20,
+                        "tooltip": "Variations per prompt, generated concurrently",
+                    },
+                ),
+                "max_in_flight": (
+                    "INT",
+                    {
+                        "default": 4,
+                        "min": 1,
+                        "max": 16,
+                        "tooltip": "Maximum number of batch tasks running at once",
+                    },
+                ),
+                "output_mode": OUTPUT_MODE_INPUT,
+                "batch_strategy": BATCH_STRATEGY_INPUT,
+            },
         }
 
     RETURN_TYPES = ("IMAGE",)
@@ -81,7 +117,18 @@ class NSWaveSpeedNanoBananaProTextToImage:
     FUNCTION = "execute"
 
     def execute(
-        self, client, prompt, aspect_ratio, resolution, output_format, enable_sync_mode
+        self,
+        client,
+        prompt,
+        aspect_ratio,
+        resolution,
+        output_format,
+        enable_sync_mode,
+        batch_prompts=None,
+        batch_count=1,
+        max_in_flight=4,
+        output_mode="auto",
+        batch_strategy="resize",
     ):
         real_client = WaveSpeedClient(api_key=client["api_key"])
 
@@ -93,8 +140,16 @@ class NSWaveSpeedNanoBananaProTextToImage:
             "enable_sync_mode": enable_sync_mode,
             "enable_base64_output": False,
         }
+        apply_output_mode(payload, output_mode)
+
+        endpoint = ENDPOINT
 
-        endpoint = "/api/v3/google/nano-banana-pro/text-to-image"
+        prompts = split_prompts(batch_prompts)
+        if prompts or batch_count > 1:
+            return self._execute_batch(
+                client, endpoint, payload, prompts or [prompt], batch_count, max_in_flight,
+                batch_strategy,
+            )
 
         try:
             response = real_client.post(
@@ -104,7 +159,7 @@ class NSWaveSpeedNanoBananaProTextToImage:
             if enable_sync_mode:
                 if "outputs" in response and response["outputs"]:
                     image_urls = response["outputs"]
-                    return (imageurl2tensor(image_urls),)
+                    return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                 else:
                     raise Exception(
                         f"No output received from sync API. Response: {response}"
@@ -120,7 +175,7 @@ class NSWaveSpeedNanoBananaProTextToImage:
 
                     if "outputs" in result and result["outputs"]:
                         image_urls = result["outputs"]
-                        return (imageurl2tensor(image_urls),)
+                        return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                     else:
                         raise Exception("Task completed but no output received")
 
@@ -131,6 +186,38 @@ class NSWaveSpeedNanoBananaProTextToImage:
             print(f"Error in {self.__class__.__name__}: {str(e)}")
             raise e
 
+    def _execute_batch(
+        self, client, endpoint, payload, prompts, batch_count, max_in_flight,
+        batch_strategy="resize",
+    ):
+        """Generate every prompt/variation concurrently and return one IMAGE batch."""
+        payloads = [
+            dict(payload, prompt=batch_prompt)
+            for batch_prompt in prompts
+            for _ in range(batch_count)
+        ]
+
+        print(f"Submitting {len(payloads)} tasks ({max_in_flight} in flight)...")
+        try:
+            results = run_batch(
+                client["api_key"],
+                endpoint,
+                payloads,
+                max_in_flight=max_in_flight,
+                polling_interval=1,
+                timeout=300,
+            )
+            image_urls = [
+                url for result in results for url in (result.get("outputs") or [])
+            ]
+            if not image_urls:
+                raise Exception("Batch completed but no output received")
+            return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
+
+        except Exception as e:
+            print(f"Error in {self.__class__.__name__}: {str(e)}")
+            raise e
+
 
 NODE_CLASS_MAPPINGS = {
     "NSWaveSpeedNanoBananaProTextToImage": NSWaveSpeedNanoBananaProTextToImage
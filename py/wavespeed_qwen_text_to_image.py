@@ -1,5 +1,5 @@
 import time
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
 from .wavespeed_api.client import WaveSpeedClient
 
 class NSWaveSpeedQwenTextToImage:
@@ -57,6 +57,7 @@ class NSWaveSpeedQwenTextToImage:
                     "default": "",
                     "tooltip": "Custom size as 'width*height' (e.g. '1920*1080'). Overrides size dropdown if provided."
                 }),
+                "output_mode": OUTPUT_MODE_INPUT,
             }
         }
     
@@ -67,7 +68,7 @@ class NSWaveSpeedQwenTextToImage:
     FUNCTION = "execute"
     
     def execute(self, client, prompt, size="1328x1328 (1:1)", seed=-1,
-                output_format="jpeg", enable_sync_mode=True, custom_size=""):
+                output_format="jpeg", enable_sync_mode=True, custom_size="", output_mode="auto"):
         """
         Execute the Qwen Image Text-to-Image model
         
@@ -79,6 +80,7 @@ class NSWaveSpeedQwenTextToImage:
             output_format: Output format (jpeg, png, or webp)
             enable_sync_mode: Whether to wait for completion
             custom_size: Optional custom size override
+            output_mode: Output image delivery (auto, url or base64)
         
         Returns:
             Generated image tensor
@@ -107,6 +109,7 @@ class NSWaveSpeedQwenTextToImage:
             "enable_sync_mode": enable_sync_mode,
             "enable_base64_output": False
         }
+        apply_output_mode(payload, output_mode)
         
         # API endpoint for Qwen Image Text-to-Image
         endpoint = "/api/v3/wavespeed-ai/qwen-image/text-to-image"
@@ -1,6 +1,6 @@
 import time
 import json
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
 from .wavespeed_api.client import WaveSpeedClient
 
 class NSWaveSpeedQwenTextToImageLora:
@@ -81,6 +81,7 @@ class NSWaveSpeedQwenTextToImageLora:
                     "default": "",
                     "tooltip": "Custom size as 'width*height' (e.g. '1920*1080'). Overrides size dropdown if provided."
                 }),
+                "output_mode": OUTPUT_MODE_INPUT,
             }
         }
 
@@ -94,7 +95,7 @@ class NSWaveSpeedQwenTextToImageLora:
                 output_format="jpeg", enable_sync_mode=True,
                 lora_1_path="", lora_1_scale=1.0,
                 lora_2_path="", lora_2_scale=1.0,
-                custom_size=""):
+                custom_size="", output_mode="auto"):
         """
         Execute the Qwen Image Text-to-Image with LoRA model
 
@@ -110,6 +111,7 @@ class NSWaveSpeedQwenTextToImageLora:
             lora_2_path: Second LoRA model path (optional)
             lora_2_scale: Second LoRA influence scale
             custom_size: Optional custom size override
+            output_mode: Output image delivery (auto, url or base64)
 
         Returns:
             Generated image tensor
@@ -152,6 +154,7 @@ class NSWaveSpeedQwenTextToImageLora:
             "enable_base64_output": False,
             "loras": lora_list
         }
+        apply_output_mode(payload, output_mode)
 
         # API endpoint for Qwen Image Text-to-Image with LoRA
         endpoint = "/api/v3/wavespeed-ai/qwen-image/text-to-image-lora"
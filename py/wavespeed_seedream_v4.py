@@ -1,6 +1,10 @@
 import time
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
+from ._images import BATCH_STRATEGY_INPUT
 from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.batch import run_batch, split_prompts
+
+SEED_MAX = 0xffffffffffffffff
 
 
 class NSWaveSpeedSeedreamV4:
@@ -36,7 +40,7 @@ class NSWaveSpeedSeedreamV4:
                 "seed": ("INT", {
                     "default": 0,
                     "min": 0,
-                    "max": 0xffffffffffffffff,
+                    "max": SEED_MAX,
                     "control_after_generate": True,
                     "tooltip": "Random seed for reproducible results"
                 }),
@@ -44,6 +48,26 @@ class NSWaveSpeedSeedreamV4:
                     "default": False,
                     "tooltip": "Wait for generation to complete before returning"
                 }),
+            },
+            "optional": {
+                "batch_prompts": ("STRING", {
+                    "forceInput": True,
+                    "tooltip": "Comma-separated prompts (e.g. from NS Prompt List). Each one is generated concurrently instead of the prompt above"
+                }),
+                "batch_count": ("INT", {
+                    "default": 1,
+                    "min": 1,
+                    "max": 20,
+                    "tooltip": "Variations per prompt. Each variation uses the next seed (seed, seed+1, ...)"
+                }),
+                "max_in_flight": ("INT", {
+                    "default": 4,
+                    "min": 1,
+                    "max": 16,
+                    "tooltip": "Maximum number of batch tasks running at once"
+                }),
+                "output_mode": OUTPUT_MODE_INPUT,
+                "batch_strategy": BATCH_STRATEGY_INPUT,
             }
         }
     
@@ -52,7 +76,9 @@ class NSWaveSpeedSeedreamV4:
     CATEGORY = "neuralsins/WaveSpeed"
     FUNCTION = "execute"
     
-    def execute(self, client, prompt, size_preset, seed, enable_sync_mode):
+    def execute(self, client, prompt, size_preset, seed, enable_sync_mode,
+                batch_prompts=None, batch_count=1, max_in_flight=4, output_mode="auto",
+                batch_strategy="resize"):
         # Create the actual client object from the client dict
         real_client = WaveSpeedClient(api_key=client["api_key"])
 
@@ -74,9 +100,16 @@ class NSWaveSpeedSeedreamV4:
         # Add seed if not 0 (0 means random for this API)
         if seed != 0:
             payload["seed"] = seed
+
+        apply_output_mode(payload, output_mode)
         
         # API endpoint
         endpoint = "/api/v3/bytedance/seedream-v4"
+
+        prompts = split_prompts(batch_prompts)
+        if prompts or batch_count > 1:
+            return self._execute_batch(client, endpoint, payload, prompts or [prompt],
+                                       seed, batch_count, max_in_flight, batch_strategy)
         
         try:
             response = real_client.post(endpoint, payload, timeout=real_client.once_timeout)
@@ -85,7 +118,7 @@ class NSWaveSpeedSeedreamV4:
                 # In sync mode, we get the results directly
                 if "outputs" in response and response["outputs"]:
                     image_urls = response["outputs"]  # Already a list
-                    return (imageurl2tensor(image_urls),)
+                    return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                 else:
                     raise Exception(f"No output received from sync API. Response: {response}")
             else:
@@ -99,7 +132,7 @@ class NSWaveSpeedSeedreamV4:
                     
                     if "outputs" in result and result["outputs"]:
                         image_urls = result["outputs"]  # Already a list
-                        return (imageurl2tensor(image_urls),)
+                        return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                     else:
                         raise Exception("Task completed but no output received")
                         
@@ -111,6 +144,33 @@ class NSWaveSpeedSeedreamV4:
             raise e
 
 
+    def _execute_batch(self, client, endpoint, payload, prompts, seed, batch_count, max_in_flight,
+                       batch_strategy="resize"):
+        """Generate every prompt/seed combination concurrently and return one IMAGE batch."""
+        payloads = []
+        for batch_prompt in prompts:
+            for i in range(batch_count):
+                item = dict(payload, prompt=batch_prompt)
+                # Seed 0 means random; keep it random for every variation. Wrap
+                # within 1..SEED_MAX so seeds near the max stay in range and never hit 0
+                if seed != 0:
+                    item["seed"] = (seed - 1 + i) % SEED_MAX + 1
+                payloads.append(item)
+
+        print(f"Submitting {len(payloads)} tasks ({max_in_flight} in flight)...")
+        try:
+            results = run_batch(client["api_key"], endpoint, payloads, max_in_flight=max_in_flight,
+                                polling_interval=0.5, timeout=300)
+            image_urls = [url for result in results for url in (result.get("outputs") or [])]
+            if not image_urls:
+                raise Exception("Batch completed but no output received")
+            return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
+
+        except Exception as e:
+            print(f"Error in {self.__class__.__name__}: {str(e)}")
+            raise e
+
+
 # Node registration - REQUIRED
 NODE_CLASS_MAPPINGS = {
     "NSWaveSpeedSeedreamV4": NSWaveSpeedSeedreamV4
@@ -1,5 +1,5 @@
 import time
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
 from .wavespeed_api.client import WaveSpeedClient
 
 
@@ -49,6 +49,9 @@ class NSWaveSpeedSeedreamV4Edit:
                     "default": False,
                     "tooltip": "Wait for generation to complete before returning"
                 }),
+            },
+            "optional": {
+                "output_mode": OUTPUT_MODE_INPUT,
             }
         }
 
@@ -57,7 +60,7 @@ class NSWaveSpeedSeedreamV4Edit:
     CATEGORY = "neuralsins/WaveSpeed"
     FUNCTION = "execute"
 
-    def execute(self, client, prompt, image_url, size_preset, seed, enable_sync_mode):
+    def execute(self, client, prompt, image_url, size_preset, seed, enable_sync_mode, output_mode="auto"):
         real_client = WaveSpeedClient(api_key=client["api_key"])
 
         # Find the preset dimensions
@@ -79,6 +82,8 @@ class NSWaveSpeedSeedreamV4Edit:
         if seed != 0:
             payload["seed"] = seed
 
+        apply_output_mode(payload, output_mode)
+
         endpoint = "/api/v3/bytedance/seedream-v4/edit"
         
         try:
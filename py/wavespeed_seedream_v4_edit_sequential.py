@@ -1,5 +1,6 @@
 import time
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
+from ._images import BATCH_STRATEGY_INPUT
 from .wavespeed_api.client import WaveSpeedClient
 
 
@@ -92,6 +93,8 @@ class NSWaveSpeedSeedreamV4EditSequential:
                     "default": "",
                     "tooltip": "Tenth input image URL (connect from Upload Image node)"
                 }),
+                "output_mode": OUTPUT_MODE_INPUT,
+                "batch_strategy": BATCH_STRATEGY_INPUT,
             }
         }
 
@@ -102,7 +105,8 @@ class NSWaveSpeedSeedreamV4EditSequential:
 
     def execute(self, client, prompt, max_images, size_preset, seed, enable_sync_mode,
                 image_1="", image_2="", image_3="", image_4="", image_5="",
-                image_6="", image_7="", image_8="", image_9="", image_10=""):
+                image_6="", image_7="", image_8="", image_9="", image_10="", output_mode="auto",
+                batch_strategy="resize"):
         real_client = WaveSpeedClient(api_key=client["api_key"])
 
         # Collect all provided image URLs
@@ -136,6 +140,8 @@ class NSWaveSpeedSeedreamV4EditSequential:
         if seed != 0:
             payload["seed"] = seed
 
+        apply_output_mode(payload, output_mode)
+
         # API endpoint for edit sequential
         endpoint = "/api/v3/bytedance/seedream-v4/edit-sequential"
 
@@ -146,7 +152,7 @@ class NSWaveSpeedSeedreamV4EditSequential:
                 # In sync mode, we get the results directly
                 if "outputs" in response and response["outputs"]:
                     image_urls = response["outputs"]  # Already a list
-                    return (imageurl2tensor(image_urls),)
+                    return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                 else:
                     raise Exception(f"No output received from sync API. Response: {response}")
             else:
@@ -160,7 +166,7 @@ class NSWaveSpeedSeedreamV4EditSequential:
 
                     if "outputs" in result and result["outputs"]:
                         image_urls = result["outputs"]  # Already a list
-                        return (imageurl2tensor(image_urls),)
+                        return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                     else:
                         raise Exception("Task completed but no output received")
 
@@ -1,5 +1,6 @@
 import time
-from .wavespeed_api.utils import imageurl2tensor
+from .wavespeed_api.utils import OUTPUT_MODE_INPUT, apply_output_mode, imageurl2tensor
+from ._images import BATCH_STRATEGY_INPUT
 from .wavespeed_api.client import WaveSpeedClient
 
 
@@ -50,6 +51,10 @@ class NSWaveSpeedSeedreamV4Sequential:
                     "default": False,
                     "tooltip": "Wait for generation to complete before returning"
                 }),
+            },
+            "optional": {
+                "output_mode": OUTPUT_MODE_INPUT,
+                "batch_strategy": BATCH_STRATEGY_INPUT,
             }
         }
 
@@ -58,7 +63,8 @@ class NSWaveSpeedSeedreamV4Sequential:
     CATEGORY = "neuralsins/WaveSpeed"
     FUNCTION = "execute"
 
-    def execute(self, client, prompt, max_images, size_preset, seed, enable_sync_mode):
+    def execute(self, client, prompt, max_images, size_preset, seed, enable_sync_mode, output_mode="auto",
+                batch_strategy="resize"):
         # Create the actual client object from the client dict
         real_client = WaveSpeedClient(api_key=client["api_key"])
 
@@ -82,6 +88,8 @@ class NSWaveSpeedSeedreamV4Sequential:
         if seed != 0:
             payload["seed"] = seed
 
+        apply_output_mode(payload, output_mode)
+
         # API endpoint for sequential generation
         endpoint = "/api/v3/bytedance/seedream-v4/sequential"
 
@@ -92,7 +100,7 @@ class NSWaveSpeedSeedreamV4Sequential:
                 # In sync mode, we get the results directly
                 if "outputs" in response and response["outputs"]:
                     image_urls = response["outputs"]  # Already a list
-                    return (imageurl2tensor(image_urls),)
+                    return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                 else:
                     raise Exception(f"No output received from sync API. Response: {response}")
             else:
@@ -106,7 +114,7 @@ class NSWaveSpeedSeedreamV4Sequential:
 
                     if "outputs" in result and result["outputs"]:
                         image_urls = result["outputs"]  # Already a list
-                        return (imageurl2tensor(image_urls),)
+                        return (imageurl2tensor(image_urls, batch_strategy=batch_strategy),)
                     else:
                         raise Exception("Task completed but no output received")
 
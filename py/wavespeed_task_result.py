@@ -0,0 +1,61 @@
+from .wavespeed_api.tasks import resolve_task
+
+
+class NSWaveSpeedTaskResult:
+    """
+    WaveSpeed Task Result Node
+
+    Resolves a WAVESPEED_TASK handle from a WaveSpeed video node run with
+    defer_result enabled. The task keeps generating in the background from
+    the moment it is submitted, so other branches of the graph can run in
+    the meantime; this node only blocks if the result isn't ready yet.
+    """
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "task": ("WAVESPEED_TASK", {
+                    "tooltip": "Task handle from a WaveSpeed video node with defer_result enabled"
+                }),
+            }
+        }
+
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("video_url",)
+    CATEGORY = "neuralsins/WaveSpeed"
+    FUNCTION = "execute"
+
+    def execute(self, task):
+        """
+        Wait for a deferred WaveSpeed task and return its first output
+
+        Args:
+            task: WAVESPEED_TASK handle
+
+        Returns:
+            Output URL string
+        """
+        try:
+            result = resolve_task(task)
+
+            if "outputs" in result and result["outputs"]:
+                video_url = result["outputs"][0]
+                print(f"Task {task.get('task_id')} completed. URL: {video_url}")
+                return (video_url,)
+            else:
+                raise Exception("Task completed but no output received")
+
+        except Exception as e:
+            print(f"Error in WaveSpeed Task Result: {str(e)}")
+            raise e
+
+
+# Node registration
+NODE_CLASS_MAPPINGS = {
+    "NSWaveSpeedTaskResult": NSWaveSpeedTaskResult
+}
+
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "NSWaveSpeedTaskResult": "NS WaveSpeed Task Result"
+}
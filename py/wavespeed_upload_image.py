@@ -0,0 +1,77 @@
+# ABOUTME: Uploads IMAGE tensors and returns their URLs for WaveSpeed nodes that only take image URLs
+# ABOUTME: Identical images are uploaded once; see wavespeed_api/uploads.py for backends and the URL cache
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .wavespeed_api.uploads import FORMATS, get_backend, upload_image
+
+# Images of one batch uploaded at once
+MAX_PARALLEL_UPLOADS = 4
+
+
+class NSWaveSpeedUploadImage:
+    """
+    WaveSpeed Upload Image Node
+
+    Encodes an IMAGE (or every image of a batch) as JPEG, PNG or WebP and
+    uploads it, so generated images can be wired straight into edit and
+    video nodes that take image URLs. The upload backend is set in the
+    [Upload] section of config.ini.
+    """
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "client": ("WAVESPEED_AI_API_CLIENT",),
+                "image": ("IMAGE", {
+                    "tooltip": "Image or batch of images to upload"
+                }),
+                "format": (list(FORMATS), {
+                    "default": "jpeg",
+                    "tooltip": "Upload encoding: JPEG and WebP are smaller, PNG is lossless"
+                }),
+                "quality": ("INT", {
+                    "default": 90,
+                    "min": 1,
+                    "max": 100,
+                    "tooltip": "JPEG/WebP quality (ignored for PNG)"
+                }),
+            }
+        }
+
+    RETURN_TYPES = ("STRING", "STRING")
+    RETURN_NAMES = ("image_url", "image_urls")
+    CATEGORY = "neuralsins/WaveSpeed"
+    FUNCTION = "execute"
+
+    def execute(self, client, image, format, quality):
+        """
+        Upload the image batch
+
+        Args:
+            client: WaveSpeed API client
+            image: ComfyUI image tensor [batch, height, width, channels]
+            format: Encoding (jpeg, png or webp)
+            quality: JPEG/WebP quality
+
+        Returns:
+            (URL of the first image, newline-separated URLs of all images)
+        """
+        try:
+            backend = get_backend(client["api_key"])
+            images = list(image)
+            workers = max(1, min(MAX_PARALLEL_UPLOADS, len(images)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wavespeed-upload") as pool:
+                urls = list(pool.map(lambda item: upload_image(backend, item, format, quality), images))
+            return (urls[0], "\n".join(urls))
+
+        except Exception as e:
+            print(f"Error in {self.__class__.__name__}: {str(e)}")
+            raise e
+
+
+# Node registration
+NODE_CLASS_MAPPINGS = {"NSWaveSpeedUploadImage": NSWaveSpeedUploadImage}
+
+NODE_DISPLAY_NAME_MAPPINGS = {"NSWaveSpeedUploadImage": "NS WaveSpeed Upload Image"}
@@ -6,6 +6,7 @@ import subprocess
 import tempfile
 from . import _whisper_models
 from ._bins import FFMPEG
+from ._video_io import materialize
 
 
 class NSWhisperTranscribe:
@@ -112,10 +113,7 @@ class NSWhisperTranscribe:
 
         temp_files = []
         try:
-            # Save video to temp file
-            video_path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
-            temp_files.append(video_path)
-            video.save_to(video_path, format="mp4", codec="h264")
+            video_path = materialize(video, temp_files, "[NSWhisperTranscribe]")
 
             # Extract audio
             wav_path = self._extract_audio(video_path, temp_files)
@@ -0,0 +1,38 @@
+# ABOUTME: Shared pytest fixtures: mounts the repo as a package so the modules' relative imports resolve.
+# ABOUTME: Tests read config from an in-memory parser instead of config.ini, with telemetry off.
+
+import configparser
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "neuralsins_tests"
+
+
+@pytest.fixture
+def ns():
+    """Import a repo module by its dotted path, e.g. ns("py._retry")."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ROOT]
+        sys.modules[PACKAGE] = package
+    return lambda name: importlib.import_module(f"{PACKAGE}.{name}")
+
+
+@pytest.fixture
+def config(ns, monkeypatch):
+    """Empty config for the test; config.set(section, key, value) changes a value."""
+    parser = configparser.ConfigParser()
+    monkeypatch.setattr(ns("py._config"), "_config", parser)
+
+    def set_value(section, key, value):
+        if not parser.has_section(section):
+            parser.add_section(section)
+        parser.set(section, key, str(value))
+
+    set_value("Telemetry", "enabled", "false")
+    return types.SimpleNamespace(set=set_value)
@@ -0,0 +1,58 @@
+# ABOUTME: Tests for load_images batching outputs of different sizes under each batch strategy.
+# ABOUTME: Images are inline base64 PNGs, so nothing is downloaded.
+
+import base64
+import io
+
+import pytest
+import torch
+from PIL import Image
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def _png(width, height, color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+@pytest.fixture
+def images(ns, config):
+    return ns("py._images")
+
+
+def test_images_of_one_size_are_stacked(images):
+    batch = images.load_images([_png(4, 3, RED), _png(4, 3, BLUE)])
+    assert batch.shape == (2, 3, 4, 3)
+    assert torch.allclose(batch[0, 0, 0], torch.tensor([1.0, 0.0, 0.0]))
+    assert torch.allclose(batch[1, 2, 3], torch.tensor([0.0, 0.0, 1.0]))
+
+
+def test_resize_scales_to_the_first_image(images):
+    batch = images.load_images([_png(4, 4, RED), _png(8, 6, BLUE), _png(4, 4, RED)], strategy="resize")
+    assert batch.shape == (3, 4, 4, 3)
+    assert torch.allclose(batch[1], torch.tensor([0.0, 0.0, 1.0]).expand(4, 4, 3), atol=1e-3)
+    assert torch.allclose(batch[2], torch.tensor([1.0, 0.0, 0.0]).expand(4, 4, 3))
+
+
+def test_pad_centers_each_image_on_black_in_the_largest_size(images):
+    batch = images.load_images([_png(4, 2, RED), _png(8, 6, BLUE)], strategy="pad")
+    assert batch.shape == (2, 6, 8, 3)
+    assert torch.allclose(batch[1], torch.tensor([0.0, 0.0, 1.0]).expand(6, 8, 3))
+
+    first = batch[0]
+    assert torch.allclose(first[2:4, 2:6], torch.tensor([1.0, 0.0, 0.0]).expand(2, 4, 3))
+    assert first[:2].abs().sum() == 0 and first[4:].abs().sum() == 0
+    assert first[:, :2].abs().sum() == 0 and first[:, 6:].abs().sum() == 0
+
+
+def test_error_rejects_mismatched_sizes(images):
+    with pytest.raises(Exception, match="doesn't match the batch size 4x4"):
+        images.load_images([_png(4, 4, RED), _png(8, 6, BLUE)], strategy="error")
+
+
+def test_unknown_strategy_is_rejected(images):
+    with pytest.raises(ValueError):
+        images.load_images([_png(4, 4, RED)], strategy="crop")
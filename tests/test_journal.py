@@ -0,0 +1,81 @@
+# ABOUTME: Tests for the WaveSpeed task journal: re-attaching across runs, finishing and compaction.
+# ABOUTME: A "new run" is simulated by dropping the module's in-memory state and reading the file again.
+
+import json
+import time
+
+import pytest
+
+
+@pytest.fixture
+def journal(ns, config, tmp_path, monkeypatch):
+    config.set("WaveSpeed", "journal", tmp_path / "tasks.jsonl")
+    module = ns("py.wavespeed_api.journal")
+    monkeypatch.setattr(module, "_pending", None)
+    monkeypatch.setattr(module, "_claimed", set())
+    monkeypatch.setattr(module, "_lines", 0)
+    return module
+
+
+def _restart(journal, monkeypatch):
+    monkeypatch.setattr(journal, "_pending", None)
+    monkeypatch.setattr(journal, "_claimed", set())
+
+
+def _lines(journal):
+    with open(journal._path(), encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_tasks_from_a_previous_run_are_handed_out_once(journal, monkeypatch):
+    journal.record("hash-a", "task-1", "/api/v3/model", time.time())
+    # Submitted by this process: already owned by the node that submitted it
+    assert journal.find("hash-a") is None
+
+    _restart(journal, monkeypatch)
+    entry = journal.find("hash-a")
+    assert entry["task_id"] == "task-1" and entry["endpoint"] == "/api/v3/model"
+    assert journal.find("hash-a") is None
+    assert journal.find("hash-b") is None
+
+
+def test_finished_tasks_are_never_reattached(journal, monkeypatch):
+    journal.record("hash-a", "task-1", "/api/v3/model", time.time())
+    journal.finish("task-1")
+
+    _restart(journal, monkeypatch)
+    assert journal.find("hash-a") is None
+
+
+def test_tasks_older_than_max_age_are_dropped(journal, config, monkeypatch):
+    config.set("WaveSpeed", "journal_max_age_hours", 1)
+    journal.record("hash-a", "task-1", "/api/v3/model", time.time() - 2 * 3600)
+
+    _restart(journal, monkeypatch)
+    assert journal.find("hash-a") is None
+
+
+def test_torn_lines_are_skipped(journal, monkeypatch):
+    journal.record("hash-a", "task-1", "/api/v3/model", time.time())
+    with open(journal._path(), "a", encoding="utf-8") as f:
+        f.write('{"event": "subm')
+
+    _restart(journal, monkeypatch)
+    assert journal.find("hash-a")["task_id"] == "task-1"
+
+
+def test_journal_is_compacted_to_unfinished_tasks(journal, monkeypatch):
+    monkeypatch.setattr(journal, "COMPACT_AFTER_LINES", 4)
+    now = time.time()
+    for i in range(3):
+        journal.record(f"hash-{i}", f"task-{i}", "/api/v3/model", now)
+    assert len(_lines(journal)) == 3
+
+    journal.finish("task-0")
+    lines = _lines(journal)
+    assert [line["task_id"] for line in lines] == ["task-1", "task-2"]
+    assert all(line["event"] == "submitted" for line in lines)
+
+    _restart(journal, monkeypatch)
+    assert journal.find("hash-1")["task_id"] == "task-1"
+    assert journal.find("hash-0") is None
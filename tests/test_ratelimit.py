@@ -0,0 +1,75 @@
+# ABOUTME: Tests for the client-side token bucket and the limiter's in-flight slot pools.
+# ABOUTME: Time is a fake clock, so nothing here actually sleeps.
+
+import threading
+import types
+
+import pytest
+
+
+@pytest.fixture
+def ratelimit(ns, monkeypatch):
+    module = ns("py._ratelimit")
+    clock = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(module, "time", types.SimpleNamespace(time=lambda: clock[0], sleep=sleep))
+    return types.SimpleNamespace(TokenBucket=module.TokenBucket, clock=clock, sleeps=sleeps)
+
+
+def test_bucket_allows_a_burst_then_refills_at_rate(ratelimit):
+    bucket = ratelimit.TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert ratelimit.sleeps == []
+
+    bucket.acquire()
+    assert ratelimit.sleeps == [pytest.approx(0.5)]
+
+    # An idle period refills up to the burst size, not beyond
+    ratelimit.clock[0] += 60
+    for _ in range(3):
+        bucket.acquire()
+    assert len(ratelimit.sleeps) == 1
+
+
+def test_pause_blocks_until_the_deadline_then_starts_empty(ratelimit):
+    bucket = ratelimit.TokenBucket(rate=1, burst=5)
+    bucket.pause(10)
+
+    bucket.acquire()
+    assert ratelimit.sleeps[0] == pytest.approx(10)
+    assert sum(ratelimit.sleeps) == pytest.approx(11)
+
+    # A shorter pause doesn't cut an earlier, longer one short
+    bucket.pause(30)
+    bucket.pause(5)
+    start = ratelimit.clock[0]
+    bucket.acquire()
+    assert ratelimit.clock[0] - start >= 30
+
+
+def test_polls_do_not_wait_for_slots_held_by_long_submits(ns):
+    limiter = ns("py._ratelimit").RateLimiter(rate=0, burst=1, max_in_flight=1, max_polls_in_flight=1)
+    submit_running = threading.Event()
+    release = threading.Event()
+
+    def long_submit():
+        with limiter.request():
+            submit_running.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=long_submit)
+    thread.start()
+    submit_running.wait(5)
+    try:
+        assert limiter.slots.acquire(blocking=False) is False
+        with limiter.request(poll=True):
+            pass
+    finally:
+        release.set()
+        thread.join()
@@ -0,0 +1,66 @@
+# ABOUTME: Tests for the result cache's keys and for how long URL-only results are reused.
+# ABOUTME: The cache lives in the test's tmp_path.
+
+import os
+import time
+
+import pytest
+
+ENDPOINT = "https://api.test/api/v3/model"
+
+
+@pytest.fixture
+def cache(ns, config, tmp_path):
+    config.set("Cache", "dir", tmp_path)
+    return ns("py._result_cache")
+
+
+def test_requests_without_an_explicit_seed_are_not_cached(cache):
+    assert cache.cache_key(ENDPOINT, {"prompt": "a cat"}) is None
+    assert cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": None}) is None
+    assert cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": -1}) is None
+    assert cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": 0}) is not None
+
+
+def test_key_depends_on_payload_and_endpoint_but_not_transport_keys(cache):
+    key = cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": 7})
+    assert cache.cache_key(ENDPOINT, {"seed": 7, "prompt": "a cat", "enable_sync_mode": True}) == key
+    assert cache.cache_key(ENDPOINT, {"prompt": "a dog", "seed": 7}) != key
+    assert cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": 8}) != key
+    assert cache.cache_key(f"{ENDPOINT}-pro", {"prompt": "a cat", "seed": 7}) != key
+
+
+def test_disabled_cache_has_no_keys(cache, config):
+    config.set("Cache", "enabled", "false")
+    assert cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": 7}) is None
+
+
+def _age(cache, key, hours):
+    path = cache._path("results", f"{key}.json")
+    written = time.time() - hours * 3600
+    os.utime(path, (written, written))
+
+
+def test_url_only_results_expire_with_the_provider_urls(cache):
+    key = cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": 7})
+    result = {"id": "task", "outputs": ["https://cdn.test/video.mp4"]}
+    cache.put_result(key, result)
+    assert cache.get_result(key) == result
+
+    _age(cache, key, cache.DEFAULT_URL_TTL_HOURS + 1)
+    assert cache.get_result(key) is None
+
+
+def test_results_with_downloaded_outputs_keep_the_full_ttl(cache):
+    key = cache.cache_key(ENDPOINT, {"prompt": "a cat", "seed": 7})
+    url = "https://cdn.test/image.png"
+    result = {"id": "task", "outputs": [url]}
+    cache.put_result(key, result)
+    cache.put_blob(url, b"png")
+
+    _age(cache, key, cache.DEFAULT_URL_TTL_HOURS + 1)
+    assert cache.get_result(key) == result
+    assert cache.get_blob(url) == b"png"
+
+    _age(cache, key, cache.DEFAULT_TTL_HOURS + 1)
+    assert cache.get_result(key) is None
@@ -0,0 +1,164 @@
+# ABOUTME: Tests for call_with_retry, the circuit breaker and how the API clients classify failed requests.
+# ABOUTME: Backoff is configured to zero and HTTP sessions are local fakes.
+
+import time
+import types
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+
+@pytest.fixture
+def retry(ns, config):
+    config.set("Retry", "max_retries", 2)
+    config.set("Retry", "backoff", 0)
+    return ns("py._retry")
+
+
+def _failing(*errors, result="ok"):
+    """fn for call_with_retry raising each error in turn, then returning result."""
+    errors = list(errors)
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+    fn.calls = calls
+    return fn
+
+
+def test_retryable_errors_are_retried_until_success(retry):
+    fn = _failing(retry.RetryableError("503", status=503), retry.RetryableError("503", status=503))
+    assert retry.call_with_retry(fn) == "ok"
+    assert len(fn.calls) == 3
+
+
+def test_retries_are_bounded(retry):
+    fn = _failing(*[retry.RetryableError("503", status=503)] * 5)
+    with pytest.raises(retry.RetryableError):
+        retry.call_with_retry(fn)
+    assert len(fn.calls) == 3
+
+
+def test_fatal_errors_are_not_retried(retry):
+    fn = _failing(retry.FatalError("400", status=400))
+    with pytest.raises(retry.FatalError):
+        retry.call_with_retry(fn)
+    assert len(fn.calls) == 1
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(retry, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(retry, "time", types.SimpleNamespace(time=lambda: clock[0], sleep=time.sleep))
+    breaker = retry.CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+    fn = _failing(*[retry.RetryableError("503", status=503)] * 3)
+
+    with pytest.raises(retry.RetryableError):
+        retry.call_with_retry(fn, breaker=breaker)
+    assert breaker.opened_at == 1000.0
+
+    never = _failing()
+    with pytest.raises(retry.CircuitOpenError):
+        retry.call_with_retry(never, breaker=breaker)
+    assert never.calls == []
+
+
+def test_half_open_trial_closes_on_success_and_reopens_on_failure(retry, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(retry, "time", types.SimpleNamespace(time=lambda: clock[0], sleep=time.sleep))
+    breaker = retry.CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock[0] += 31
+    breaker.before_call()
+    # Only one trial at a time
+    with pytest.raises(retry.CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.opened_at == clock[0]
+
+    clock[0] += 31
+    assert retry.call_with_retry(_failing(), breaker=breaker) == "ok"
+    assert breaker.opened_at is None and breaker.failures == 0
+
+
+def test_half_open_trial_is_released_when_the_call_raises_something_else(retry, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(retry, "time", types.SimpleNamespace(time=lambda: clock[0], sleep=time.sleep))
+    breaker = retry.CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 31
+
+    with pytest.raises(KeyboardInterrupt):
+        retry.call_with_retry(_failing(KeyboardInterrupt()), breaker=breaker)
+    # The next caller gets to run the trial instead of waiting on one that never ends
+    assert retry.call_with_retry(_failing(), breaker=breaker) == "ok"
+
+
+def test_429_is_retried_but_not_counted_against_the_breaker(retry):
+    breaker = retry.CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    fn = _failing(retry.RetryableError("429", status=429), retry.RetryableError("429", status=429))
+    assert retry.call_with_retry(fn, breaker=breaker) == "ok"
+    assert breaker.failures == 0 and breaker.opened_at is None
+
+
+def test_unconfirmed_errors_are_not_retried_but_count_against_the_breaker(retry):
+    breaker = retry.CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    fn = _failing(retry.UnconfirmedError("502", status=502))
+    with pytest.raises(retry.UnconfirmedError):
+        retry.call_with_retry(fn, breaker=breaker)
+    assert len(fn.calls) == 1
+    assert breaker.opened_at is not None
+
+
+class FakeSession:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class FakeResponse:
+    """Response whose body is not JSON."""
+
+    reason = text = ""
+    headers = {}
+
+    def __init__(self, status):
+        self.status_code = status
+
+    def json(self):
+        raise ValueError("not JSON")
+
+
+def _refused():
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason=reason))
+
+
+@pytest.mark.parametrize("outcome, retried", [
+    (requests.exceptions.ConnectTimeout(), True),
+    (_refused(), True),
+    (FakeResponse(429), True),
+    (requests.exceptions.ReadTimeout(), False),
+    (requests.exceptions.ConnectionError("Connection reset by peer"), False),
+    (FakeResponse(502), False),
+    (FakeResponse(200), False),
+])
+def test_submits_are_only_retried_when_no_task_can_have_been_created(ns, retry, outcome, retried):
+    client = ns("py.wavespeed_api.client").WaveSpeedClient("key", base_url="http://api.test")
+    client.session = FakeSession(outcome)
+
+    error = retry.RetryableError if retried else retry.UnconfirmedError
+    with pytest.raises(error):
+        client._request("/api/v3/model", {}, timeout=5, idempotent=False)
+    with pytest.raises(retry.RetryableError):
+        client._request("/api/v3/model", {}, timeout=5)
@@ -0,0 +1,32 @@
+# ABOUTME: Tests for telemetry cost estimates and how unpriced requests show up in the summary.
+# ABOUTME: The log is written to the test's tmp_path.
+
+import pytest
+
+
+@pytest.fixture
+def telemetry(ns, config, tmp_path):
+    config.set("Telemetry", "enabled", "true")
+    config.set("Telemetry", "log", tmp_path / "telemetry.jsonl")
+    return ns("py._telemetry")
+
+
+def test_cost_is_estimated_only_for_models_with_a_listed_price(telemetry, monkeypatch):
+    monkeypatch.setattr(telemetry, "_prices", {})
+    telemetry.register_price("/priced", "image", {"1k": 0.14, "4k": 0.24}, by="resolution")
+
+    assert telemetry.cost_fields("/priced", {"resolution": "4k"}, ["a", "b"]) == {"cost": 0.48}
+    assert telemetry.cost_fields("/priced", {"resolution": "8k"}, ["a"]) == {"unpriced": True}
+    assert telemetry.cost_fields("/unlisted", {}, ["a"]) == {"unpriced": True}
+
+
+def test_summary_counts_unpriced_requests(telemetry, monkeypatch):
+    monkeypatch.setattr(telemetry, "_prices", {})
+    telemetry.register_price("/priced", "request", 0.5)
+    for endpoint in ("/priced", "/unlisted", "/unlisted"):
+        telemetry.record("wavespeed", "task", endpoint=endpoint, seconds=1.0,
+                         **telemetry.cost_fields(endpoint, {}, ["out"]))
+
+    rows = {row["endpoint"]: row for row in telemetry.summarize(0)}
+    assert rows["/priced"]["cost"] == 0.5 and rows["/priced"]["unpriced"] == 0
+    assert rows["/unlisted"]["cost"] is None and rows["/unlisted"]["unpriced"] == 2
@@ -0,0 +1,39 @@
+# ABOUTME: Tests for the WaveSpeed image upload cache and its per-content upload locks.
+# ABOUTME: The upload backend is a local fake; nothing is sent over the network.
+
+import threading
+import time
+
+import torch
+
+
+class SlowBackend:
+    identity = "test:backend"
+
+    def __init__(self):
+        self.calls = 0
+
+    def upload(self, data, filename, content_type):
+        self.calls += 1
+        time.sleep(0.05)
+        return f"https://media.test/{filename}"
+
+
+def test_identical_uploads_share_one_request_and_release_the_lock(ns, config, tmp_path, monkeypatch):
+    uploads = ns("py.wavespeed_api.uploads")
+    config.set("Upload", "index", tmp_path / "uploads.json")
+    monkeypatch.setattr(uploads, "_index", None)
+    backend = SlowBackend()
+    image = torch.full((8, 8, 3), 0.5)
+
+    urls = []
+    threads = [threading.Thread(target=lambda: urls.append(uploads.upload_image(backend, image)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.calls == 1
+    assert len(set(urls)) == 1
+    assert uploads._uploading == {}
@@ -0,0 +1,137 @@
+# ABOUTME: Tests for NS Video Concat's per-clip settings pipeline, with FFmpeg and ffprobe mocked out.
+# ABOUTME: ComfyUI's folder_paths and comfy_api are replaced with minimal stand-ins.
+
+import sys
+import types
+
+import pytest
+
+CLIP_INFO = {
+    "formats": {"mov", "mp4"}, "duration": 5.0, "video": "h264", "codec_tag": "avc1",
+    "profile": "High", "level": 31, "extradata_hash": "SHA256:0f1e",
+    "pix_fmt": "yuv420p", "width": 720, "height": 1280, "sar": "1:1",
+    "frame_rate": "30/1", "time_base": "1/15360", "audio": "aac",
+    "sample_rate": "44100", "channels": 2, "channel_layout": "stereo",
+}
+
+
+class VideoFromFile:
+    """Stand-in for ComfyUI's VideoFromFile with the same private trim attributes."""
+
+    def __init__(self, path, start_time=0, duration=0):
+        self.path = path
+        self.__start_time = start_time
+        self.__duration = duration
+        self.saved = []
+
+    def get_stream_source(self):
+        return self.path
+
+    def save_to(self, path, **kwargs):
+        self.saved.append(path)
+        with open(path, "wb"):
+            pass
+
+
+@pytest.fixture
+def concat(ns, tmp_path, monkeypatch):
+    """video_concat module with ComfyUI host modules stubbed and FFmpeg calls recorded."""
+    monkeypatch.setitem(sys.modules, "folder_paths",
+                        types.SimpleNamespace(get_output_directory=lambda: str(tmp_path)))
+    input_impl = types.SimpleNamespace(VideoFromFile=VideoFromFile)
+    latest = types.ModuleType("comfy_api.latest")
+    latest.InputImpl = input_impl
+    monkeypatch.setitem(sys.modules, "comfy_api", types.ModuleType("comfy_api"))
+    monkeypatch.setitem(sys.modules, "comfy_api.latest", latest)
+    module = ns("py.video_concat")
+    graph = ns("py._video_graph")
+    video_io = ns("py._video_io")
+    overlay = ns("py.video_overlay")
+
+    for target in (module, graph, video_io):
+        monkeypatch.setattr(target, "probe", lambda path: dict(CLIP_INFO))
+    monkeypatch.setattr(overlay.NSVideoOverlay, "_get_video_info", lambda self, path: (30.0, 720, 1280, 5.0))
+    monkeypatch.setattr(overlay.NSVideoOverlay, "_get_overlay_dimensions", lambda self, path, is_video: (100, 100))
+
+    commands = []
+
+    def run(cmd, **kwargs):
+        commands.append(cmd)
+        with open(cmd[-1], "wb"):
+            pass
+        return types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(module.subprocess, "run", run)
+    monkeypatch.setattr(graph.subprocess, "run", run)
+    module.commands = commands
+    return module
+
+
+def _clip(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"")
+    return VideoFromFile(str(path))
+
+
+def test_execute_applies_clip_settings_to_every_clip(concat, tmp_path):
+    overlay_path = tmp_path / "logo.png"
+    overlay_path.write_bytes(b"")
+    overlay_settings = {
+        "overlay_path": str(overlay_path), "overlay_type": "image", "position": "Center",
+        "x": 0, "y": 0, "scale": 1.0, "opacity": 1.0, "blend_mode": "normal",
+    }
+
+    (result,) = concat.NSVideoConcatMulti().execute(
+        2,
+        video_1=_clip(tmp_path, "a.mp4"),
+        video_2=_clip(tmp_path, "b.mp4"),
+        overlay_settings=overlay_settings,
+    )
+
+    renders = [cmd for cmd in concat.commands if "-filter_complex" in cmd]
+    assert len(renders) == 2
+    assert all(str(overlay_path) in cmd for cmd in renders)
+    sources = {cmd[cmd.index("-i") + 1] for cmd in renders}
+    assert sources == {str(tmp_path / "a.mp4"), str(tmp_path / "b.mp4")}
+
+    # The overlaid clips still match each other, so they are joined with -c copy
+    final = concat.commands[-1]
+    assert final[final.index("-f") + 1] == "concat"
+    assert final[-1] == result.path
+
+
+@pytest.mark.parametrize("key, value", [("level", 40), ("extradata_hash", "SHA256:a2b3"), ("codec_tag", "avc3")])
+def test_clips_with_different_parameter_sets_are_not_stream_copied(concat, tmp_path, monkeypatch, key, value):
+    first, second = str(tmp_path / "a.mp4"), str(tmp_path / "b.mp4")
+    infos = {first: dict(CLIP_INFO), second: dict(CLIP_INFO, **{key: value})}
+    monkeypatch.setattr(concat, "probe", infos.get)
+
+    node = concat.NSVideoConcatMulti()
+    assert node._can_stream_copy([first, first])
+    assert not node._can_stream_copy([first, second])
+
+
+def test_clips_without_extradata_hash_are_not_stream_copied(concat, tmp_path, monkeypatch):
+    path = str(tmp_path / "a.mp4")
+    monkeypatch.setattr(concat, "probe", lambda p: dict(CLIP_INFO, extradata_hash=None))
+
+    assert not concat.NSVideoConcatMulti()._can_stream_copy([path, path])
+
+
+def test_only_untrimmed_video_from_file_is_used_in_place(concat, ns, tmp_path):
+    video_io = ns("py._video_io")
+    path = tmp_path / "a.mp4"
+    path.write_bytes(b"")
+
+    class Subclass(VideoFromFile):
+        pass
+
+    assert video_io._source_path(VideoFromFile(str(path))) == str(path)
+    assert video_io._source_path(VideoFromFile(str(path), start_time=1.5)) is None
+    assert video_io._source_path(Subclass(str(path))) is None
+    assert video_io._source_path(types.SimpleNamespace(get_stream_source=lambda: str(path))) is None
+
+    trimmed = VideoFromFile(str(path), duration=2.0)
+    temp_files = []
+    result = video_io.materialize(trimmed, temp_files)
+    assert trimmed.saved == [result] and result in temp_files
@@ -0,0 +1,88 @@
+# ABOUTME: Tests for compiling a LazyVideo edit chain into FFmpeg arguments.
+# ABOUTME: ffprobe is mocked; nothing is encoded.
+
+import pytest
+
+
+@pytest.fixture
+def graph(ns, config, monkeypatch):
+    module = ns("py._video_graph")
+    monkeypatch.setattr(module, "probe", lambda path: {"audio": "aac"})
+    return module
+
+
+def _overlay(graph, path="logo.png"):
+    return graph.EditStep(
+        "overlaid", inputs=[["-loop", "1", "-i", path]], shortest=True,
+        video=lambda labels: f"{labels.video}{labels.input(0)}overlay=0:0{labels.out_video}",
+    )
+
+
+def _music(graph, path="music.mp3"):
+    return graph.EditStep(
+        "music", inputs=[["-i", path]],
+        audio=lambda labels: f"{labels.audio}{labels.input(0, 'a')}amix=inputs=2{labels.out_audio}",
+    )
+
+
+def _filter(args):
+    return args[args.index("-filter_complex") + 1]
+
+
+def test_video_only_chain_encodes_video_and_copies_audio(graph):
+    video = graph.LazyVideo("in.mp4").then(_overlay(graph))
+    args, output = video._compile()
+
+    assert args == ["-i", "in.mp4", "-loop", "1", "-i", "logo.png",
+                    "-filter_complex", "[0:v][1:v]overlay=0:0[v0]"]
+    assert output == ["-map", "[v0]", "-c:v", "libx264", "-preset", graph.X264_PRESET,
+                      "-crf", str(graph.X264_CRF), "-pix_fmt", "yuv420p",
+                      "-map", "0:a", "-c:a", "copy", "-shortest"]
+
+
+def test_video_only_chain_without_source_audio_maps_no_audio(graph, monkeypatch):
+    monkeypatch.setattr(graph, "probe", lambda path: {"audio": None})
+    args, output = graph.LazyVideo("in.mp4").then(_overlay(graph))._compile()
+    assert "0:a" not in output and "-c:a" not in output
+
+
+def test_audio_only_chain_copies_video_and_encodes_audio(graph):
+    args, output = graph.LazyVideo("in.mp4").then(_music(graph))._compile()
+
+    assert args == ["-i", "in.mp4", "-i", "music.mp3",
+                    "-filter_complex", "[0:a][1:a]amix=inputs=2[a0]"]
+    assert output == ["-map", "0:v", "-c:v", "copy", "-map", "[a0]", "-c:a", "aac"]
+
+
+def test_mixed_chain_numbers_inputs_and_pads_in_step_order(graph):
+    video = (graph.LazyVideo("in.mp4")
+             .then(_overlay(graph, "a.png"))
+             .then(_music(graph))
+             .then(_overlay(graph, "b.png")))
+    args, output = video._compile()
+
+    assert args[:8] == ["-i", "in.mp4", "-loop", "1", "-i", "a.png", "-i", "music.mp3"]
+    assert args[8:12] == ["-loop", "1", "-i", "b.png"]
+    assert _filter(args).split(";") == [
+        "[0:v][1:v]overlay=0:0[v0]",
+        "[0:a][2:a]amix=inputs=2[a1]",
+        "[v0][3:v]overlay=0:0[v2]",
+    ]
+    assert output[:2] == ["-map", "[v2]"]
+    assert output[-5:] == ["-map", "[a1]", "-c:a", "aac", "-shortest"]
+
+
+def test_audio_only_compile_skips_video_steps_and_their_inputs(graph):
+    video = graph.LazyVideo("in.mp4").then(_overlay(graph)).then(_music(graph))
+    args, output = video._compile(audio_only=True)
+
+    assert args == ["-i", "in.mp4", "-i", "music.mp3",
+                    "-filter_complex", "[0:a][1:a]amix=inputs=2[a1]"]
+    assert output == ["-map", "[a1]"]
+
+
+def test_then_leaves_the_original_chain_unchanged(graph):
+    base = graph.LazyVideo("in.mp4")
+    extended = base.then(_music(graph))
+    assert base.steps == () and len(extended.steps) == 1
+    assert base.then(None) is base